@@ -3,30 +3,70 @@
 
 """High-level interface for SciCat."""
 
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING
 
 try:
     __version__ = importlib.metadata.version(__package__ or __name__)
 except importlib.metadata.PackageNotFoundError:
     __version__ = "0.0.0"
 
-from ._profile import Profile, ScientificMetadataSchema
-from .client import Client
-from .datablock import OrigDatablock
-from .dataset import Dataset
-from .error import (
-    FileNotAccessibleError,
-    FileUploadError,
-    IntegrityError,
-    ScicatCommError,
-    ScicatLoginError,
-)
-from .file import File
-from .filesystem import RemotePath
-from .model import Attachment, Sample
-from .pid import PID
-from .thumbnail import Thumbnail
-from .warning import VisibleDeprecationWarning
+_LAZY_ATTRIBUTES = {
+    "PID": ".pid",
+    "Attachment": ".model",
+    "Client": ".client",
+    "Dataset": ".dataset",
+    "File": ".file",
+    "FileNotAccessibleError": ".error",
+    "FileUploadError": ".error",
+    "IntegrityError": ".error",
+    "OrigDatablock": ".datablock",
+    "Profile": "._profile",
+    "RemotePath": ".filesystem",
+    "Sample": ".model",
+    "ScicatCommError": ".error",
+    "ScicatLoginError": ".error",
+    "ScientificMetadataSchema": "._profile",
+    "Thumbnail": ".thumbnail",
+    "VisibleDeprecationWarning": ".warning",
+}
+
+
+def __getattr__(name: str) -> object:
+    # Import submodules on first access because importing all of them,
+    # in particular the client and models, takes a long time.
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
+if TYPE_CHECKING:
+    from ._profile import Profile, ScientificMetadataSchema
+    from .client import Client
+    from .datablock import OrigDatablock
+    from .dataset import Dataset
+    from .error import (
+        FileNotAccessibleError,
+        FileUploadError,
+        IntegrityError,
+        ScicatCommError,
+        ScicatLoginError,
+    )
+    from .file import File
+    from .filesystem import RemotePath
+    from .model import Attachment, Sample
+    from .pid import PID
+    from .thumbnail import Thumbnail
+    from .warning import VisibleDeprecationWarning
 
 __all__ = (
     "PID",
@@ -16,6 +16,7 @@ from typing import (
 
 import pydantic
 
+from . import instrumentation
 from ._internal.orcid import parse_orcid_id
 from .filesystem import RemotePath
 from .logging import get_logger
@@ -140,19 +141,21 @@ def construct(
     :
         An initialized model.
     """
-    try:
-        return model(**fields)
-    except pydantic.ValidationError as e:
-        if _strict_validation:
-            raise
-        if not _quiet:
-            get_logger().warning(
-                "Validation of metadata failed: %s\n"
-                "The returned object may be incomplete or broken. "
-                "In particular, some fields may not have the correct type",
-                str(e),
-            )
-        return model.model_construct(**fields)
+    with instrumentation.span("scitacean.model.construct", model=model.__name__) as s:
+        try:
+            return model(**fields)
+        except pydantic.ValidationError as e:
+            if _strict_validation:
+                raise
+            s.set_attribute("validation_failed", value=True)
+            if not _quiet:
+                get_logger().warning(
+                    "Validation of metadata failed: %s\n"
+                    "The returned object may be incomplete or broken. "
+                    "In particular, some fields may not have the correct type",
+                    str(e),
+                )
+            return model.model_construct(**fields)
 
 
 def validate_datetime(value: str | datetime | None) -> datetime | None:
@@ -11,7 +11,8 @@ from datetime import UTC, datetime
 from typing import Any, ClassVar, TypeVar
 
 from .datablock import OrigDatablock
-from .filesystem import RemotePath
+from .file import File
+from .filesystem import RemotePath, is_chunked_checksum_algorithm
 from .model import (
     Attachment,
     BaseModel,
@@ -23,7 +24,7 @@ from .model import (
     Technique,
     construct,
 )
-from .ontology import find_technique
+from .ontology import find_techniques
 from .pid import PID
 
 M = TypeVar("M", bound=BaseModel)
@@ -52,7 +53,9 @@ def _parse_remote_path(path: str | RemotePath | None) -> RemotePath | None:
 def _parse_techniques(arg: Iterable[str | Technique] | None) -> list[Technique] | None:
     if arg is None:
         return None
-    return [t if isinstance(t, Technique) else find_technique(t) for t in arg]
+    techniques = list(arg)
+    found = iter(find_techniques(t for t in techniques if not isinstance(t, Technique)))
+    return [t if isinstance(t, Technique) else next(found) for t in techniques]
 
 
 def _validate_checksum_algorithm(algorithm: str | None) -> str | None:
@@ -60,7 +63,9 @@ def _validate_checksum_algorithm(algorithm: str | None) -> str | None:
         return algorithm
     import hashlib
 
-    if algorithm not in hashlib.algorithms_available:
+    if algorithm not in hashlib.algorithms_available and not (
+        is_chunked_checksum_algorithm(algorithm)
+    ):
         raise ValueError(f"Checksum algorithm not recognized: {algorithm}")
     return algorithm
 
@@ -408,6 +413,7 @@ class DatasetBase:
         "_default_checksum_algorithm",
         "_description",
         "_end_time",
+        "_files_cache",
         "_input_datasets",
         "_instrument_group",
         "_instrument_ids",
@@ -538,6 +544,9 @@ class DatasetBase:
             checksum_algorithm
         )
         self._orig_datablocks: list[OrigDatablock] = []
+        self._files_cache: (
+            tuple[tuple[tuple[OrigDatablock, int], ...], tuple[File, ...]] | None
+        ) = None
         self._attachments: list[Attachment] | None = []
 
     @property
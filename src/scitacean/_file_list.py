@@ -0,0 +1,465 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Storage backends for the files of orig datablocks.
+
+There are two backends:
+
+- :class:`LazyFileList` stores files or download models and converts the latter
+  to files on demand. This is the default.
+- :class:`FileTable` stores file metadata in a compact, columnar format.
+  It is meant for datasets with a very large number of files.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar
+
+from .file import File
+from .filesystem import RemotePath
+from .model import DownloadDataFile, UploadDataFile
+
+
+class FileStorage(ABC):
+    """Base class for file storage backends.
+
+    Provides an index from POSIX remote paths to positions in the storage.
+    The index is built on first use and kept up to date when files are added.
+    """
+
+    __slots__ = ("_index",)
+
+    keeps_files: ClassVar[bool]
+    """Whether files are kept in the storage once they have been constructed.
+
+    If ``False``, files are constructed on every access and callers should not
+    hold on to all of them as that would defeat the compact storage.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] | None = None
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[File]:
+        for i in range(len(self)):
+            yield self._file_at(i)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileStorage):
+            return False
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other, strict=True)
+        )
+
+    @abstractmethod
+    def remote_paths(self) -> Iterator[str]:
+        """Iterate over the POSIX remote paths of all files without materializing."""
+
+    def index_of(self, remote_path: str) -> int | None:
+        """Return the position of the file with the given POSIX remote path."""
+        return self._path_index().get(remote_path)
+
+    def get(self, remote_path: str) -> File | None:
+        """Return the file with the given POSIX remote path if it exists."""
+        if (index := self.index_of(remote_path)) is None:
+            return None
+        return self._file_at(index)
+
+    def select(self, predicate: Callable[[str], bool]) -> list[File]:
+        """Return all files whose POSIX remote path matches a predicate.
+
+        Only the selected files get materialized.
+        """
+        return [
+            self._file_at(i)
+            for i, path in enumerate(self.remote_paths())
+            if predicate(path)
+        ]
+
+    @abstractmethod
+    def local_files(self) -> list[File]:
+        """Return all files that exist on the local filesystem."""
+
+    @abstractmethod
+    def _file_at(self, index: int) -> File: ...
+
+    def _path_index(self) -> dict[str, int]:
+        if self._index is None:
+            self._index = {}
+            self._update_index(0)
+        return self._index
+
+    def _update_index(self, start: int) -> None:
+        # Add files starting at `start` to the index, if it exists.
+        # If there are duplicate paths, the index refers to the first file.
+        if self._index is None:
+            return
+        paths = itertools.islice(self.remote_paths(), start, None)
+        for i, path in enumerate(paths, start):
+            self._index.setdefault(path, i)
+
+    def _copy_index_to(self, other: FileStorage) -> None:
+        other._index = None if self._index is None else self._index.copy()
+
+
+class LazyFileList(FileStorage):
+    """List of files that are constructed from download models on demand.
+
+    Datablocks downloaded from SciCat can contain a very large number of files.
+    Constructing a :class:`scitacean.File` for each of them is expensive
+    and often not needed.
+    So this list stores the raw :class:`scitacean.model.DownloadDataFile`
+    models and only converts them when a file is accessed.
+    Converted files replace their model in the list.
+
+    Aggregates like the number of files, the total size, and the remote paths
+    are computed from the models directly without constructing files.
+    """
+
+    __slots__ = ("_checksum_algorithm", "_entries")
+
+    keeps_files = True
+
+    def __init__(self, files: Iterable[File] = ()) -> None:
+        super().__init__()
+        self._entries: list[File | DownloadDataFile] = list(files)
+        self._checksum_algorithm: str | None = None
+
+    @classmethod
+    def from_download_models(
+        cls, models: Iterable[DownloadDataFile], *, checksum_algorithm: str | None
+    ) -> LazyFileList:
+        """Return a new list that converts the given models on demand."""
+        lst = cls()
+        lst._entries.extend(models)
+        lst._checksum_algorithm = checksum_algorithm
+        return lst
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def extend(self, files: Iterable[File]) -> None:
+        """Append files to the end of the list."""
+        start = len(self)
+        self._entries.extend(files)
+        self._update_index(start)
+
+    def replaced(self, replacements: dict[str, File]) -> LazyFileList:
+        """Return a copy with files replaced by files with the same remote path.
+
+        Replacements that do not match any file are ignored.
+        Files that are not replaced are not materialized.
+        """
+        new = LazyFileList()
+        new._entries = self._entries.copy()
+        new._checksum_algorithm = self._checksum_algorithm
+        self._copy_index_to(new)
+        for path, file in replacements.items():
+            if (index := self.index_of(path)) is not None:
+                new._entries[index] = file
+        return new
+
+    def remote_paths(self) -> Iterator[str]:
+        """Iterate over the POSIX remote paths of all files without materializing."""
+        for entry in self._entries:
+            if isinstance(entry, File):
+                yield entry.remote_path.posix
+            else:
+                # Same as FileTable, which stores missing paths as empty strings.
+                yield entry.path or ""
+
+    def size(self) -> int:
+        """Return the total size of all files in bytes."""
+        return sum(
+            entry.size if isinstance(entry, File) else (entry.size or 0)
+            for entry in self._entries
+        )
+
+    def local_files(self) -> list[File]:
+        """Return all files that exist on the local filesystem.
+
+        Download models never refer to local files and are not materialized.
+        """
+        return [
+            entry
+            for entry in self._entries
+            if isinstance(entry, File) and entry.is_on_local
+        ]
+
+    def upload_models(self) -> list[UploadDataFile]:
+        """Return upload models for all files."""
+        return [file.make_model(for_archive=False) for file in self]
+
+    def _file_at(self, index: int) -> File:
+        entry = self._entries[index]
+        if isinstance(entry, File):
+            return entry
+        file = File.from_download_model(
+            entry, checksum_algorithm=self._checksum_algorithm
+        )
+        self._entries[index] = file
+        return file
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+# Marks missing sizes and times in the integer columns.
+_MISSING = -(2**63)
+
+
+class FileTable(FileStorage):
+    """Columnar storage of file metadata.
+
+    Instead of a :class:`scitacean.File` per file, the table stores
+
+    - all remote paths in a single string with an array of offsets,
+    - sizes and creation times (as nanoseconds since the epoch in UTC)
+      in 64-bit integer arrays,
+    - user IDs, group IDs, and permissions as indices into a table
+      of unique values,
+    - checksums in a single string with an array of offsets.
+
+    This uses a small fraction of the memory required by individual files.
+    :class:`scitacean.File` objects are constructed on demand when accessing
+    the table with ``table[index]`` or when iterating over it.
+
+    Files that cannot be represented by the columns, e.g., because they exist on the
+    local filesystem, are stored as separate file objects in addition to their
+    remote metadata.
+
+    Note that creation times are returned in UTC regardless of the time zone
+    of the input.
+    """
+
+    __slots__ = (
+        "_checksum_algorithm",
+        "_checksum_offsets",
+        "_checksums",
+        "_gids",
+        "_has_checksum",
+        "_overrides",
+        "_path_offsets",
+        "_paths",
+        "_perms",
+        "_sizes",
+        "_string_ids",
+        "_strings",
+        "_times",
+        "_uids",
+    )
+
+    keeps_files = False
+
+    def __init__(self, *, checksum_algorithm: str | None = None) -> None:
+        super().__init__()
+        self._checksum_algorithm = checksum_algorithm
+        self._paths = ""
+        self._path_offsets = array("q", [0])
+        self._checksums = ""
+        self._checksum_offsets = array("q", [0])
+        self._has_checksum = bytearray()
+        self._sizes = array("q")
+        self._times = array("q")
+        self._uids = array("i")
+        self._gids = array("i")
+        self._perms = array("i")
+        self._strings: list[str | None] = [None]
+        self._string_ids: dict[str | None, int] = {None: 0}
+        self._overrides: dict[int, File] = {}
+
+    @classmethod
+    def from_download_models(
+        cls, models: Iterable[DownloadDataFile], *, checksum_algorithm: str | None
+    ) -> FileTable:
+        """Build a new table from SciCat download models."""
+        table = cls(checksum_algorithm=checksum_algorithm)
+        paths = []
+        checksums: list[str] = []
+        for model in models:
+            paths.append(model.path or "")
+            table._path_offsets.append(table._path_offsets[-1] + len(paths[-1]))
+            table._append_checksum(model.chk, checksums)
+            table._sizes.append(_MISSING if model.size is None else model.size)
+            table._times.append(_to_ns(model.time))
+            table._uids.append(table._intern(model.uid))
+            table._gids.append(table._intern(model.gid))
+            table._perms.append(table._intern(model.perm))
+        table._paths = "".join(paths)
+        table._checksums = "".join(checksums)
+        return table
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __getitem__(self, index: int) -> File:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FileTable index out of range")
+        return self._file_at(index)
+
+    def _file_at(self, index: int) -> File:
+        if (file := self._overrides.get(index)) is not None:
+            return file
+        size = self._sizes[index]
+        time = self._times[index]
+        return File(
+            local_path=None,
+            remote_path=RemotePath._from_posix(self._path(index)),
+            remote_uid=self._strings[self._uids[index]],
+            remote_gid=self._strings[self._gids[index]],
+            remote_perm=self._strings[self._perms[index]],
+            checksum_algorithm=self._checksum_algorithm,
+            _remote_size=None if size == _MISSING else size,
+            _remote_creation_time=_from_ns(time),
+            _remote_checksum=self._checksum(index),
+        )
+
+    def __repr__(self) -> str:
+        return f"FileTable(<{len(self)} files>)"
+
+    def extend(self, files: Iterable[File]) -> None:
+        """Append files to the end of the table.
+
+        Files that exist locally are stored in full in addition to their row.
+        """
+        start = len(self)
+        paths = [self._paths]
+        checksums = [self._checksums]
+        for file in files:
+            index = len(self)
+            paths.append(file.remote_path.posix)
+            self._path_offsets.append(self._path_offsets[-1] + len(paths[-1]))
+            self._append_checksum(file._remote_checksum, checksums)
+            self._sizes.append(
+                _MISSING if file._remote_size is None else file._remote_size
+            )
+            self._times.append(_to_ns(file._remote_creation_time))
+            self._uids.append(self._intern(file.remote_uid))
+            self._gids.append(self._intern(file.remote_gid))
+            self._perms.append(self._intern(file.remote_perm))
+            if not self._can_represent(file):
+                self._overrides[index] = file
+        self._paths = "".join(paths)
+        self._checksums = "".join(checksums)
+        self._update_index(start)
+
+    def replaced(self, replacements: dict[str, File]) -> FileTable:
+        """Return a copy with files replaced by files with the same remote path.
+
+        Replacements that do not match any file are ignored.
+        Replaced files are stored in full in addition to their row.
+        """
+        new = FileTable(checksum_algorithm=self._checksum_algorithm)
+        # Columns are modified in place by `extend`, so they must be copied.
+        for name in FileTable.__slots__:
+            setattr(new, name, copy.copy(getattr(self, name)))
+        self._copy_index_to(new)
+        for path, file in replacements.items():
+            if (index := self.index_of(path)) is not None:
+                new._overrides[index] = file
+        return new
+
+    def remote_paths(self) -> Iterator[str]:
+        """Iterate over the POSIX remote paths of all files without materializing."""
+        return map(self._path, range(len(self)))
+
+    def size(self) -> int:
+        """Return the total size of all files in bytes.
+
+        Sizes of files that are not stored in full are summed without
+        constructing file objects.
+        """
+        # Missing sizes count as 0.
+        total = sum(self._sizes) - self._sizes.count(_MISSING) * _MISSING
+        for index, file in self._overrides.items():
+            stored = self._sizes[index]
+            total += file.size - (0 if stored == _MISSING else stored)
+        return total
+
+    def local_files(self) -> list[File]:
+        """Return all files that exist on the local filesystem."""
+        # Local files are always stored in full.
+        return [file for file in self._overrides.values() if file.is_on_local]
+
+    def upload_models(self) -> list[UploadDataFile]:
+        """Return upload models for all files.
+
+        Only files that are stored in full or that lack a size or creation time
+        are converted through file objects.
+        The latter fail validation in the same way as in :class:`LazyFileList`.
+        """
+        models = []
+        for i in range(len(self)):
+            size = self._sizes[i]
+            time = _from_ns(self._times[i])
+            if i in self._overrides or size == _MISSING or time is None:
+                models.append(self._file_at(i).make_model(for_archive=False))
+            else:
+                models.append(
+                    UploadDataFile(
+                        path=self._path(i),
+                        size=size,
+                        time=time,
+                        chk=self._checksum(i),
+                        gid=self._strings[self._gids[i]],
+                        perm=self._strings[self._perms[i]],
+                        uid=self._strings[self._uids[i]],
+                    )
+                )
+        return models
+
+    def _path(self, index: int) -> str:
+        return self._paths[self._path_offsets[index] : self._path_offsets[index + 1]]
+
+    def _checksum(self, index: int) -> str | None:
+        if not self._has_checksum[index]:
+            return None
+        return self._checksums[
+            self._checksum_offsets[index] : self._checksum_offsets[index + 1]
+        ]
+
+    def _append_checksum(self, checksum: str | None, buffer: list[str]) -> None:
+        buffer.append(checksum or "")
+        self._checksum_offsets.append(self._checksum_offsets[-1] + len(buffer[-1]))
+        self._has_checksum.append(checksum is not None)
+
+    def _can_represent(self, file: File) -> bool:
+        # Whether the file can be reconstructed from the columns alone.
+        time = file._remote_creation_time
+        return (
+            not file.is_on_local
+            and file.checksum_algorithm == self._checksum_algorithm
+            and (time is None or time.tzinfo is not None)
+        )
+
+    def _intern(self, value: str | None) -> int:
+        try:
+            return self._string_ids[value]
+        except KeyError:
+            self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+            return self._string_ids[value]
+
+
+def _to_ns(time: datetime | None) -> int:
+    if time is None:
+        return _MISSING
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=UTC)
+    return (time - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _from_ns(ns: int) -> datetime | None:
+    if ns == _MISSING:
+        return None
+    return _EPOCH + timedelta(microseconds=ns // 1000)
@@ -0,0 +1,14 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Register Hypothesis strategies for Scitacean types.
+
+Hypothesis calls :func:`_hypothesis_setup_hook` through the ``hypothesis``
+entry point when it is imported.
+"""
+
+
+def _hypothesis_setup_hook() -> None:
+    from . import filesystem, pid
+
+    filesystem._register_hypothesis_strategy()
+    pid._register_hypothesis_strategy()
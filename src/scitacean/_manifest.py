@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Manifests of local mirrors of datasets.
+
+A manifest records the remote state of every file in a local mirror at the
+time the file was last synchronized.
+This allows :meth:`scitacean.Client.sync_dataset` to detect new and changed
+files by comparing metadata instead of reading the local files.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .file import File
+from .logging import get_logger
+
+MANIFEST_NAME = ".scitacean-manifest.json"
+_MANIFEST_VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """Remote state of a single file in a local mirror."""
+
+    local_path: str
+    """Path of the local file relative to the root of the mirror."""
+    size: int | None
+    checksum: str | None
+    checksum_algorithm: str | None
+    creation_time: str | None
+    """Remote creation time in ISO 8601 format."""
+
+    @classmethod
+    def for_file(cls, file: File) -> ManifestEntry:
+        """Construct an entry from the remote metadata of a file."""
+        creation_time = file._remote_creation_time
+        return cls(
+            local_path=file.remote_path.to_local().as_posix(),
+            size=file._remote_size,
+            checksum=file._remote_checksum,
+            checksum_algorithm=file.checksum_algorithm,
+            creation_time=None if creation_time is None else creation_time.isoformat(),
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class Manifest:
+    """Remote state of all files in a local mirror of a dataset."""
+
+    dataset_id: str | None
+    files: dict[str, ManifestEntry] = dataclasses.field(default_factory=dict)
+    """Entries indexed by the POSIX remote path of the file."""
+
+    @classmethod
+    def load(cls, root: Path, dataset_id: str | None) -> Manifest:
+        """Load the manifest in ``root`` or return an empty one if there is none.
+
+        Raises
+        ------
+        ValueError
+            If the manifest belongs to a different dataset.
+        """
+        path = root / MANIFEST_NAME
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return cls(dataset_id=dataset_id)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            get_logger().warning(
+                "Ignoring malformed manifest at %s, all files will be checked", path
+            )
+            return cls(dataset_id=dataset_id)
+
+        if content.get("version") != _MANIFEST_VERSION:
+            get_logger().warning(
+                "Ignoring manifest with unsupported version at %s, "
+                "all files will be checked",
+                path,
+            )
+            return cls(dataset_id=dataset_id)
+        if content.get("dataset_id") != dataset_id:
+            raise ValueError(
+                f"The directory {root} is a mirror of dataset "
+                f"{content.get('dataset_id')}, refusing to use it for "
+                f"dataset {dataset_id}."
+            )
+        return cls(
+            dataset_id=dataset_id,
+            files={
+                remote_path: ManifestEntry(**entry)
+                for remote_path, entry in content["files"].items()
+            },
+        )
+
+    def save(self, root: Path) -> None:
+        """Write the manifest to ``root``.
+
+        The file is replaced atomically such that an interrupted write
+        never leaves a broken manifest behind.
+        """
+        content: dict[str, Any] = {
+            "version": _MANIFEST_VERSION,
+            "dataset_id": self.dataset_id,
+            "files": {
+                remote_path: dataclasses.asdict(entry)
+                for remote_path, entry in self.files.items()
+            },
+        }
+        fd, tmp = tempfile.mkstemp(dir=root, prefix=MANIFEST_NAME, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(content, f)
+            os.replace(tmp, root / MANIFEST_NAME)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
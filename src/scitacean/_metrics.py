@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Metrics of calls to the SciCat API."""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import threading
+from collections import deque
+
+# Latency percentiles are computed from this many of the most recent calls
+# to bound memory usage in long-running processes.
+_LATENCY_WINDOW = 1024
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class EndpointMetrics:
+    """Metrics of all calls for one operation of :class:`ScicatClient`."""
+
+    operation: str
+    """Name of the operation, e.g., ``"get_dataset_model"``."""
+    count: int
+    """Number of calls."""
+    error_count: int
+    """Number of calls that failed with an error response or an exception."""
+    latency_sum: float
+    """Sum of the latencies of all calls in seconds."""
+    latency_max: float
+    """Maximum latency of all calls in seconds."""
+    latency_p50: float
+    """Median latency in seconds."""
+    latency_p90: float
+    """90th percentile of the latency in seconds."""
+    latency_p99: float
+    """99th percentile of the latency in seconds."""
+    request_bytes: int
+    """Total size of all request bodies in bytes."""
+    response_bytes: int
+    """Total size of all response bodies in bytes."""
+
+    @property
+    def latency_mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.latency_sum / self.count if self.count else 0.0
+
+
+class _OperationRecord:
+    __slots__ = (
+        "count",
+        "error_count",
+        "latencies",
+        "latency_max",
+        "latency_sum",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.error_count = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.latencies: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def snapshot(self, operation: str) -> EndpointMetrics:
+        latencies = sorted(self.latencies)
+        return EndpointMetrics(
+            operation=operation,
+            count=self.count,
+            error_count=self.error_count,
+            latency_sum=self.latency_sum,
+            latency_max=self.latency_max,
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p90=_percentile(latencies, 0.9),
+            latency_p99=_percentile(latencies, 0.99),
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+        )
+
+
+class MetricsRecorder:
+    """Thread-safe accumulator of per-operation metrics."""
+
+    __slots__ = ("_lock", "_records")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[str, _OperationRecord] = {}
+
+    def record(
+        self,
+        operation: str,
+        *,
+        latency: float,
+        failed: bool,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """Record a single call."""
+        with self._lock:
+            if (rec := self._records.get(operation)) is None:
+                rec = self._records[operation] = _OperationRecord()
+            rec.count += 1
+            rec.error_count += failed
+            rec.latency_sum += latency
+            rec.latency_max = max(rec.latency_max, latency)
+            rec.latencies.append(latency)
+            rec.request_bytes += request_bytes
+            rec.response_bytes += response_bytes
+
+    def snapshot(self) -> dict[str, EndpointMetrics]:
+        """Return the current metrics of all operations."""
+        with self._lock:
+            return {
+                operation: rec.snapshot(operation)
+                for operation, rec in sorted(self._records.items())
+            }
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._records.clear()
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # Nearest-rank method, this always returns an observed value.
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(math.ceil(q * len(sorted_values)) - 1, 0)]
+
+
+def format_prometheus(metrics: dict[str, EndpointMetrics]) -> str:
+    """Format metrics in the Prometheus text exposition format."""
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP scitacean_scicat_{name} {help_text}")
+        lines.append(f"# TYPE scitacean_scicat_{name} {kind}")
+
+    def sample(name: str, labels: dict[str, str], value: float) -> None:
+        label_str = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+        lines.append(f"scitacean_scicat_{name}{{{label_str}}} {value!r}")
+
+    family(
+        "request_duration_seconds",
+        "summary",
+        "Latency of SciCat API calls by operation.",
+    )
+    for op, m in metrics.items():
+        for quantile, value in (
+            ("0.5", m.latency_p50),
+            ("0.9", m.latency_p90),
+            ("0.99", m.latency_p99),
+        ):
+            sample(
+                "request_duration_seconds",
+                {"operation": op, "quantile": quantile},
+                value,
+            )
+        sample("request_duration_seconds_sum", {"operation": op}, m.latency_sum)
+        sample("request_duration_seconds_count", {"operation": op}, m.count)
+
+    for name, help_text, attr in (
+        ("requests_total", "Number of SciCat API calls.", "count"),
+        ("request_errors_total", "Number of failed SciCat API calls.", "error_count"),
+        ("request_bytes_total", "Bytes sent in request bodies.", "request_bytes"),
+        (
+            "response_bytes_total",
+            "Bytes received in response bodies.",
+            "response_bytes",
+        ),
+    ):
+        family(name, "counter", help_text)
+        for op, m in metrics.items():
+            sample(name, {"operation": op}, getattr(m, attr))
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
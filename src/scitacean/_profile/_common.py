@@ -1,12 +1,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2026 SciCat Project (https://github.com/SciCatProject/scitacean)
 
+from __future__ import annotations
+
 from collections.abc import Callable
 from dataclasses import dataclass, field, replace
 from functools import cache
-from typing import Any, Literal, TypeAlias
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
-from ..typing import FileTransfer
+if TYPE_CHECKING:
+    from ..typing import FileTransfer
 
 ScientificMetadataSchema: TypeAlias = Literal["plain", "value-unit"]
 
@@ -7,24 +7,30 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import json
+import os
 import re
+import threading
+import time
 from collections import Counter
 from collections.abc import Callable, Iterable, Iterator
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, Self
 from urllib.parse import quote_plus
 
 import httpx
 import pydantic
 
-from . import model
+from . import instrumentation, model
+from ._manifest import Manifest, ManifestEntry
+from ._metrics import EndpointMetrics, MetricsRecorder, format_prometheus
 from ._profile import Profile, gather_login_params
 from .dataset import Dataset
 from .error import ScicatCommError, ScicatLoginError
 from .file import File
-from .filesystem import RemotePath
-from .logging import get_logger
+from .filesystem import RemotePath, _modification_time
+from .logging import _FileBatchLog, get_logger
 from .pid import PID
 from .typing import DownloadConnection, FileTransfer, UploadConnection
 from .util.credentials import ExpiringToken, SecretStr, StrStorage
@@ -193,6 +199,8 @@ class Client:
         pid: str | PID,
         strict_validation: bool = False,
         attachments: bool = False,
+        *,
+        compact_files: bool = False,
     ) -> Dataset:
         """Download a dataset from SciCat.
 
@@ -211,20 +219,25 @@ class Client:
         attachments:
             Select whether to download attachments.
             If this is ``False``, the attachments of the returned dataset are ``None``.
+        compact_files:
+            If ``True``, store the metadata of files in a compact, columnar table.
+            This is recommended for datasets with a very large number of files.
 
         Returns
         -------
         :
             A new dataset.
         """
-        dataset = self.scicat.get_dataset_model(
-            PID.parse(pid),
-            strict_validation=strict_validation,
-            datablocks=True,
-            attachments=attachments,
-        )
-
-        return Dataset.from_download_model(dataset_model=dataset)
+        with instrumentation.span("scitacean.Client.get_dataset"):
+            dataset = self.scicat.get_dataset_model(
+                PID.parse(pid),
+                strict_validation=strict_validation,
+                datablocks=True,
+                attachments=attachments,
+            )
+            return Dataset.from_download_model(
+                dataset_model=dataset, compact_files=compact_files
+            )
 
     def get_proposal(
         self,
@@ -312,13 +325,39 @@ class Client:
             and some files or a partial dataset are left on the servers.
             Note the error message if that happens.
         """
-        dataset = dataset.replace(source_folder=self._source_folder_for(dataset))
-        files_to_upload = _files_to_upload(dataset, self.file_transfer)
+        with instrumentation.span("scitacean.Client.upload_new_dataset_now"):
+            return self._upload_new_dataset_now(dataset)
+
+    def _upload_new_dataset_now(self, dataset: Dataset) -> Dataset:
+        source_folder = self._source_folder_for(dataset)
+        dataset = dataset.replace(source_folder=source_folder)
+        # Take the snapshot on copies of the files such that the caller's files
+        # keep querying the filesystem.
+        files_to_upload = [
+            file._with_new_stat_snapshot()
+            for file in _files_to_upload(dataset, self.file_transfer)
+        ]
+        dataset = dataset.replace_files(*files_to_upload)
+        # Query the metadata of all local files once instead of for every use.
+        with instrumentation.span(
+            "scitacean.Client.refresh_local_files", n_files=len(files_to_upload)
+        ):
+            dataset.refresh()
         self.scicat.validate_dataset_model(dataset.make_upload_model())
         with self._connect_for_file_upload(dataset, files_to_upload) as con:
             # TODO check if any remote file is out of date.
             #  if so, raise an error. We never overwrite remote files!
-            uploaded_files = con.upload_files(*files_to_upload)
+            with (
+                instrumentation.span(
+                    "scitacean.transfer.upload_files", n_files=len(files_to_upload)
+                ),
+                _FileBatchLog(
+                    "Uploaded %d files to %s",
+                    len(files_to_upload),
+                    source_folder.posix,
+                ),
+            ):
+                uploaded_files = con.upload_files(*files_to_upload)
             dataset = dataset.replace_files(*uploaded_files)
             try:
                 finalized_model = self.scicat.create_dataset_model(
@@ -413,9 +452,14 @@ class Client:
         if not files_to_upload:
             yield _NullUploadConnection()
         else:
-            with self._expect_file_transfer().connect_for_upload(
-                dataset, files_to_upload[0].remote_path
-            ) as con:
+            file_transfer = self._expect_file_transfer()
+            with ExitStack() as stack:
+                with _connect_span(file_transfer, "upload"):
+                    con = stack.enter_context(
+                        file_transfer.connect_for_upload(
+                            dataset, files_to_upload[0].remote_path
+                        )
+                    )
                 yield con
 
     def _source_folder_for(self, dataset: Dataset) -> RemotePath:
@@ -444,6 +488,7 @@ class Client:
         select: FileSelector = True,
         checksum_algorithm: str | None = None,
         force: bool = False,
+        verify: Literal["size", "mtime", "checksum"] = "checksum",
     ) -> Dataset:
         r"""Download files of a dataset.
 
@@ -479,6 +524,20 @@ class Client:
             If ``True``, download files regardless of whether they already exist
             locally.
             This bypasses the checksum computation of pre-existing local files.
+        verify:
+            How to decide whether a pre-existing local file is up to date and
+            does not need to be downloaded:
+
+            - ``"size"``: The local file has the same size as the remote file.
+            - ``"mtime"``: The sizes match and the local file was last modified
+              after the remote file was created.
+              If the local file is older, fall back to ``"checksum"``.
+            - ``"checksum"``: The checksums of the local and remote files match.
+              This requires reading the entire local file.
+
+            ``"size"`` and ``"mtime"`` are much faster for large files but
+            cannot detect files that were modified without changing their size.
+            Ignored if ``force=True``.
 
         Returns
         -------
@@ -529,7 +588,7 @@ class Client:
         _expect_no_duplicate_filenames(f.local_path for f in downloaded_files)
         if not force:
             to_download = _remove_up_to_date_local_files(
-                downloaded_files, checksum_algorithm=checksum_algorithm
+                downloaded_files, checksum_algorithm=checksum_algorithm, verify=verify
             )
         else:
             to_download = downloaded_files
@@ -537,30 +596,277 @@ class Client:
         if not to_download:
             return dataset.replace_files(*downloaded_files)
 
-        with self._connect_for_file_download(
-            dataset, to_download[0].remote_path
-        ) as con:
-            con.download_files(
-                remote=[
-                    p
-                    for f in to_download
-                    if (p := f.remote_access_path(dataset.source_folder)) is not None
-                ],
-                local=[f.local_path for f in to_download],  # type: ignore[misc]
-            )
-        for f in to_download:
-            f.validate_after_download()
+        # Files are downloaded one at a time and validated on a thread pool
+        # such that validation overlaps with the download of later files.
+        with (
+            instrumentation.span(
+                "scitacean.Client.download_files", n_files=len(to_download)
+            ),
+            _FileBatchLog("Downloaded %d files to %s", len(to_download), target),
+            ThreadPoolExecutor() as pool,
+            self._connect_for_file_download(dataset, to_download[0].remote_path) as con,
+        ):
+            validations = []
+            for f in to_download:
+                if (remote := f.remote_access_path(dataset.source_folder)) is None:
+                    continue
+                with instrumentation.span("scitacean.transfer.download_files"):
+                    con.download_files(remote=[remote], local=[f.local_path])  # type: ignore[list-item]
+                validations.append(pool.submit(f.validate_after_download))
+            # Raise the error of the first invalid file, if any.
+            for validation in validations:
+                validation.result()
         return dataset.replace_files(*downloaded_files)
 
     @contextmanager
     def _connect_for_file_download(
         self, dataset: Dataset, representative_file_path: RemotePath
     ) -> Iterator[DownloadConnection]:
-        with self._expect_file_transfer().connect_for_download(
-            dataset, representative_file_path
-        ) as con:
+        file_transfer = self._expect_file_transfer()
+        with ExitStack() as stack:
+            with _connect_span(file_transfer, "download"):
+                con = stack.enter_context(
+                    file_transfer.connect_for_download(
+                        dataset, representative_file_path
+                    )
+                )
             yield con
 
+    def download_files_for(
+        self,
+        datasets: Iterable[Dataset],
+        *,
+        target: str | Path | Callable[[Dataset], str | Path],
+        select: FileSelector = True,
+        checksum_algorithm: str | None = None,
+        force: bool = False,
+        verify: Literal["size", "mtime", "checksum"] = "checksum",
+        max_workers: int | None = None,
+    ) -> list[Dataset]:
+        """Download files of multiple datasets.
+
+        This is equivalent to calling :meth:`Client.download_files` for each
+        dataset but schedules the files of all datasets together:
+
+        - Files are downloaded concurrently by up to ``max_workers`` threads.
+        - Connections are pooled by the datasets' ``source_folder_host``
+          and ``source_folder``.
+          Datasets that share both also share connections instead of
+          connecting once per dataset.
+        - Large files are downloaded first such that small files fill in
+          the gaps at the end instead of a single large file running alone.
+          Files are ordered by size only, not by host, such that all
+          workers stay busy when datasets are stored on different hosts.
+
+        Parameters
+        ----------
+        datasets:
+            Download files of these datasets.
+        target:
+            Where to store the files on the local filesystem.
+            If a path, the files of each dataset are stored in a subdirectory
+            named after the dataset's PID (without prefix).
+            If a callable, it is called with each dataset and must return
+            the directory for that dataset.
+        select:
+            Select which files to download, applies to all datasets.
+            See :meth:`Client.download_files`.
+        checksum_algorithm:
+            Select an algorithm for computing file checksums.
+            See :meth:`Client.download_files`.
+        force:
+            If ``True``, download files regardless of whether they already exist
+            locally.
+        verify:
+            How to decide whether a pre-existing local file is up to date.
+            See :meth:`Client.download_files`.
+        max_workers:
+            Maximum number of concurrent downloads and thus of open connections.
+            Defaults to the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+
+        Returns
+        -------
+        :
+            Copies of the input datasets in the same order
+            with files replaced to reflect the downloads.
+        """
+        datasets = list(datasets)
+
+        def target_for(dset: Dataset) -> Path:
+            if callable(target):
+                return Path(target(dset))
+            return Path(target) / _dataset_directory_name(dset)
+
+        downloaded_files = []
+        tasks: list[tuple[Dataset, File]] = []
+        for dataset in datasets:
+            if dataset.source_folder is None:
+                raise ValueError(
+                    f"Dataset {dataset.pid} has no source folder, "
+                    "cannot download files."
+                )
+            dataset_target = target_for(dataset)
+            dataset_target.mkdir(parents=True, exist_ok=True)
+            files = [
+                f.downloaded(local_path=dataset_target / f.remote_path.to_local())
+                for f in _select_files(select, dataset)
+            ]
+            _expect_no_duplicate_filenames(f.local_path for f in files)
+            downloaded_files.append(files)
+            if not force:
+                files = _remove_up_to_date_local_files(
+                    files, checksum_algorithm=checksum_algorithm, verify=verify
+                )
+            tasks.extend((dataset, f) for f in files)
+
+        if tasks:
+            # Sorting is stable, so files of the same size stay in dataset order.
+            tasks.sort(key=lambda task: -(task[1]._remote_size or 0))
+            pool = _DownloadConnectionPool(self._expect_file_transfer())
+            with (
+                _FileBatchLog(
+                    "Downloaded %d files of %d datasets", len(tasks), len(datasets)
+                ),
+                pool,
+                ThreadPoolExecutor(max_workers=max_workers) as executor,
+            ):
+                results = [
+                    executor.submit(pool.download, dataset, file)
+                    for dataset, file in tasks
+                ]
+                # Raise the error of the first failed file, if any.
+                for result in results:
+                    result.result()
+
+        return [
+            dataset.replace_files(*files)
+            for dataset, files in zip(datasets, downloaded_files, strict=True)
+        ]
+
+    def sync_dataset(
+        self,
+        dataset: Dataset,
+        *,
+        local_root: str | Path,
+        prune: bool = False,
+        checksum_algorithm: str | None = None,
+        verify: Literal["size", "mtime", "checksum"] = "checksum",
+    ) -> SyncResult:
+        """Incrementally mirror the files of a dataset into a local directory.
+
+        The directory contains a manifest file (``.scitacean-manifest.json``)
+        which records the remote size, checksum, and creation time of every
+        file at the time it was last synchronized.
+        Only files that are new or whose remote metadata differs from the manifest
+        are downloaded.
+        Tracked files are otherwise only checked for existence and size
+        on the local filesystem, their checksums are not computed.
+
+        Files that are not in the manifest but already exist locally, e.g.,
+        because they were downloaded with :meth:`Client.download_files`,
+        are checked according to ``verify`` and only downloaded if they are
+        out of date.
+
+        The manifest is only updated after all downloads have succeeded.
+        If the synchronization fails, the next call redownloads all files
+        that changed since the last successful synchronization.
+
+        Parameters
+        ----------
+        dataset:
+            Mirror the files of this dataset.
+        local_root:
+            Files are stored in this directory on the local filesystem.
+            The directory must not be shared with other datasets.
+        prune:
+            If ``True``, delete local files that are tracked in the manifest
+            but no longer part of the dataset.
+            Local files that are not tracked in the manifest are never deleted.
+        checksum_algorithm:
+            Select an algorithm for computing file checksums.
+            See :meth:`Client.download_files`.
+        verify:
+            How to check untracked local files.
+            See :meth:`Client.download_files`.
+
+        Returns
+        -------
+        :
+            The result of the synchronization.
+            Its ``dataset`` has the ``local_path`` of all files set.
+
+        Raises
+        ------
+        ValueError
+            If ``local_root`` contains a mirror of a different dataset.
+        """
+        if dataset.source_folder is None:
+            raise ValueError("Dataset has no source folder, cannot download files.")
+        local_root = Path(local_root)
+        local_root.mkdir(parents=True, exist_ok=True)
+        manifest = Manifest.load(
+            local_root, None if dataset.pid is None else str(dataset.pid)
+        )
+
+        files = [
+            f.downloaded(local_path=local_root / f.remote_path.to_local())
+            for f in dataset.files
+        ]
+        _expect_no_duplicate_filenames(f.local_path for f in files)
+        entries = {f.remote_path.posix: ManifestEntry.for_file(f) for f in files}
+
+        untracked = [f for f in files if f.remote_path.posix not in manifest.files]
+        to_download = [
+            f
+            for f in files
+            if (recorded := manifest.files.get(f.remote_path.posix)) is not None
+            and not _local_file_matches(
+                f.local_path,  # type: ignore[arg-type]
+                recorded=recorded,
+                current=entries[f.remote_path.posix],
+            )
+        ]
+        to_download.extend(
+            _remove_up_to_date_local_files(
+                untracked, checksum_algorithm=checksum_algorithm, verify=verify
+            )
+        )
+
+        if to_download:
+            self.download_files(
+                dataset,
+                target=local_root,
+                select=[f.remote_path.posix for f in to_download],
+                checksum_algorithm=checksum_algorithm,
+                force=True,
+            )
+        dataset = dataset.replace_files(*files)
+
+        removed = [
+            RemotePath(remote_path)
+            for remote_path in manifest.files
+            if remote_path not in entries
+        ]
+        if prune:
+            # Remote paths are flattened, so a file that moved between
+            # remote directories can keep its local path.
+            in_use = {entry.local_path for entry in entries.values()}
+            for remote_path in removed:
+                entry = manifest.files.pop(remote_path.posix)
+                if entry.local_path not in in_use:
+                    (local_root / entry.local_path).unlink(missing_ok=True)
+        manifest.files.update(entries)
+        manifest.save(local_root)
+
+        downloaded = {f.remote_path for f in to_download}
+        return SyncResult(
+            dataset=dataset,
+            downloaded=[f.remote_path for f in to_download],
+            unchanged=[f.remote_path for f in files if f.remote_path not in downloaded],
+            removed=removed if prune else [],
+            stale=[] if prune else removed,
+        )
+
     @property
     def profile(self) -> Profile:
         """Return the SciCat profile used by this client."""
@@ -575,6 +881,8 @@ class ScicatClient:
         url: str,
         token: str | StrStorage | None,
         timeout: datetime.timedelta | None,
+        *,
+        transport: httpx.BaseTransport | None = None,
     ):
         self._base_url = _normalize_api_url(url)
         self._timeout = datetime.timedelta(seconds=10) if timeout is None else timeout
@@ -583,6 +891,8 @@ class ScicatClient:
             if isinstance(token, str)
             else token
         )
+        self._transport = transport
+        self._metrics = MetricsRecorder()
 
     @classmethod
     def from_token(
@@ -590,6 +900,8 @@ class ScicatClient:
         url: str,
         token: str | StrStorage,
         timeout: datetime.timedelta | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
     ) -> ScicatClient:
         """Create a new low-level client and authenticate with a token.
 
@@ -601,13 +913,17 @@ class ScicatClient:
             User token to authenticate with SciCat.
         timeout:
             Timeout for all API requests.
+        transport:
+            Send requests through this transport instead of the network.
+            Mainly useful for testing, see
+            :class:`scitacean.testing.emulator.ScicatEmulator`.
 
         Returns
         -------
         :
             A new low-level client.
         """
-        return ScicatClient(url=url, token=token, timeout=timeout)
+        return ScicatClient(url=url, token=token, timeout=timeout, transport=transport)
 
     @classmethod
     def from_credentials(
@@ -616,6 +932,8 @@ class ScicatClient:
         username: str | StrStorage,
         password: str | StrStorage,
         timeout: datetime.timedelta | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
     ) -> ScicatClient:
         """Create a new low-level client and authenticate with username and password.
 
@@ -630,6 +948,10 @@ class ScicatClient:
             Password of the user.
         timeout:
             Timeout for all API requests.
+        transport:
+            Send requests through this transport instead of the network.
+            Mainly useful for testing, see
+            :class:`scitacean.testing.emulator.ScicatEmulator`.
 
         Returns
         -------
@@ -648,14 +970,20 @@ class ScicatClient:
                     username=username,
                     password=password,
                     timeout=timeout or datetime.timedelta(seconds=10),
+                    transport=transport,
                 )
             ),
             timeout=timeout,
+            transport=transport,
         )
 
     @classmethod
     def without_login(
-        cls, url: str, timeout: datetime.timedelta | None = None
+        cls,
+        url: str,
+        timeout: datetime.timedelta | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
     ) -> ScicatClient:
         """Create a new low-level client without authentication.
 
@@ -668,13 +996,17 @@ class ScicatClient:
             It should include the suffix `api/vn` where `n` is a number.
         timeout:
             Timeout for all API requests.
+        transport:
+            Send requests through this transport instead of the network.
+            Mainly useful for testing, see
+            :class:`scitacean.testing.emulator.ScicatEmulator`.
 
         Returns
         -------
         :
             A new low-level client.
         """
-        return ScicatClient(url=url, token=None, timeout=timeout)
+        return ScicatClient(url=url, token=None, timeout=timeout, transport=transport)
 
     def get_dataset_model(
         self,
@@ -1208,6 +1540,39 @@ class ScicatClient:
         """Return True if this client is authenticated with SciCat."""
         return self._token is not None
 
+    def metrics(self) -> dict[str, EndpointMetrics]:
+        """Return metrics of all API calls made by this client.
+
+        Metrics are recorded separately for each ``operation`` passed to
+        :meth:`call_endpoint`.
+        Latency percentiles are computed from the most recent 1024 calls
+        of each operation, all other metrics include every call.
+
+        Returns
+        -------
+        :
+            A snapshot of the metrics, keyed by operation.
+            The snapshot is not updated by later calls.
+        """
+        return self._metrics.snapshot()
+
+    def prometheus_metrics(self) -> str:
+        """Return metrics of all API calls in the Prometheus text format.
+
+        See :meth:`metrics` for the recorded values.
+
+        Returns
+        -------
+        :
+            The metrics formatted according to the
+            `Prometheus exposition format <https://prometheus.io/docs/instrumenting/exposition_formats/>`_.
+        """
+        return format_prometheus(self.metrics())
+
+    def reset_metrics(self) -> None:
+        """Discard all metrics recorded so far."""
+        self._metrics.reset()
+
     def _send_to_scicat(
         self,
         *,
@@ -1230,7 +1595,8 @@ class ScicatClient:
             serialized_data = None
 
         try:
-            return httpx.request(
+            return _send_request(
+                self._transport,
                 method=cmd,
                 url=url,
                 content=serialized_data,
@@ -1305,7 +1671,33 @@ class ScicatClient:
         logger = get_logger()
         logger.info("Calling SciCat API at %s for operation '%s'", full_url, operation)
 
-        response = self._send_to_scicat(cmd=cmd, url=full_url, data=data, params=params)
+        start = time.perf_counter()
+        try:
+            with instrumentation.span(
+                "scitacean.ScicatClient.call_endpoint",
+                operation=operation,
+                method=cmd.upper(),
+            ) as span:
+                response = self._send_to_scicat(
+                    cmd=cmd, url=full_url, data=data, params=params
+                )
+                span.set_attribute("status_code", response.status_code)
+        except Exception:
+            self._metrics.record(
+                operation,
+                latency=time.perf_counter() - start,
+                failed=True,
+                request_bytes=0,
+                response_bytes=0,
+            )
+            raise
+        self._metrics.record(
+            operation,
+            latency=time.perf_counter() - start,
+            failed=not response.is_success,
+            request_bytes=len(response.request.content),
+            response_bytes=len(response.content),
+        )
         if not response.is_success:
             logger.error(
                 "SciCat API call to %s failed: %s %s: %s",
@@ -1362,14 +1754,40 @@ def _normalize_api_url(url: str) -> str:
     return url
 
 
+def _send_request(
+    transport: httpx.BaseTransport | None, **kwargs: Any
+) -> httpx.Response:
+    if transport is None:
+        return httpx.request(**kwargs)
+    # Use a short-lived client like httpx.request does to not leak connections.
+    with httpx.Client(transport=transport) as client:
+        return client.request(**kwargs)
+
+
+def _post_credentials(
+    url: str,
+    username: StrStorage,
+    password: StrStorage,
+    timeout: datetime.timedelta,
+    transport: httpx.BaseTransport | None,
+) -> httpx.Response:
+    json = {"username": username.get_str(), "password": password.get_str()}
+    if transport is None:
+        return httpx.post(url, json=json, timeout=timeout.seconds)
+    with httpx.Client(transport=transport) as client:
+        return client.post(url, json=json, timeout=timeout.seconds)
+
+
 def _log_in_via_users_login(
-    url: str, username: StrStorage, password: StrStorage, timeout: datetime.timedelta
+    url: str,
+    username: StrStorage,
+    password: StrStorage,
+    timeout: datetime.timedelta,
+    transport: httpx.BaseTransport | None,
 ) -> httpx.Response:
     # Currently only used for functional accounts.
-    response = httpx.post(
-        _url_concat(url, "auth/login"),
-        json={"username": username.get_str(), "password": password.get_str()},
-        timeout=timeout.seconds,
+    response = _post_credentials(
+        _url_concat(url, "auth/login"), username, password, timeout, transport
     )
     if not response.is_success:
         get_logger().info(
@@ -1379,17 +1797,19 @@ def _log_in_via_users_login(
 
 
 def _log_in_via_auth_msad(
-    url: str, username: StrStorage, password: StrStorage, timeout: datetime.timedelta
+    url: str,
+    username: StrStorage,
+    password: StrStorage,
+    timeout: datetime.timedelta,
+    transport: httpx.BaseTransport | None,
 ) -> httpx.Response:
     # Used for user accounts.
     import re
 
     # Strip the api/vn suffix
     base_url = re.sub(r"/api/v\d+/?", "", url)
-    response = httpx.post(
-        _url_concat(base_url, "auth/msad"),
-        json={"username": username.get_str(), "password": password.get_str()},
-        timeout=timeout.seconds,
+    response = _post_credentials(
+        _url_concat(base_url, "auth/msad"), username, password, timeout, transport
     )
     if not response.is_success:
         get_logger().error("Failed to log in via auth/msad: %s", response.text)
@@ -1397,7 +1817,11 @@ def _log_in_via_auth_msad(
 
 
 def _get_token(
-    url: str, username: StrStorage, password: StrStorage, timeout: datetime.timedelta
+    url: str,
+    username: StrStorage,
+    password: StrStorage,
+    timeout: datetime.timedelta,
+    transport: httpx.BaseTransport | None = None,
 ) -> str:
     """Log in using the provided username + password.
 
@@ -1409,13 +1833,21 @@ def _get_token(
     get_logger().info("Logging in to %s", url)
 
     response = _log_in_via_users_login(
-        url=url, username=username, password=password, timeout=timeout
+        url=url,
+        username=username,
+        password=password,
+        timeout=timeout,
+        transport=transport,
     )
     if response.is_success:
         return str(response.json()["id"])  # not sure if semantically correct
 
     response = _log_in_via_auth_msad(
-        url=url, username=username, password=password, timeout=timeout
+        url=url,
+        username=username,
+        password=password,
+        timeout=timeout,
+        transport=transport,
     )
     if response.is_success:
         return str(response.json()["access_token"])
@@ -1424,6 +1856,24 @@ def _get_token(
     raise ScicatLoginError(response.content)
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class SyncResult:
+    """Result of :meth:`Client.sync_dataset`."""
+
+    dataset: Dataset
+    """The dataset with the ``local_path`` of all files set."""
+    downloaded: list[RemotePath]
+    """Remote paths of files that were downloaded."""
+    unchanged: list[RemotePath]
+    """Remote paths of files that were already up to date."""
+    removed: list[RemotePath]
+    """Remote paths of files that were deleted locally because they
+    are no longer part of the dataset."""
+    stale: list[RemotePath]
+    """Remote paths of files that are no longer part of the dataset but were
+    kept locally because ``prune=False``."""
+
+
 FileSelector = (
     bool | str | list[str] | tuple[str] | re.Pattern[str] | Callable[[File], bool]
 )
@@ -1434,35 +1884,76 @@ def _file_selector(select: FileSelector) -> Callable[[File], bool]:
         return lambda _: True
     if select is False:
         return lambda _: False
+    if (path_selector := _path_selector(select)) is not None:
+        return lambda f: path_selector(f.remote_path.posix)
+    return select  # type: ignore[return-value]
+
+
+def _path_selector(select: FileSelector) -> Callable[[str], bool] | None:
+    # Return a selector that operates on POSIX remote paths or None
+    # if `select` requires a complete file.
     if isinstance(select, str):
-        return lambda f: f.remote_path == select
+        return lambda path: path == select
     if isinstance(select, (list, tuple)):
-        return lambda f: f.remote_path in select
+        selected = frozenset(select)
+        return lambda path: path in selected
     if isinstance(select, re.Pattern):
-        return lambda f: select.search(f.remote_path.posix) is not None
-    return select
+        return lambda path: select.search(path) is not None
+    return None
 
 
 def _select_files(select: FileSelector, dataset: Dataset) -> list[File]:
+    if select is False:
+        return []
+    if (path_selector := _path_selector(select)) is not None:
+        # Avoids constructing files that are not selected.
+        return dataset._select_files(path_selector)
     selector = _file_selector(select)
     return [f for f in dataset.files if selector(f)]
 
 
 def _remove_up_to_date_local_files(
-    files: list[File], checksum_algorithm: str | None
+    files: list[File],
+    checksum_algorithm: str | None,
+    verify: Literal["size", "mtime", "checksum"] = "checksum",
 ) -> list[File]:
-    def is_up_to_date(file: File) -> bool:
+    if verify not in ("size", "mtime", "checksum"):
+        raise ValueError(
+            f"Invalid value for verify: {verify!r}, "
+            "expected 'size', 'mtime', or 'checksum'."
+        )
+
+    def checksum_is_up_to_date(file: File) -> bool:
         if checksum_algorithm is not None:
+            if file.is_on_remote and file.checksum_algorithm is not None:
+                # Compute the checksum with the file's own algorithm in the same
+                # pass over the file. The cache is shared with the replaced file.
+                file._local_checksum(
+                    checksum_algorithm, also=(file.checksum_algorithm,)
+                )
             file = dataclasses.replace(file, checksum_algorithm=checksum_algorithm)
         return file.local_is_up_to_date()
 
-    return [
-        file
-        for file in files
-        if not (
-            file.local_path.exists() and is_up_to_date(file)  # type: ignore[union-attr]
-        )
-    ]
+    def is_up_to_date(file: File) -> bool:
+        try:
+            stat = os.stat(file.local_path)  # type: ignore[arg-type]
+        except FileNotFoundError:
+            return False
+        if verify == "checksum" or file._remote_size is None:
+            return checksum_is_up_to_date(file)
+        # Check cheap properties first and only compute the checksum if needed.
+        if stat.st_size != file._remote_size:
+            return False
+        if verify == "size":
+            return True
+        remote_time = file._remote_creation_time
+        if remote_time is not None and remote_time.tzinfo is None:
+            remote_time = remote_time.replace(tzinfo=datetime.UTC)
+        if remote_time is not None and _modification_time(stat) >= remote_time:
+            return True
+        return checksum_is_up_to_date(file)
+
+    return [file for file in files if not is_up_to_date(file)]
 
 
 def _files_to_upload(
@@ -1519,6 +2010,99 @@ class _NullUploadConnection:
             raise RuntimeError("Internal error: Bad upload connection")
 
 
+def _dataset_directory_name(dataset: Dataset) -> str:
+    if dataset.pid is None:
+        raise ValueError(
+            "Cannot determine a download directory for a dataset without PID. "
+            "Pass a callable as `target` to choose the directory."
+        )
+    return dataset.pid.pid
+
+
+class _DownloadConnectionPool:
+    """Download connections shared by multiple threads.
+
+    Connections are opened on demand and grouped by the source folder host
+    and source folder of datasets.
+    A connection is only reused for datasets with the same host and folder
+    because file transfers check accessibility and, in the case of
+    :class:`scitacean.transfer.select.SelectFileTransfer`, choose a backend
+    based on those.
+    Each connection is used by only one thread at a time.
+    Use as a context manager, all connections are closed on exit.
+    """
+
+    def __init__(self, file_transfer: FileTransfer) -> None:
+        self._file_transfer = file_transfer
+        self._idle: dict[tuple[str | None, str], list[DownloadConnection]] = {}
+        self._exit_stack = ExitStack()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._exit_stack.close()
+
+    def download(self, dataset: Dataset, file: File) -> None:
+        remote = file.remote_access_path(dataset.source_folder)  # type: ignore[arg-type]
+        if remote is None:
+            return
+        key = (dataset.source_folder_host, dataset.source_folder.posix)  # type: ignore[union-attr]
+        con = self._acquire(key, dataset, file.remote_path)
+        with instrumentation.span("scitacean.transfer.download_files"):
+            con.download_files(remote=[remote], local=[file.local_path])  # type: ignore[list-item]
+        # Only return the connection to the pool if the download succeeded,
+        # it might be broken otherwise.
+        with self._lock:
+            self._idle[key].append(con)
+        file.validate_after_download()
+
+    def _acquire(
+        self,
+        key: tuple[str | None, str],
+        dataset: Dataset,
+        representative_file_path: RemotePath,
+    ) -> DownloadConnection:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if idle:
+                return idle.pop()
+        # Connect outside the lock to allow opening multiple connections at once.
+        manager = self._file_transfer.connect_for_download(
+            dataset, representative_file_path
+        )
+        with _connect_span(self._file_transfer, "download"):
+            con = manager.__enter__()
+        with self._lock:
+            self._exit_stack.push(manager)
+        return con
+
+
+def _connect_span(
+    file_transfer: FileTransfer, direction: Literal["upload", "download"]
+) -> instrumentation.Span:
+    return instrumentation.span(
+        "scitacean.transfer.connect",
+        direction=direction,
+        file_transfer=type(file_transfer).__name__,
+    )
+
+
+def _local_file_matches(
+    local_path: Path, *, recorded: ManifestEntry, current: ManifestEntry
+) -> bool:
+    # A tracked file is up to date if its remote metadata did not change since
+    # the last sync and the local file still exists with the recorded size.
+    if recorded != current:
+        return False
+    try:
+        size = local_path.stat().st_size
+    except FileNotFoundError:
+        return False
+    return recorded.size is None or size == recorded.size
+
+
 def _expect_no_duplicate_filenames(paths: Iterable[Path | None]) -> None:
     counter = Counter(paths)
     non_unique = [str(path) for path, count in counter.items() if count > 1]
@@ -6,10 +6,12 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 
-from .file import File
+from ._file_list import FileTable, LazyFileList
+from .file import File, _snapshot_local_files
+from .filesystem import RemotePath
 from .model import DownloadOrigDatablock, UploadOrigDatablock
 from .pid import PID
 
@@ -22,9 +24,16 @@ class OrigDatablock:
 
     This type is used for building datasets and gets converted to/from pydantic
     models for communication with a server.
+
+    Files of datablocks constructed from download models are only converted to
+    :class:`scitacean.File` objects when they are accessed.
+
+    The total size of files is cached.
+    The cache is invalidated when files are added but not when local files
+    change on disk; call :meth:`OrigDatablock.refresh` in that case.
     """
 
-    _files: list[File] = dataclasses.field(init=False)
+    _files: LazyFileList | FileTable = dataclasses.field(init=False)
     checksum_algorithm: str | None = None
     init_files: dataclasses.InitVar[Iterable[File] | None] = None
     _access_groups: list[str] | None = None
@@ -33,14 +42,21 @@ class OrigDatablock:
     _is_published: bool | None = None
     _updated_at: datetime | None = None
     _updated_by: str | None = None
+    # Incremented on every change to the files to allow detecting changes.
+    _version: int = dataclasses.field(default=0, init=False, repr=False, compare=False)
+    _size: int | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self, init_files: Iterable[File] | None) -> None:
-        self._files = list(init_files) if init_files is not None else []
+        self._files = LazyFileList(init_files if init_files is not None else ())
 
     @classmethod
     def from_download_model(
         cls,
         orig_datablock_model: DownloadOrigDatablock,
+        *,
+        compact_files: bool = False,
     ) -> OrigDatablock:
         """Construct a new OrigDatablock from pydantic models.
 
@@ -48,6 +64,11 @@ class OrigDatablock:
         ----------
         orig_datablock_model:
             Model of the orig datablock to construct.
+        compact_files:
+            If ``True``, store the file metadata in a compact, columnar table
+            instead of keeping the download models.
+            This requires much less memory for datablocks with many files.
+            File objects are constructed on demand either way.
 
         Returns
         -------
@@ -55,7 +76,7 @@ class OrigDatablock:
             A new instance.
         """
         dblock = orig_datablock_model
-        return OrigDatablock(
+        result = OrigDatablock(
             checksum_algorithm=dblock.chkAlg,
             _access_groups=dblock.accessGroups,
             _created_at=dblock.createdAt,
@@ -63,21 +84,33 @@ class OrigDatablock:
             _is_published=orig_datablock_model.isPublished,
             _updated_at=dblock.updatedAt,
             _updated_by=dblock.updatedBy,
-            init_files=[
-                File.from_download_model(file, checksum_algorithm=dblock.chkAlg)
-                for file in dblock.dataFileList or ()
-            ],
         )
+        # Files are constructed lazily because there can be very many of them.
+        storage = FileTable if compact_files else LazyFileList
+        result._files = storage.from_download_models(
+            dblock.dataFileList or (), checksum_algorithm=dblock.chkAlg
+        )
+        return result
 
     @property
     def files(self) -> Iterator[File]:
         """Iterator over all files."""
         return iter(self._files)
 
+    @property
+    def number_of_files(self) -> int:
+        """Number of files in this datablock."""
+        return len(self._files)
+
     @property
     def size(self) -> int:
-        """Total size of all files."""
-        return sum(file.size for file in self.files)
+        """Total size of all files.
+
+        The size is cached, see :meth:`OrigDatablock.refresh`.
+        """
+        if self._size is None:
+            self._size = self._files.size()
+        return self._size
 
     @property
     def access_groups(self) -> list[str] | None:
@@ -121,6 +154,60 @@ class OrigDatablock:
             dataclasses.replace(f, checksum_algorithm=self.checksum_algorithm)
             for f in files
         )
+        self._invalidate()
+
+    def refresh(
+        self, *, max_workers: int | None = None, use_scandir: bool = False
+    ) -> None:
+        """Re-read the metadata of local files from the filesystem.
+
+        See :meth:`scitacean.Dataset.refresh`.
+        """
+        _snapshot_local_files(
+            self._files.local_files(), max_workers=max_workers, use_scandir=use_scandir
+        )
+        self._invalidate()
+
+    def remote_paths(self) -> Iterator[str]:
+        """Iterate over the remote paths of all files as POSIX strings.
+
+        Unlike :attr:`OrigDatablock.files`, this does not construct file objects.
+        """
+        return self._files.remote_paths()
+
+    def get_file(self, remote_path: str | RemotePath) -> File | None:
+        """Return the file with the given remote path.
+
+        Files are looked up in an index of remote paths which is built on first use.
+
+        Parameters
+        ----------
+        remote_path:
+            Remote path of the file.
+
+        Returns
+        -------
+        :
+            The file with the given remote path or ``None`` if there is no such file.
+        """
+        return self._files.get(RemotePath(remote_path).posix)
+
+    def _has_file(self, remote_path: str) -> bool:
+        return self._files.index_of(remote_path) is not None
+
+    def _select_files(self, predicate: Callable[[str], bool]) -> list[File]:
+        return self._files.select(predicate)
+
+    def _with_replaced_files(self, replacements: dict[str, File]) -> OrigDatablock:
+        # Return a copy where files are replaced by files in `replacements`
+        # with the same POSIX remote path.
+        dblock = dataclasses.replace(self)
+        dblock._files = self._files.replaced(replacements)
+        return dblock
+
+    def _invalidate(self) -> None:
+        self._version += 1
+        self._size = None
 
     def make_upload_model(self, dataset_id: PID) -> UploadOrigDatablock:
         """Build a new pydantic model to upload this datablock.
@@ -138,6 +225,6 @@ class OrigDatablock:
         return UploadOrigDatablock(
             chkAlg=self.checksum_algorithm,
             size=self.size,
-            dataFileList=[file.make_model(for_archive=False) for file in self.files],
+            dataFileList=self._files.upload_models(),
             datasetId=dataset_id,
         )
@@ -8,14 +8,17 @@ import dataclasses
 import itertools
 import os
 from collections import Counter
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any, TypeVar
 
+from . import instrumentation
 from ._base_model import convert_download_to_user_model, convert_user_to_upload_model
 from ._dataset_fields import DatasetBase
 from .datablock import OrigDatablock
-from .file import File
+from .file import File, _snapshot_local_files
+from .filesystem import PathPatterns, RemotePath, _path_matcher, _scan_directory
 from .model import (
     Attachment,
     DownloadDataset,
@@ -32,7 +35,9 @@ class Dataset(DatasetBase):
     """Metadata and linked data files for a measurement, simulation, or analysis."""
 
     @classmethod
-    def from_download_model(cls, dataset_model: DownloadDataset) -> Dataset:
+    def from_download_model(
+        cls, dataset_model: DownloadDataset, *, compact_files: bool = False
+    ) -> Dataset:
         """Construct a new dataset from SciCat download models.
 
         Parameters
@@ -41,24 +46,34 @@ class Dataset(DatasetBase):
             Model of the dataset.
             Must contain orig datablocks and attachments if those should be
             added to the dataset.
+        compact_files:
+            If ``True``, store the metadata of files in a compact, columnar table.
+            This is recommended for datasets with a very large number of files.
+            See :meth:`scitacean.datablock.OrigDatablock.from_download_model`.
 
         Returns
         -------
         :
             A new Dataset instance.
         """
-        init_args, read_only = DatasetBase._prepare_fields_from_download(dataset_model)
-        dset = cls(**init_args)
-        for key, val in read_only.items():
-            setattr(dset, key, val)
-        dset._attachments = convert_download_to_user_model(  # type: ignore[assignment]
-            dataset_model.attachments
-        )
-        if dataset_model.origdatablocks is not None:
-            dset._orig_datablocks.extend(
-                map(OrigDatablock.from_download_model, dataset_model.origdatablocks)
+        with instrumentation.span("scitacean.Dataset.from_download_model"):
+            init_args, read_only = DatasetBase._prepare_fields_from_download(
+                dataset_model
             )
-        return dset
+            dset = cls(**init_args)
+            for key, val in read_only.items():
+                setattr(dset, key, val)
+            dset._attachments = convert_download_to_user_model(  # type: ignore[assignment]
+                dataset_model.attachments
+            )
+            if dataset_model.origdatablocks is not None:
+                dset._orig_datablocks.extend(
+                    OrigDatablock.from_download_model(
+                        dblock, compact_files=compact_files
+                    )
+                    for dblock in dataset_model.origdatablocks
+                )
+            return dset
 
     @classmethod
     def fields(
@@ -122,7 +137,7 @@ class Dataset(DatasetBase):
 
         Corresponds to OrigDatablocks.
         """
-        return sum(len(tuple(dblock.files)) for dblock in self._orig_datablocks)
+        return sum(dblock.number_of_files for dblock in self._orig_datablocks)
 
     @property
     def number_of_files_archived(self) -> int:
@@ -142,19 +157,82 @@ class Dataset(DatasetBase):
         """Total size of files in directly accessible storage in the dataset.
 
         This includes files on both the local and remote filesystems.
+        The size is cached, call :meth:`Dataset.refresh` if local files
+        have changed on disk.
 
         Corresponds to OrigDatablocks.
         """
-        return sum(file.size for file in self.files)
+        return sum(dblock.size for dblock in self._orig_datablocks)
 
     @property
     def files(self) -> tuple[File, ...]:
         """Files linked with the dataset."""
-        return tuple(
-            itertools.chain.from_iterable(
-                dblock.files for dblock in self._orig_datablocks
+        # The cache is keyed by the datablocks and their versions
+        # to detect added datablocks and files.
+        # It holds references to the datablocks such that their ids cannot be
+        # reused by new datablocks while the cache is alive.
+        # Compact datablocks are not cached because the cache would hold
+        # all of their files in memory.
+        if not all(dblock._files.keeps_files for dblock in self._orig_datablocks):
+            self._files_cache = None
+            return tuple(
+                itertools.chain.from_iterable(
+                    dblock.files for dblock in self._orig_datablocks
+                )
+            )
+        if self._files_cache is None or not _files_cache_is_valid(
+            self._files_cache[0], self._orig_datablocks
+        ):
+            files = tuple(
+                itertools.chain.from_iterable(
+                    dblock.files for dblock in self._orig_datablocks
+                )
             )
+            key = tuple((dblock, dblock._version) for dblock in self._orig_datablocks)
+            self._files_cache = (key, files)
+        return self._files_cache[1]
+
+    def refresh(
+        self, *, max_workers: int | None = None, use_scandir: bool = False
+    ) -> None:
+        """Re-read the metadata of local files from the filesystem.
+
+        Takes a snapshot of the ``stat`` results of all local files in a single,
+        parallel pass and discards cached properties like :attr:`Dataset.size`.
+        Afterwards, :attr:`File.size` and :attr:`File.creation_time` of local files
+        and the checks whether cached checksums are up to date use the snapshot
+        instead of querying the filesystem.
+        This is important for performance on network filesystems where
+        each query is expensive.
+
+        Call this method again when local files have changed on disk.
+
+        Parameters
+        ----------
+        max_workers:
+            Maximum number of threads used for querying the filesystem.
+        use_scandir:
+            If ``True``, list directories with :func:`os.scandir` instead of
+            querying each file separately.
+            See :func:`scitacean.filesystem.stat_files`.
+        """
+        _snapshot_local_files(
+            itertools.chain.from_iterable(
+                dblock._files.local_files() for dblock in self._orig_datablocks
+            ),
+            max_workers=max_workers,
+            use_scandir=use_scandir,
         )
+        for dblock in self._orig_datablocks:
+            dblock._invalidate()
+
+    def _select_files(self, predicate: Callable[[str], bool]) -> list[File]:
+        # Select by POSIX remote path to avoid constructing all files.
+        return [
+            file
+            for dblock in self._orig_datablocks
+            for file in dblock._select_files(predicate)
+        ]
 
     @property
     def attachments(self) -> list[Attachment] | None:
@@ -295,6 +373,73 @@ class Dataset(DatasetBase):
             datablock=datablock,
         )
 
+    def add_local_files_from_directory(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        include: PathPatterns | None = None,
+        exclude: PathPatterns | None = None,
+        datablock: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Add all files in a local directory and its subdirectories to the dataset.
+
+        Unlike :meth:`Dataset.add_local_files`, this preserves the directory
+        structure.
+        That is, given
+
+        .. code-block::
+
+            dataset.source_folder = "remote/source"
+            dataset.add_local_files_from_directory("/path/to/run", include="*.h5")
+
+        and uploading this dataset to SciCat, the file ``/path/to/run/raw/data.h5``
+        will be uploaded to::
+
+            remote/source/raw/data.h5
+
+        The directory tree is traversed in parallel using :func:`os.scandir`.
+        The ``stat`` results of the files are stored in the files,
+        so querying their size and creation time does not access the filesystem,
+        see :meth:`Dataset.refresh`.
+
+        Parameters
+        ----------
+        directory:
+            Local path to the directory.
+        include:
+            Only add files whose path relative to ``directory`` matches
+            any of these patterns.
+            Strings are glob patterns that must match the entire path,
+            regular expressions may match anywhere in the path.
+            See :data:`scitacean.filesystem.PathPatterns`.
+        exclude:
+            Do not add files whose relative path matches any of these patterns.
+            Directories that match are not traversed.
+        datablock:
+            Advanced feature, do not set unless you know what this is!
+
+            Select the orig datablock to store the file in.
+
+            - ``None``: Use the last datablock in the list if possible
+              or add a new one if needed.
+            - Otherwise, use the datablock with that index.
+        max_workers:
+            Maximum number of threads used for traversing the directory.
+        """
+        found = _scan_directory(
+            Path(directory),
+            include=_path_matcher(include),
+            exclude=_path_matcher(exclude),
+            max_workers=max_workers,
+        )
+        files = []
+        for path, relative, stat_result in found:
+            file = File.from_local(path, remote_path=relative)
+            file._stat_snapshot.value = stat_result  # type: ignore[union-attr]
+            files.append(file)
+        self.add_files(*files, datablock=datablock)
+
     def replace(
         self,
         *,
@@ -438,20 +583,38 @@ class Dataset(DatasetBase):
         :
             A new dataset with given files.
         """
-
-        def new_or_old(old: File) -> File:
-            for new in files:
-                if old.remote_path == new.remote_path:
-                    return new
-            return old
-
+        replacements: dict[str, File] = {}
+        for file in files:
+            # If there are multiple files with the same path, the first one wins.
+            replacements.setdefault(file.remote_path.posix, file)
         return self.replace(
             _orig_datablocks=[
-                dataclasses.replace(dblock, init_files=map(new_or_old, dblock.files))
+                dblock._with_replaced_files(replacements)
                 for dblock in self._orig_datablocks
             ]
         )
 
+    def get_file(self, remote_path: str | RemotePath) -> File | None:
+        """Return the file with the given remote path.
+
+        Files are looked up in an index of remote paths which is built on first use.
+        So this does not construct file objects for all files in the dataset.
+
+        Parameters
+        ----------
+        remote_path:
+            Remote path of the file.
+
+        Returns
+        -------
+        :
+            The file with the given remote path or ``None`` if there is no such file.
+        """
+        for dblock in self._orig_datablocks:
+            if (file := dblock.get_file(remote_path)) is not None:
+                return file
+        return None
+
     def add_orig_datablock(self, *, checksum_algorithm: str | None) -> OrigDatablock:
         """Append a new orig datablock to the list of orig datablocks.
 
@@ -509,27 +672,28 @@ class Dataset(DatasetBase):
         # Datablocks are not included here because they are handled separately
         # by make_datablock_upload_models and their own endpoints.
         special = ("relationships", "techniques", "input_datasets", "used_software")
-        return UploadDataset(
-            numberOfFiles=self.number_of_files,
-            numberOfFilesArchived=self.number_of_files_archived,
-            size=self.size,
-            packedSize=self.packed_size,
-            scientificMetadata=self._meta or None,
-            techniques=convert_user_to_upload_model(  # type: ignore[arg-type]
-                self.techniques
-            ),
-            relationships=convert_user_to_upload_model(  # type: ignore[arg-type]
-                self.relationships
-            ),
-            inputDatasets=self.input_datasets or [],
-            usedSoftware=self.used_software or [],
-            **{
-                field.scicat_name: value
-                for field in self.fields()
-                if field.name not in special
-                and (value := getattr(self, field.name)) is not None
-            },
-        )
+        with instrumentation.span("scitacean.Dataset.make_upload_model"):
+            return UploadDataset(
+                numberOfFiles=self.number_of_files,
+                numberOfFilesArchived=self.number_of_files_archived,
+                size=self.size,
+                packedSize=self.packed_size,
+                scientificMetadata=self._meta or None,
+                techniques=convert_user_to_upload_model(  # type: ignore[arg-type]
+                    self.techniques
+                ),
+                relationships=convert_user_to_upload_model(  # type: ignore[arg-type]
+                    self.relationships
+                ),
+                inputDatasets=self.input_datasets or [],
+                usedSoftware=self.used_software or [],
+                **{
+                    field.scicat_name: value
+                    for field in self.fields()
+                    if field.name not in special
+                    and (value := getattr(self, field.name)) is not None
+                },
+            )
 
     def make_datablock_upload_models(self) -> DatablockUploadModels:
         """Build models for all contained (orig) datablocks.
@@ -719,6 +883,16 @@ class DatablockUploadModels:
     """Orig datablocks"""
 
 
+def _files_cache_is_valid(
+    key: tuple[tuple[OrigDatablock, int], ...], orig_datablocks: list[OrigDatablock]
+) -> bool:
+    # Compare by identity because datablocks compare equal by content.
+    return len(key) == len(orig_datablocks) and all(
+        cached is dblock and version == dblock._version
+        for (cached, version), dblock in zip(key, orig_datablocks, strict=True)
+    )
+
+
 def _deny_conflicting_files(
     files: tuple[File, ...], orig_datablocks: list[OrigDatablock]
 ) -> None:
@@ -734,9 +908,9 @@ def _deny_conflicting_file_names(
     if duplicates:
         raise ValueError(f"Duplicate file names: {duplicates!r}")
 
-    for db in orig_datablocks:
-        names.update(Counter(f.remote_path.posix for f in db.files))
-    duplicates = [name for name, count in names.items() if count > 1]
+    duplicates = [
+        name for name in names if any(db._has_file(name) for db in orig_datablocks)
+    ]
     if duplicates:
         raise ValueError(
             f"Cannot add files with names {duplicates!r} because "
@@ -7,17 +7,25 @@ from __future__ import annotations
 import dataclasses
 import os
 import warnings
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import NoReturn, cast
 
 from .error import IntegrityError
-from .filesystem import RemotePath, checksum_of_file, file_modification_time, file_size
-from .logging import get_logger
+from .filesystem import (
+    RemotePath,
+    _modification_time,
+    checksums_of_file,
+    find_damaged_chunks,
+    is_chunked_checksum_algorithm,
+    stat_files,
+)
+from .logging import _file_log_level, get_logger
 from .model import DownloadDataFile, UploadDataFile
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class File:
     """Store local and remote paths and metadata for a file.
 
@@ -60,6 +68,9 @@ class File:
     _checksum_cache: _Checksum | None = dataclasses.field(
         default=None, compare=False, repr=False
     )
+    _stat_snapshot: _StatSnapshot | None = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
 
     @classmethod
     def from_local(
@@ -106,6 +117,7 @@ class File:
             remote_perm=remote_perm,
             remote_uid=remote_uid,
             _checksum_cache=_Checksum(),
+            _stat_snapshot=_StatSnapshot(),
         )
 
     @classmethod
@@ -215,24 +227,33 @@ class File:
     def size(self) -> int:
         """The size in bytes of the file.
 
-        If the file exists on local, return the current size of the local file.
+        If the file exists on local, return the current size of the local file
+        or the size in the last snapshot,
+        see :meth:`scitacean.Dataset.refresh`.
         Otherwise, return the stored size in the catalogue.
         """
         if self.is_on_local:
-            return file_size(cast(Path, self.local_path))
+            return self._local_stat().st_size
         return self._remote_size  # type: ignore[return-value]
 
     @property
     def creation_time(self) -> datetime:
         """The logical creation time of the SciCat file.
 
-        If the file exists on local, return the time the local file was last modified.
+        If the file exists on local, return the time the local file was last modified
+        or the time in the last snapshot,
+        see :meth:`scitacean.Dataset.refresh`.
         Otherwise, return the stored time in the catalogue.
         """
         if self.is_on_local:
-            return file_modification_time(cast(Path, self.local_path))
+            return _modification_time(self._local_stat())
         return self._remote_creation_time  # type: ignore[return-value]
 
+    def _local_stat(self) -> os.stat_result:
+        if self._stat_snapshot is not None and self._stat_snapshot.value is not None:
+            return self._stat_snapshot.value
+        return os.stat(cast(Path, self.local_path))
+
     def checksum(self) -> str | None:
         """Return the checksum of the file.
 
@@ -250,10 +271,7 @@ class File:
             return self._remote_checksum
         if self.checksum_algorithm is None:
             return None
-        return self._checksum_cache.get(  # type: ignore[union-attr]
-            path=self.local_path,  # type: ignore[arg-type]
-            algorithm=self.checksum_algorithm,
-        )
+        return self._local_checksum(self.checksum_algorithm)
 
     def remote_access_path(self, source_folder: RemotePath | str) -> RemotePath | None:
         """Full path to the file on the remote if it exists."""
@@ -296,11 +314,23 @@ class File:
         )
 
     def _local_is_up_to_date_with_checksum_algorithm(self, algorithm: str) -> bool:
-        local_checksum = self._checksum_cache.get(  # type: ignore[union-attr]
-            path=self.local_path,  # type: ignore[arg-type]
+        return self._remote_checksum == self._local_checksum(algorithm)
+
+    def _local_checksum(
+        self, algorithm: str, *, also: Iterable[str | None] = ()
+    ) -> str:
+        if self._checksum_cache is None:
+            # Can happen for local files constructed without the factory functions.
+            return checksums_of_file(
+                cast(Path, self.local_path),
+                algorithms=_algorithm_set(algorithm, also),
+            )[algorithm]
+        return self._checksum_cache.get(
+            path=cast(Path, self.local_path),
             algorithm=algorithm,
+            modification_time=self.creation_time,
+            also=also,
         )
-        return self._remote_checksum == local_checksum
 
     def make_model(self, *, for_archive: bool = False) -> UploadDataFile:
         """Build a pydantic model for this file.
@@ -397,9 +427,16 @@ class File:
             A new file object.
         """
         return dataclasses.replace(
-            self, local_path=Path(local_path), _checksum_cache=_Checksum()
+            self,
+            local_path=Path(local_path),
+            _checksum_cache=_Checksum(),
+            _stat_snapshot=_StatSnapshot(),
         )
 
+    def _with_new_stat_snapshot(self) -> File:
+        # Return a copy that does not share the stat snapshot with this file.
+        return dataclasses.replace(self, _stat_snapshot=_StatSnapshot())
+
     def validate_after_download(self) -> None:
         """Check that the file on disk matches the metadata.
 
@@ -407,6 +444,13 @@ class File:
         Raises on failure.
         If the function returns without exception, the file is valid.
 
+        For chunked checksum algorithms, the error message lists the damaged
+        byte ranges, see :func:`scitacean.filesystem.find_damaged_chunks`.
+        The damaged chunks are not re-transferred because download connections
+        can only transfer whole files.
+        Download the file again instead, e.g., with
+        ``client.download_files(dataset, target=..., force=True)``.
+
         Raises
         ------
         IntegrityError
@@ -414,10 +458,13 @@ class File:
         """
         self._validate_after_download_file_size()
         if self._remote_checksum is None:
-            get_logger().info(
-                "Dataset does not contain a checksum for file '%s'. Skipping check.",
-                self.local_path,
-            )
+            if (level := _file_log_level()) is not None:
+                get_logger().log(
+                    level,
+                    "Dataset does not contain a checksum for file '%s'. "
+                    "Skipping check.",
+                    self.local_path,
+                )
             return
         stored = self._remote_checksum
         if not self.checksum_algorithm:
@@ -428,9 +475,27 @@ class File:
                 stored,
             )
             return
-        actual = checksum_of_file(
-            cast(Path, self.local_path), algorithm=self.checksum_algorithm
-        )
+        if self._checksum_cache is not None:
+            # The cache may hold the checksum of a file that was overwritten by
+            # the download without changing the modification time.
+            self._checksum_cache.invalidate()
+        actual = self._local_checksum(self.checksum_algorithm)
+        if actual != stored and is_chunked_checksum_algorithm(self.checksum_algorithm):
+            # Chunked checksums can be very long,
+            # so only report where the file is damaged.
+            try:
+                damaged = find_damaged_chunks(
+                    actual, stored, algorithm=self.checksum_algorithm
+                )
+            except ValueError:
+                pass  # Malformed checksum in the dataset, report it in full below.
+            else:
+                _log_and_raise(
+                    IntegrityError,
+                    f"Checksum of file '{self.local_path}' does not match checksum "
+                    f"stored in dataset. Using algorithm "
+                    f"'{self.checksum_algorithm}'. Damaged byte ranges: {damaged}",
+                )
         if actual != stored:
             _log_and_raise(
                 IntegrityError,
@@ -441,7 +506,7 @@ class File:
             )
 
     def _validate_after_download_file_size(self) -> None:
-        actual = file_size(cast(Path, self.local_path))
+        actual = self.size
         if actual != self._remote_size:
             get_logger().info(
                 "Size of downloaded file '%s' (%d bytes) does not "
@@ -460,29 +525,85 @@ def _log_and_raise(typ: type, msg: str) -> NoReturn:
 
 
 class _Checksum:
-    """Compute and cache the checksum of a file."""
+    """Compute and cache checksums of a file.
+
+    Checksums for all algorithms that have been requested since the file
+    was last modified are cached.
+    """
 
     def __init__(self) -> None:
-        self._value: str | None = None
+        self._values: dict[str, str] = {}
         self._path: Path | None = None
-        self._algorithm: str | None = None
         self._access_time: datetime | None = None
 
-    def get(self, *, path: Path, algorithm: str) -> str:
-        if self._is_out_of_date(path=path, algorithm=algorithm):
-            self._update(path=path, algorithm=algorithm)
-        return self._value  # type: ignore[return-value]
+    def get(
+        self,
+        *,
+        path: Path,
+        algorithm: str,
+        modification_time: datetime,
+        also: Iterable[str | None] = (),
+    ) -> str:
+        """Return the checksum for ``algorithm``.
+
+        If the checksum needs to be computed, the checksums for
+        all algorithms in ``also`` are computed in the same pass over the file.
+        """
+        if self._is_out_of_date(path=path, modification_time=modification_time):
+            self._values = {}
+        if algorithm not in self._values:
+            self._update(
+                path=path,
+                algorithms=_algorithm_set(algorithm, also) - self._values.keys(),
+            )
+        return self._values[algorithm]
 
-    def _is_out_of_date(self, *, path: Path, algorithm: str) -> bool:
+    def invalidate(self) -> None:
+        """Discard all cached checksums."""
+        self._values = {}
+        self._access_time = None
+
+    def _is_out_of_date(self, *, path: Path, modification_time: datetime) -> bool:
         return (
             self._access_time is None
             or path != self._path
-            or algorithm != self._algorithm
-            or file_modification_time(path) > self._access_time
+            or modification_time > self._access_time
         )
 
-    def _update(self, *, path: Path, algorithm: str) -> None:
-        self._value = checksum_of_file(path, algorithm=algorithm)
+    def _update(self, *, path: Path, algorithms: set[str]) -> None:
+        self._values.update(checksums_of_file(path, algorithms=algorithms))
         self._path = path
-        self._algorithm = algorithm
         self._access_time = datetime.now(tz=UTC)
+
+
+def _algorithm_set(algorithm: str, also: Iterable[str | None]) -> set[str]:
+    return {algorithm, *(a for a in also if a is not None)}
+
+
+class _StatSnapshot:
+    """Hold a snapshot of the stat result of a local file."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: os.stat_result | None = None
+
+
+def _snapshot_local_files(
+    files: Iterable[File], *, max_workers: int | None = None, use_scandir: bool = False
+) -> None:
+    # Afterwards, File.size, File.creation_time, and the checksum cache
+    # use the snapshot instead of querying the filesystem.
+    # Files that are not on local are ignored.
+    files = [
+        file
+        for file in files
+        if file.local_path is not None and file._stat_snapshot is not None
+    ]
+    results = stat_files(
+        (cast(Path, file.local_path) for file in files),
+        max_workers=max_workers,
+        use_scandir=use_scandir,
+    )
+    for file, result in zip(files, results, strict=True):
+        cast(_StatSnapshot, file._stat_snapshot).value = result
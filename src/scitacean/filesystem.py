@@ -11,9 +11,16 @@ But conversions from plain strings are usually supported but should be used with
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import hashlib
+import itertools
+import mmap
 import os
 import re
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import UTC, datetime
 from pathlib import Path, PurePath
 from typing import Any, TypeVar
@@ -21,6 +28,8 @@ from typing import Any, TypeVar
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
+from . import instrumentation
+
 
 class RemotePath:
     """A path on the remote filesystem.
@@ -36,8 +45,19 @@ class RemotePath:
     the two should almost never be mixed.
     """
 
+    __slots__ = ("_path",)
+
     def __init__(self, *path_segments: str | RemotePath) -> None:
         """Initialize from given path segments."""
+        if len(path_segments) == 1:
+            # Fast path for the most common case.
+            segment = path_segments[0]
+            if type(segment) is str:
+                self._path: str = segment
+                return
+            if isinstance(segment, RemotePath):
+                self._path = segment._path
+                return
         for segment in path_segments:
             if isinstance(segment, (PurePath, Path)):  # type: ignore[unreachable]
                 raise TypeError(
@@ -50,6 +70,14 @@ class RemotePath:
                 )
         self._path = "/".join(s for segment in path_segments if (s := _posix(segment)))
 
+    @classmethod
+    def _from_posix(cls, path: str) -> RemotePath:
+        # Construct from an already normalized string without any checks.
+        # Only use this with strings that are known to be valid.
+        self = object.__new__(cls)
+        self._path = path
+        return self
+
     @classmethod
     def from_local(cls, path: PurePath) -> RemotePath:
         """Create a RemotePath from a local, OS-specific path.
@@ -71,12 +99,13 @@ class RemotePath:
         if isinstance(other, (PurePath, Path)):  # type: ignore[unreachable]
             raise TypeError("OS paths are not supported when concatenating RemotePath.")
 
-        if _posix(other).startswith("/"):
+        other_path = _posix(other)
+        if other_path.startswith("/"):
             return RemotePath(other)  # other is absolute, do not concatenate
 
-        this = self.posix.removesuffix("/")
-        other = _posix(other).removesuffix("/").removeprefix("/")
-        return RemotePath(f"{this}/{other}")
+        this = self._path.removesuffix("/")
+        other_path = other_path.removesuffix("/").removeprefix("/")
+        return RemotePath._from_posix(f"{this}/{other_path}")
 
     def __rtruediv__(self, other: str) -> RemotePath:
         """Join two path segments."""
@@ -98,11 +127,16 @@ class RemotePath:
         return self._path
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, (RemotePath, str)):
-            return False
-        return self._path == RemotePath(other)._path
+        # A single string segment is used as is by __init__,
+        # so there is no need to construct a RemotePath here.
+        if isinstance(other, RemotePath):
+            return self._path == other._path
+        if isinstance(other, str):
+            return self._path == other
+        return False
 
     def __hash__(self) -> int:
+        # str caches its hash, so this is cheap after the first call.
         return hash(self._path)
 
     @property
@@ -124,8 +158,8 @@ class RemotePath:
         parts = self._path.rstrip("/").rsplit("/", 1)
         base = "/" if self._path.startswith("/") else "."
         if len(parts) == 1:
-            return RemotePath(base)
-        return RemotePath(parts[0] or base)
+            return RemotePath._from_posix(base)
+        return RemotePath._from_posix(parts[0] or base)
 
     def is_absolute(self) -> bool:
         """Return True if the path is absolute."""
@@ -148,10 +182,10 @@ class RemotePath:
                 parts.pop()
             else:
                 parts.append(part)
-        res = RemotePath(*parts)
+        res = "/".join(filter(None, parts))
         if self.is_absolute():
-            res._path = "/" + res._path
-        return res
+            res = "/" + res
+        return RemotePath._from_posix(res)
 
     def is_relative_to(self, other: RemotePath) -> bool:
         """Check whether this path is relative to another."""
@@ -183,7 +217,7 @@ class RemotePath:
             suffix = "." + parts[1] if len(parts) > 1 else ""
             return (name[: max(1, max_length - len(suffix))] + suffix)[:max_length]
 
-        return RemotePath("/".join(map(trunc, self._path.split("/"))))
+        return RemotePath._from_posix("/".join(map(trunc, self._path.split("/"))))
 
     @classmethod
     def validate(cls, value: str | RemotePath) -> RemotePath:
@@ -218,15 +252,292 @@ def file_size(path: Path) -> int:
 
 def file_modification_time(path: Path) -> datetime:
     """Return the time in UTC when a local file was last modified."""
-    return datetime.fromtimestamp(path.stat().st_mtime).astimezone(UTC)
+    return _modification_time(path.stat())
+
+
+def _modification_time(stat_result: os.stat_result) -> datetime:
+    return datetime.fromtimestamp(stat_result.st_mtime).astimezone(UTC)
+
+
+# Number of files that are stat'ed by one task in stat_files.
+_STAT_CHUNK_SIZE = 256
+
+
+def stat_files(
+    paths: Iterable[Path], *, max_workers: int | None = None, use_scandir: bool = False
+) -> list[os.stat_result]:
+    """Return the stat results of many local files.
+
+    The files are processed in parallel using a thread pool.
+    This is mainly useful on network filesystems where each ``stat`` call
+    requires a round trip to a metadata server.
+
+    Parameters
+    ----------
+    paths:
+        Paths of the local files.
+    max_workers:
+        Maximum number of threads.
+        Defaults to the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+    use_scandir:
+        If ``True``, list each directory with :func:`os.scandir` and take the
+        stat results from the directory entries instead of calling
+        :func:`os.stat` for each file.
+        Directories are then processed in parallel instead of chunks of files.
+        This avoids per-file system calls on Windows, on other systems,
+        it can reduce the load on the filesystem when files are grouped in
+        few directories.
+
+    Returns
+    -------
+    :
+        The stat results in the same order as ``paths``.
+        Symlinks are followed.
+
+    Raises
+    ------
+    FileNotFoundError
+        If any of the files does not exist.
+    """
+    paths = list(paths)
+    results: list[os.stat_result | None] = [None] * len(paths)
+
+    def stat_chunk(indices: Iterable[int]) -> None:
+        for i in indices:
+            results[i] = os.stat(paths[i])
+
+    def stat_directory(directory: Path, indices: list[int]) -> None:
+        # A file can be requested multiple times.
+        wanted: dict[str, list[int]] = {}
+        for i in indices:
+            wanted.setdefault(paths[i].name, []).append(i)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if (matches := wanted.pop(entry.name, None)) is not None:
+                    result = entry.stat()
+                    for index in matches:
+                        results[index] = result
+        # Files that were not found by scandir raise a FileNotFoundError here.
+        stat_chunk(itertools.chain.from_iterable(wanted.values()))
+
+    tasks: list[Callable[[], None]]
+    if use_scandir:
+        by_directory: dict[Path, list[int]] = {}
+        for i, path in enumerate(paths):
+            by_directory.setdefault(path.parent, []).append(i)
+        tasks = [
+            functools.partial(stat_directory, directory, indices)
+            for directory, indices in by_directory.items()
+        ]
+    else:
+        tasks = [
+            functools.partial(
+                stat_chunk, range(start, min(start + _STAT_CHUNK_SIZE, len(paths)))
+            )
+            for start in range(0, len(paths), _STAT_CHUNK_SIZE)
+        ]
+
+    if len(tasks) <= 1 or max_workers == 1:
+        for task in tasks:
+            task()
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for future in [pool.submit(task) for task in tasks]:
+                future.result()
+    return results  # type: ignore[return-value]
 
 
 def _new_hash(algorithm: str) -> Any:
     return hashlib.new(algorithm, usedforsecurity=False)
 
 
+PathPatterns = str | re.Pattern[str] | Iterable[str | re.Pattern[str]]
+"""Glob patterns or regular expressions for selecting paths.
+
+Strings are interpreted as glob patterns and matched against the entire path
+using :func:`fnmatch.fnmatchcase`.
+Note that ``*`` also matches ``/``.
+Regular expressions are matched anywhere in the path using :meth:`re.Pattern.search`.
+"""
+
+
+def _path_matcher(patterns: PathPatterns | None) -> Callable[[str], bool] | None:
+    # Return a function that checks whether a POSIX path matches any of the patterns.
+    if patterns is None:
+        return None
+    if isinstance(patterns, (str, re.Pattern)):
+        patterns = [patterns]
+    patterns = list(patterns)
+    globs = [re.compile(fnmatch.translate(p)) for p in patterns if isinstance(p, str)]
+    searches = [p for p in patterns if isinstance(p, re.Pattern)]
+
+    def matches(path: str) -> bool:
+        return any(r.match(path) for r in globs) or any(
+            r.search(path) for r in searches
+        )
+
+    return matches
+
+
+def _scan_directory(
+    root: Path,
+    *,
+    include: Callable[[str], bool] | None,
+    exclude: Callable[[str], bool] | None,
+    max_workers: int | None,
+) -> list[tuple[Path, str, os.stat_result]]:
+    # Recursively find all files in `root` using a thread pool.
+    # Returns tuples of (local path, POSIX path relative to root, stat result)
+    # sorted by relative path.
+    # Directories that match `exclude` are not entered.
+    # Symlinks to directories are not followed to avoid cycles.
+    found: list[tuple[Path, str, os.stat_result]] = []
+
+    def scan(directory: Path, relative: str) -> list[tuple[Path, str]]:
+        subdirectories = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel = f"{relative}{entry.name}"
+                if exclude is not None and exclude(rel):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((Path(entry.path), rel + "/"))
+                elif entry.is_file() and (include is None or include(rel)):
+                    # list.append is thread-safe.
+                    found.append((Path(entry.path), rel, entry.stat()))
+        return subdirectories
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(scan, root, "")}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.update(pool.submit(scan, *sub) for sub in future.result())
+    found.sort(key=lambda item: item[1])
+    return found
+
+
+ChecksumEngine = Callable[[Path, Any, int], None]
+"""Function that feeds the contents of a file into a hash object.
+
+Called as ``engine(path, hash_object, block_size)``.
+``hash_object`` has the interface of the objects returned by :func:`hashlib.new`.
+Engines may ignore the block size.
+"""
+
+
+def _hash_read(path: Path, chk: Any, block_size: int) -> None:
+    # Read into a single, reused buffer without any buffering by Python.
+    buffer = memoryview(bytearray(block_size))
+    with open(path, "rb", buffering=0) as file:
+        for n in iter(lambda: file.readinto(buffer), 0):
+            chk.update(buffer[:n])
+
+
+def _hash_read_ahead(path: Path, chk: Any, block_size: int) -> None:
+    # Read the next block in a separate thread while hashing the current one.
+    # This overlaps I/O and hashing because both release the GIL
+    # for large buffers.
+    buffers = (memoryview(bytearray(block_size)), memoryview(bytearray(block_size)))
+    with (
+        open(path, "rb", buffering=0) as file,
+        ThreadPoolExecutor(max_workers=1) as pool,
+    ):
+        current = 0
+        pending = pool.submit(file.readinto, buffers[current])
+        while n := pending.result():
+            pending = pool.submit(file.readinto, buffers[1 - current])
+            chk.update(buffers[current][:n])
+            current = 1 - current
+
+
+def _hash_mmap(path: Path, chk: Any, block_size: int) -> None:
+    # Map the file into memory and let the OS handle read-ahead.
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # Empty files cannot be mapped.
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if (advice := getattr(mmap, "MADV_SEQUENTIAL", None)) is not None:
+                mapped.madvise(advice)
+            with memoryview(mapped) as view:
+                for start in range(0, len(view), block_size):
+                    chk.update(view[start : start + block_size])
+
+
+def _hash_file_digest(path: Path, chk: Any, block_size: int) -> None:
+    # hashlib.file_digest uses its own buffer size.
+    with open(path, "rb") as file:
+        hashlib.file_digest(file, lambda: chk)
+
+
+_CHECKSUM_ENGINES: dict[str, ChecksumEngine] = {
+    "read": _hash_read,
+    "read-ahead": _hash_read_ahead,
+    "mmap": _hash_mmap,
+    "file_digest": _hash_file_digest,
+}
+
 # size based on http://git.savannah.gnu.org/gitweb/?p=coreutils.git;a=blob;f=src/ioblksize.h;h=ed2f4a9c4d77462f357353eb73ee4306c28b37f1;hb=HEAD#l23  # noqa: E501
-def checksum_of_file(path: str | Path, *, algorithm: str) -> str:
+_checksum_block_size = 128 * 1024
+_checksum_engine: str | ChecksumEngine = "read"
+# With the 'auto' engine, files of at least this many blocks use read-ahead.
+_READ_AHEAD_MIN_BLOCKS = 8
+
+
+def set_checksum_engine(
+    engine: str | ChecksumEngine | None = None, *, block_size: int | None = None
+) -> None:
+    """Set the default engine and block size for computing checksums of files.
+
+    Use ``tools/benchmarks/checksum.py`` in the Scitacean repository to find the
+    best settings for a filesystem.
+
+    Parameters
+    ----------
+    engine:
+        New default engine, see :func:`checksum_of_file`.
+        If ``None``, the engine is not changed.
+    block_size:
+        New default block size in bytes.
+        If ``None``, the block size is not changed.
+    """
+    global _checksum_engine, _checksum_block_size
+    if engine is not None:
+        _resolve_checksum_engine(engine, None, 0)  # raise early for unknown engines
+        _checksum_engine = engine
+    if block_size is not None:
+        if block_size <= 0:
+            raise ValueError(f"Block size must be positive, got {block_size}")
+        _checksum_block_size = block_size
+
+
+def _resolve_checksum_engine(
+    engine: str | ChecksumEngine, path: Path | None, block_size: int
+) -> ChecksumEngine:
+    if callable(engine):
+        return engine
+    if engine == "auto":
+        if path is None:
+            return _hash_read
+        # Spinning up a thread does not pay off for small files.
+        large = path.stat().st_size >= _READ_AHEAD_MIN_BLOCKS * block_size
+        return _hash_read_ahead if large else _hash_read
+    try:
+        return _CHECKSUM_ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"Unknown checksum engine: {engine!r}, "
+            f"expected one of {['auto', *_CHECKSUM_ENGINES]}"
+        ) from None
+
+
+def checksum_of_file(
+    path: str | Path,
+    *,
+    algorithm: str,
+    engine: str | ChecksumEngine | None = None,
+    block_size: int | None = None,
+) -> str:
     """Compute the checksum of a local file.
 
     Parameters
@@ -235,18 +546,251 @@ def checksum_of_file(path: str | Path, *, algorithm: str) -> str:
         Path of the file on the local filesystem.
     algorithm:
         Hash algorithm to use. Can be any algorithm supported by :func:`hashlib.new`.
+    engine:
+        How the file is read. One of
+
+        - ``"read"``: Read blocks into a single buffer.
+        - ``"read-ahead"``: Read the next block in a background thread while
+          hashing the current block.
+        - ``"mmap"``: Map the file into memory.
+          The OS is advised that the file is read sequentially.
+        - ``"file_digest"``: Use :func:`hashlib.file_digest`,
+          this ignores ``block_size``.
+        - ``"auto"``: Use ``"read-ahead"`` for large files and ``"read"`` otherwise.
+          This needs an additional ``stat`` call and thread pool per file,
+          so it only pays off for large files on fast storage.
+        - A custom :data:`ChecksumEngine`.
+
+        Defaults to the engine set by :func:`set_checksum_engine`
+        which is ``"read"`` unless changed.
+    block_size:
+        Number of bytes to process at once.
+        Defaults to the block size set by :func:`set_checksum_engine`
+        which is 128 KiB unless changed.
+        Large blocks of several MiB can be much faster on parallel filesystems.
 
     Returns
     -------
     :
         The hex digest of the hash.
     """
-    chk = _new_hash(algorithm)
-    buffer = memoryview(bytearray(128 * 1024))
-    with open(path, "rb", buffering=0) as file:
-        for n in iter(lambda: file.readinto(buffer), 0):
-            chk.update(buffer[:n])
-    return chk.hexdigest()  # type: ignore[no-any-return]
+    return checksums_of_file(
+        path, algorithms=(algorithm,), engine=engine, block_size=block_size
+    )[algorithm]
+
+
+def checksums_of_file(
+    path: str | Path,
+    *,
+    algorithms: Iterable[str],
+    engine: str | ChecksumEngine | None = None,
+    block_size: int | None = None,
+) -> dict[str, str]:
+    """Compute checksums of a local file with several algorithms.
+
+    The file is read only once and each block is fed into all hashes.
+
+    Parameters
+    ----------
+    path:
+        Path of the file on the local filesystem.
+    algorithms:
+        Hash algorithms to use.
+        Can be any algorithms supported by :func:`hashlib.new`.
+    engine:
+        How the file is read, see :func:`checksum_of_file`.
+    block_size:
+        Number of bytes to process at once, see :func:`checksum_of_file`.
+
+    Returns
+    -------
+    :
+        Dict of algorithm to hex digest.
+    """
+    algorithms = set(algorithms)
+    # Only build attributes when they are recorded to keep disabled spans cheap.
+    attributes = (
+        {"algorithms": ",".join(sorted(algorithms))}
+        if instrumentation.is_enabled()
+        else {}
+    )
+    with instrumentation.span("scitacean.checksums_of_file", **attributes):
+        return _checksums_of_file(
+            Path(path), algorithms=algorithms, engine=engine, block_size=block_size
+        )
+
+
+def _checksums_of_file(
+    path: Path,
+    *,
+    algorithms: set[str],
+    engine: str | ChecksumEngine | None,
+    block_size: int | None,
+) -> dict[str, str]:
+    if block_size is None:
+        block_size = _checksum_block_size
+    chunked = {
+        algorithm: spec
+        for algorithm in algorithms
+        if (spec := _parse_chunked_algorithm(algorithm)) is not None
+    }
+    # Chunked checksums read the file in parallel on their own.
+    result = {
+        algorithm: _chunked_checksum(path, *spec, block_size=block_size)
+        for algorithm, spec in chunked.items()
+    }
+
+    hashes = {
+        algorithm: _new_hash(algorithm)
+        for algorithm in algorithms
+        if algorithm not in chunked
+    }
+    if hashes:
+        hash_file = _resolve_checksum_engine(
+            engine if engine is not None else _checksum_engine, path, block_size
+        )
+        if len(hashes) == 1:
+            hash_file(path, next(iter(hashes.values())), block_size)
+        else:
+            hash_file(path, _MultiHash(hashes.values()), block_size)
+        result.update((algorithm, chk.hexdigest()) for algorithm, chk in hashes.items())
+    return result
+
+
+class _MultiHash:
+    """Feed data into several hash objects at once."""
+
+    def __init__(self, hashes: Iterable[Any]) -> None:
+        self._updates = [chk.update for chk in hashes]
+
+    def update(self, data: Any) -> None:
+        for update in self._updates:
+            update(data)
+
+
+_CHUNKED_ALGORITHM = re.compile(r"merkle-(?P<base>\w+?)(?:-(?P<mib>[1-9]\d*)M)?")
+_DEFAULT_CHUNK_MIB = 64
+
+
+def is_chunked_checksum_algorithm(algorithm: str) -> bool:
+    """Return whether an algorithm name refers to a chunked checksum.
+
+    Chunked checksum algorithms are named ``"merkle-<base>"`` or
+    ``"merkle-<base>-<n>M"`` where ``<base>`` is an algorithm supported by
+    :func:`hashlib.new` and ``<n>`` is the chunk size in MiB (default 64).
+    For example, ``"merkle-sha256"`` or ``"merkle-blake2b-16M"``.
+
+    Files are split into chunks which are hashed in parallel.
+    The chunk digests are combined into a binary hash tree (Merkle tree)
+    like in `RFC 6962 <https://www.rfc-editor.org/rfc/rfc6962#section-2.1>`_.
+    The checksum is ``"<root>:<chunk0>,<chunk1>,..."`` where each element is
+    the hex digest of the root of the tree or a chunk.
+    Storing the chunk digests allows finding the damaged parts of a file,
+    see :func:`find_damaged_chunks`.
+    """
+    return _parse_chunked_algorithm(algorithm) is not None
+
+
+def _parse_chunked_algorithm(algorithm: str) -> tuple[str, int] | None:
+    # Return (base algorithm, chunk size in bytes).
+    match = _CHUNKED_ALGORITHM.fullmatch(algorithm)
+    if match is None or match["base"] not in hashlib.algorithms_available:
+        return None
+    return match["base"], int(match["mib"] or _DEFAULT_CHUNK_MIB) * 1024 * 1024
+
+
+def _chunked_checksum(
+    path: Path,
+    base: str,
+    chunk_size: int,
+    *,
+    block_size: int,
+    max_workers: int | None = None,
+) -> str:
+    n_chunks = max(1, -(-path.stat().st_size // chunk_size))
+
+    def hash_chunk(index: int) -> bytes:
+        # The prefix distinguishes leaves from inner nodes.
+        chk = _new_hash(base)
+        chk.update(b"\x00")
+        buffer = memoryview(bytearray(min(block_size, chunk_size)))
+        remaining = chunk_size
+        with open(path, "rb", buffering=0) as file:
+            file.seek(index * chunk_size)
+            while remaining > 0 and (n := file.readinto(buffer[:remaining])):
+                chk.update(buffer[:n])
+                remaining -= n
+        return chk.digest()  # type: ignore[no-any-return]
+
+    if n_chunks == 1:
+        leaves = [hash_chunk(0)]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            leaves = list(pool.map(hash_chunk, range(n_chunks)))
+
+    level = leaves
+    while len(level) > 1:
+        level = [_hash_node(base, *level[i : i + 2]) for i in range(0, len(level), 2)]
+    return f"{level[0].hex()}:{','.join(leaf.hex() for leaf in leaves)}"
+
+
+def _hash_node(base: str, left: bytes, right: bytes | None = None) -> bytes:
+    if right is None:
+        return left  # An unpaired node is promoted to the next level.
+    chk = _new_hash(base)
+    chk.update(b"\x01" + left + right)
+    return chk.digest()  # type: ignore[no-any-return]
+
+
+def find_damaged_chunks(
+    actual: str, expected: str, *, algorithm: str
+) -> list[tuple[int, int]]:
+    """Compare two chunked checksums and return the damaged byte ranges.
+
+    This only locates the damage, it does not repair files.
+
+    Parameters
+    ----------
+    actual:
+        Checksum of the local file, e.g., computed with :func:`checksum_of_file`.
+    expected:
+        Checksum of the intact file, e.g., stored in a datablock.
+    algorithm:
+        The chunked checksum algorithm of both checksums.
+
+    Returns
+    -------
+    :
+        ``(start, stop)`` byte offsets of all chunks whose digests differ.
+        The last range may extend beyond the end of the file.
+        If the files have different numbers of chunks, all chunks beyond
+        the shorter file are damaged.
+
+    Raises
+    ------
+    ValueError
+        If ``algorithm`` is not a chunked algorithm or a checksum is malformed.
+    """
+    if (spec := _parse_chunked_algorithm(algorithm)) is None:
+        raise ValueError(f"Not a chunked checksum algorithm: {algorithm}")
+    chunk_size = spec[1]
+    actual_leaves = _chunk_digests(actual)
+    expected_leaves = _chunk_digests(expected)
+    n_chunks = max(len(actual_leaves), len(expected_leaves))
+    return [
+        (index * chunk_size, (index + 1) * chunk_size)
+        for index in range(n_chunks)
+        if index >= len(actual_leaves)
+        or index >= len(expected_leaves)
+        or actual_leaves[index] != expected_leaves[index]
+    ]
+
+
+def _chunk_digests(checksum: str) -> list[str]:
+    _, sep, leaves = checksum.partition(":")
+    if not sep:
+        raise ValueError(f"Malformed chunked checksum: {checksum!r}")
+    return leaves.split(",")
 
 
 P = TypeVar("P", bound=str | Path | RemotePath)
@@ -283,7 +827,7 @@ def escape_path(path: P) -> P:
     return type(path)(re.sub(r"[^\w .\-]", "_", no_utf))  # type: ignore[return-value]
 
 
-try:
+def _register_hypothesis_strategy() -> None:
     import string
 
     import hypothesis.strategies as st
@@ -297,5 +841,8 @@ try:
             + "/."
         ).map(RemotePath),
     )
-except ModuleNotFoundError:
-    pass
+
+
+# See scitacean.pid for why this is conditional.
+if "hypothesis" in sys.modules:
+    _register_hypothesis_strategy()
@@ -0,0 +1,326 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Timing spans for Scitacean's hot paths.
+
+Scitacean wraps expensive operations in spans, e.g., calls to the SciCat API,
+checksum computations, file transfers, and model construction.
+Spans are only recorded after instrumentation has been enabled with
+:func:`enable`; otherwise, they do nothing and cost a single function call.
+
+Spans are passed to *exporters*.
+Scitacean provides
+
+- :class:`CallbackExporter` to call a function with every finished span and
+- :class:`OpenTelemetryExporter` to produce OpenTelemetry spans and a
+  latency histogram. This requires the ``opentelemetry-api`` package.
+
+Examples
+--------
+Collect the durations of all spans in a dict:
+
+.. code-block:: python
+
+    from collections import defaultdict
+    from scitacean import instrumentation
+
+    durations = defaultdict(list)
+    instrumentation.enable(
+        instrumentation.CallbackExporter(
+            lambda record: durations[record.name].append(record.duration)
+        )
+    )
+    client.upload_new_dataset_now(dataset)
+    instrumentation.disable()
+
+Forward spans to OpenTelemetry which must be configured separately:
+
+.. code-block:: python
+
+    instrumentation.enable(instrumentation.OpenTelemetryExporter())
+
+Custom code can use spans as well:
+
+.. code-block:: python
+
+    with instrumentation.span("my_app.process", n_files=len(files)) as s:
+        result = process(files)
+        s.set_attribute("n_results", len(result))
+
+Attributes are evaluated even when instrumentation is disabled.
+Guard expensive attributes with :func:`is_enabled`:
+
+.. code-block:: python
+
+    attributes = {}
+    if instrumentation.is_enabled():
+        attributes["names"] = ",".join(sorted(names))
+    with instrumentation.span("my_app.process", **attributes):
+        ...
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from collections.abc import Callable, Mapping
+from types import TracebackType
+from typing import Any, Protocol, Self
+
+AttributeValue = str | bool | int | float
+"""Allowed types of span attributes."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SpanRecord:
+    """A finished span."""
+
+    name: str
+    """Name of the span, e.g., ``"scitacean.ScicatClient.call_endpoint"``."""
+    attributes: Mapping[str, AttributeValue]
+    """Attributes of the span."""
+    start_time: float
+    """Start time in seconds since the epoch."""
+    duration: float
+    """Wall clock duration in seconds."""
+    error: BaseException | None
+    """The exception that ended the span, if any."""
+
+
+class SpanExporter(Protocol):
+    """Receiver of spans."""
+
+    def start_span(self, name: str, attributes: Mapping[str, AttributeValue]) -> Any:
+        """Start a new span.
+
+        Returns
+        -------
+        :
+            An arbitrary handle that is passed to :meth:`end_span`.
+        """
+
+    def end_span(self, handle: Any, record: SpanRecord) -> None:
+        """End a span that was started by :meth:`start_span`."""
+
+
+class CallbackExporter:
+    """Call a function with every finished span.
+
+    Parameters
+    ----------
+    callback:
+        Called with a :class:`SpanRecord` when a span ends.
+        It is called in the thread that ran the span.
+    """
+
+    __slots__ = ("_callback",)
+
+    def __init__(self, callback: Callable[[SpanRecord], object]) -> None:
+        self._callback = callback
+
+    def start_span(self, name: str, attributes: Mapping[str, AttributeValue]) -> None:
+        """Do nothing."""
+
+    def end_span(self, handle: None, record: SpanRecord) -> None:
+        """Pass ``record`` to the callback."""
+        self._callback(record)
+
+
+class OpenTelemetryExporter:
+    """Export spans to OpenTelemetry.
+
+    Every span is turned into an OpenTelemetry span, nested in the current span
+    of the calling thread.
+    In addition, the durations of spans are recorded in a histogram called
+    ``scitacean.span.duration`` with the span name as attribute ``scitacean.span``.
+
+    Requires ``opentelemetry-api`` which can be installed with
+    ``pip install scitacean[opentelemetry]``.
+
+    Parameters
+    ----------
+    tracer:
+        OpenTelemetry tracer to create spans with.
+        Defaults to the ``"scitacean"`` tracer of the global tracer provider.
+    meter:
+        OpenTelemetry meter to create the duration histogram with.
+        Defaults to the ``"scitacean"`` meter of the global meter provider.
+    """
+
+    __slots__ = ("_histogram", "_tracer")
+
+    def __init__(self, *, tracer: Any = None, meter: Any = None) -> None:
+        from opentelemetry import metrics, trace
+
+        self._tracer = trace.get_tracer("scitacean") if tracer is None else tracer
+        if meter is None:
+            meter = metrics.get_meter("scitacean")
+        self._histogram = meter.create_histogram(
+            "scitacean.span.duration",
+            unit="s",
+            description="Duration of Scitacean operations",
+        )
+
+    def start_span(
+        self, name: str, attributes: Mapping[str, AttributeValue]
+    ) -> tuple[Any, Any]:
+        """Start an OpenTelemetry span and make it the current span."""
+        manager = self._tracer.start_as_current_span(name, attributes=attributes)
+        return manager, manager.__enter__()
+
+    def end_span(self, handle: tuple[Any, Any], record: SpanRecord) -> None:
+        """End the OpenTelemetry span and record its duration."""
+        manager, otel_span = handle
+        otel_span.set_attributes(record.attributes)
+        error = record.error
+        if error is None:
+            manager.__exit__(None, None, None)
+        else:
+            # Records the exception and sets the error status.
+            manager.__exit__(type(error), error, error.__traceback__)
+        self._histogram.record(record.duration, {"scitacean.span": record.name})
+
+
+class Span:
+    """An active span.
+
+    Use :func:`span` to create spans instead of the constructor.
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_exporters",
+        "_handles",
+        "_start",
+        "_start_time",
+        "name",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        attributes: dict[str, AttributeValue],
+        exporters: tuple[SpanExporter, ...],
+    ) -> None:
+        self.name = name
+        self._attributes = attributes
+        self._exporters = exporters
+        self._handles: list[Any] = []
+        self._start = 0.0
+        self._start_time = 0.0
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Set an attribute of the span."""
+        self._attributes[key] = value
+
+    def __enter__(self) -> Self:
+        self._handles = [
+            exporter.start_span(self.name, self._attributes)
+            for exporter in self._exporters
+        ]
+        self._start_time = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        duration = time.perf_counter() - self._start
+        record = SpanRecord(
+            name=self.name,
+            attributes=self._attributes,
+            start_time=self._start_time,
+            duration=duration,
+            error=exc_val,
+        )
+        # End in reverse order to properly unwind nested contexts of exporters.
+        for exporter, handle in zip(
+            reversed(self._exporters), reversed(self._handles), strict=True
+        ):
+            exporter.end_span(handle, record)
+
+
+class _NullSpan(Span):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        self.name = ""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_exporters: tuple[SpanExporter, ...] = ()
+
+
+def span(name: str, /, **attributes: AttributeValue) -> Span:
+    """Create a span to time a block of code.
+
+    Use the returned object as a context manager.
+    If instrumentation is disabled, this returns a span that does nothing.
+
+    Parameters
+    ----------
+    name:
+        Name of the span.
+        Spans created by Scitacean have names starting with ``"scitacean."``.
+    attributes:
+        Initial attributes of the span.
+
+    Returns
+    -------
+    :
+        A new span.
+    """
+    if not _exporters:
+        return _NULL_SPAN
+    return Span(name, attributes, _exporters)
+
+
+def enable(*exporters: SpanExporter) -> None:
+    """Enable instrumentation and send spans to the given exporters.
+
+    Replaces any previously enabled exporters.
+    Spans that are already active continue to use the old exporters.
+
+    Parameters
+    ----------
+    exporters:
+        Exporters to send spans to.
+        Instrumentation is disabled if none are given.
+    """
+    global _exporters
+    _exporters = exporters
+
+
+def disable() -> None:
+    """Disable instrumentation."""
+    enable()
+
+
+def is_enabled() -> bool:
+    """Return ``True`` if instrumentation is enabled."""
+    return bool(_exporters)
+
+
+__all__ = [
+    "AttributeValue",
+    "CallbackExporter",
+    "OpenTelemetryExporter",
+    "Span",
+    "SpanExporter",
+    "SpanRecord",
+    "disable",
+    "enable",
+    "is_enabled",
+    "span",
+]
@@ -5,9 +5,28 @@
 The object returned by :func:`scitacean.get_logger` is the only logger
 used by Scitacean. Scitacean does not configure it in any way.
 You are free to do so.
+
+By default, Scitacean logs one line at level ``INFO`` for every file that it
+transfers.
+This can be noisy and slow when handling many files.
+Use :func:`set_file_log_mode` to log one summary line per batch of files
+instead.
 """
 
+from __future__ import annotations
+
 import logging
+import time
+from typing import Literal
+
+FileLogMode = Literal["per-file", "summary"]
+"""How routine operations on individual files are logged.
+
+- ``"per-file"``: Log one line at level ``INFO`` for every file.
+- ``"summary"``: Log one line at level ``INFO`` for every batch of files,
+  e.g., all files of a dataset that are downloaded at once.
+  Lines for individual files are logged at level ``DEBUG``.
+"""
 
 
 def logger_name() -> str:
@@ -15,6 +34,79 @@ def logger_name() -> str:
     return "scitacean"
 
 
+# Cached because logging.getLogger acquires a global lock.
+_logger = logging.getLogger(logger_name())
+_file_level = logging.INFO
+
+
 def get_logger() -> logging.Logger:
     """Return the logger used by Scitacean."""
-    return logging.getLogger(logger_name())
+    return _logger
+
+
+def set_file_log_mode(mode: FileLogMode) -> None:
+    """Select how routine operations on individual files are logged.
+
+    Parameters
+    ----------
+    mode:
+        The new mode, see :data:`FileLogMode`.
+    """
+    global _file_level
+    match mode:
+        case "per-file":
+            _file_level = logging.INFO
+        case "summary":
+            _file_level = logging.DEBUG
+        case _:
+            raise ValueError(
+                f"Invalid file log mode: {mode!r}, expected 'per-file' or 'summary'."
+            )
+
+
+def get_file_log_mode() -> FileLogMode:
+    """Return the current file log mode."""
+    return "per-file" if _file_level == logging.INFO else "summary"
+
+
+def _file_log_level() -> int | None:
+    """Return the level for logging a routine operation on a single file.
+
+    Returns ``None`` if such messages would not be emitted.
+    Use this to skip formatting the message arguments:
+
+    .. code-block:: python
+
+        if (level := _file_log_level()) is not None:
+            get_logger().log(level, "Copying %s", path.posix)
+    """
+    level = _file_level
+    return level if _logger.isEnabledFor(level) else None
+
+
+class _FileBatchLog:
+    """Log a summary line for a batch of files in ``"summary"`` mode.
+
+    Use as a context manager around the operation.
+    On successful exit, this logs ``message % args`` followed by the elapsed time.
+    Does nothing in ``"per-file"`` mode because the individual files are logged.
+    """
+
+    __slots__ = ("_args", "_message", "_start")
+
+    def __init__(self, message: str, *args: object) -> None:
+        self._message = message + " in %.3f s"
+        self._args = args
+        self._start: float | None = None
+
+    def __enter__(self) -> None:
+        if _file_level != logging.INFO and _logger.isEnabledFor(logging.INFO):
+            self._start = time.perf_counter()
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        if self._start is not None and exc_type is None:
+            _logger.info(
+                self._message,
+                *self._args,
+                time.perf_counter() - self._start,
+            )
@@ -2,28 +2,35 @@
 # Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
 """Tools for working with ontologies."""
 
-import bz2
 import importlib.resources
 import json
 import re
+from collections.abc import Iterable
 from functools import cache
+from typing import Any
 
 from ..model import Technique
+from ._search import LabelIndex, TechniqueMatch
 
 
-def _load_ontology(name: str) -> object:
+def _load_ontology(name: str) -> dict[str, Any]:
     """Load an ontology from the package resources.
 
     Note that the ontology file was generated using a script in
     ``tools/ontologies`` in the Scitacean repository.
+    It stores the ontology together with precomputed indices as uncompressed
+    JSON because that is faster to load than compressed formats.
     """
-    with (
+    return json.loads(  # type: ignore[no-any-return]
         importlib.resources.files("scitacean.ontology")
-        .joinpath(f"{name}.json.bz2")
-        .open("rb") as raw_f
-    ):
-        with bz2.open(raw_f, "rb") as f:
-            return json.loads(f.read())
+        .joinpath(f"{name}.json")
+        .read_bytes()
+    )
+
+
+@cache
+def _expands_ontology() -> dict[str, Any]:
+    return _load_ontology("expands_techniques")
 
 
 @cache
@@ -37,7 +44,15 @@ def expands_techniques() -> dict[str, list[str]]:
         The first element of the list is the primary label.
         All labels are lowercase and contain no leading or trailing whitespace.
     """
-    return _load_ontology("expands_techniques")  # type: ignore[return-value]
+    return _expands_ontology()["techniques"]  # type: ignore[no-any-return]
+
+
+def _expands_label_index() -> dict[str, list[str]]:
+    """Return a mapping from labels to the IRIs of all techniques with that label.
+
+    IRIs are in the order of :func:`expands_techniques`.
+    """
+    return _expands_ontology()["labels"]  # type: ignore[no-any-return]
 
 
 def find_technique(label_or_iri: str) -> Technique:
@@ -75,18 +90,94 @@ def find_technique(label_or_iri: str) -> Technique:
     return _lookup_label(label_or_iri)
 
 
+def find_techniques(labels_or_iris: Iterable[str]) -> list[Technique]:
+    """Construct Technique models from multiple ontology labels or IRIs.
+
+    This is equivalent to calling :func:`find_technique` for each element
+    but looks up repeated labels and IRIs only once.
+
+    Parameters
+    ----------
+    labels_or_iris:
+        Labels or IRIs as described in :func:`find_technique`.
+
+    Returns
+    -------
+    :
+        The loaded techniques in the same order as the input.
+
+    Raises
+    ------
+    ValueError
+        If any label or IRI is not found in the ontology.
+    """
+    found: dict[str, Technique] = {}
+    techniques = []
+    for label_or_iri in labels_or_iris:
+        if (technique := found.get(label_or_iri)) is None:
+            technique = found[label_or_iri] = find_technique(label_or_iri)
+        # Return separate objects because models are mutable.
+        techniques.append(Technique(pid=technique.pid, name=technique.name))
+    return techniques
+
+
+@cache
+def _expands_search_index() -> LabelIndex:
+    return LabelIndex(expands_techniques(), _expands_label_index())
+
+
+def search_techniques(
+    query: str, *, limit: int = 10, min_score: float = 0.0
+) -> list[TechniqueMatch]:
+    """Search for techniques whose labels are similar to the given text.
+
+    Use this function to map free-text technique names, e.g., from instruments,
+    to techniques from the
+    `ExPaNDS experimental techniques ontology <https://pan-ontologies.github.io/PaNET/index-en.html>`_
+    when :func:`find_technique` does not find an exact match.
+
+    Labels are compared to the query by the overlap of their character trigrams.
+    Labels that start with the query also match,
+    so incomplete names find the full label.
+    The comparison is case-insensitive and ignores repeated whitespace.
+
+    Parameters
+    ----------
+    query:
+        Free text to search for.
+    limit:
+        Return at most this many techniques.
+    min_score:
+        Only return techniques with at least this score.
+
+    Returns
+    -------
+    :
+        The best matching techniques in descending order of score.
+        Each technique appears at most once with its best matching label.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from scitacean.ontology import search_techniques
+
+        [best, *_] = search_techniques("small angle neutron scatering")
+        best.technique  # Technique(name='small angle neutron scattering', ...)
+        best.score  # 0.9...
+    """
+    return _expands_search_index().search(query, limit=limit, min_score=min_score)
+
+
 def _lookup_label(label: str) -> Technique:
     label = label.strip().lower()
-    found = [
-        (iri, labels[0])
-        for iri, labels in expands_techniques().items()
-        if label in labels
-    ]
+    found = _expands_label_index().get(label, [])
     if len(found) == 1:
-        return Technique(pid=found[0][0], name=found[0][1])
+        iri = found[0]
+        return Technique(pid=iri, name=expands_techniques()[iri][0])
     elif len(found) > 1:
         raise ValueError(
-            f"Found multiple techniques with label '{label}': {[f[0] for f in found]}. "
+            f"Found multiple techniques with label '{label}': {found}. "
             "Please specify the exact IRI instead or construct a Technique model "
             "manually.\n"
             "See the ExPaNDS experimental technique ontology for allowed labels at "
@@ -119,4 +210,10 @@ def _is_iri(iri: str) -> bool:
     return bool(_IRI_REGEX.match(iri))
 
 
-__all__ = ["expands_techniques", "find_technique"]
+__all__ = [
+    "TechniqueMatch",
+    "expands_techniques",
+    "find_technique",
+    "find_techniques",
+    "search_techniques",
+]
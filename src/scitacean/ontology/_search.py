@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Approximate search for techniques by label."""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+from collections import Counter
+
+from ..model import Technique
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TechniqueMatch:
+    """A technique found by :func:`scitacean.ontology.search_techniques`."""
+
+    technique: Technique
+    """The matched technique with its primary label as name."""
+    label: str
+    """The primary or alternative label that matched the query."""
+    score: float
+    """Similarity between the query and ``label`` in ``[0, 1]``.
+
+    ``1`` means that the normalized query is equal to the label.
+    """
+
+
+class LabelIndex:
+    """Trigram and prefix index over technique labels."""
+
+    __slots__ = (
+        "_label_iris",
+        "_labels",
+        "_n_trigrams",
+        "_postings",
+        "_sorted_labels",
+        "_techniques",
+    )
+
+    def __init__(
+        self, techniques: dict[str, list[str]], label_to_iris: dict[str, list[str]]
+    ) -> None:
+        self._techniques = techniques
+        self._labels = list(label_to_iris)
+        self._label_iris = list(label_to_iris.values())
+        # Label IDs sorted by label for prefix searches.
+        self._sorted_labels = sorted(
+            range(len(self._labels)), key=self._labels.__getitem__
+        )
+        self._postings: dict[str, list[int]] = {}
+        self._n_trigrams = []
+        for i, label in enumerate(self._labels):
+            trigrams = _trigrams(label)
+            self._n_trigrams.append(len(trigrams))
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(i)
+
+    def search(
+        self, query: str, *, limit: int, min_score: float
+    ) -> list[TechniqueMatch]:
+        """Return the ``limit`` techniques that match ``query`` best."""
+        scores = self._label_scores(_normalize(query))
+        # Sorting is stable, so ties are broken by the order of labels
+        # in the ontology.
+        matches: dict[str, TechniqueMatch] = {}
+        for i in sorted(scores, key=scores.__getitem__, reverse=True):
+            if len(matches) >= limit or (score := scores[i]) < min_score:
+                break
+            for iri in self._label_iris[i]:
+                if iri not in matches:
+                    matches[iri] = TechniqueMatch(
+                        technique=Technique(pid=iri, name=self._techniques[iri][0]),
+                        label=self._labels[i],
+                        score=score,
+                    )
+        return list(matches.values())[:limit]
+
+    def _label_scores(self, query: str) -> dict[int, float]:
+        if not query:
+            return {}
+        # Dice coefficient of the trigram sets.
+        query_trigrams = _trigrams(query)
+        shared: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            if (posting := self._postings.get(trigram)) is not None:
+                shared.update(posting)
+        n_query = len(query_trigrams)
+        n_trigrams = self._n_trigrams
+        scores = {
+            i: 2 * n_shared / (n_query + n_trigrams[i])
+            for i, n_shared in shared.items()
+        }
+        # Labels that start with the query match at least moderately well
+        # such that short queries can find long labels.
+        for i in self._with_prefix(query):
+            label = self._labels[i]
+            if label == query:
+                scores[i] = 1.0
+            else:
+                prefix_score = 0.5 + 0.45 * len(query) / len(label)
+                scores[i] = max(scores.get(i, 0.0), prefix_score)
+        return scores
+
+    def _with_prefix(self, prefix: str) -> list[int]:
+        def key(i: int) -> str:
+            return self._labels[i]
+
+        start = bisect.bisect_left(self._sorted_labels, prefix, key=key)
+        stop = bisect.bisect_left(
+            self._sorted_labels, prefix + "\U0010ffff", lo=start, key=key
+        )
+        return self._sorted_labels[start:stop]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
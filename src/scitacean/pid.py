@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
 from typing import Any
 
@@ -141,7 +142,7 @@ class PID:
         )
 
 
-try:
+def _register_hypothesis_strategy() -> None:
     import hypothesis.strategies as st
 
     st.register_type_strategy(
@@ -153,5 +154,10 @@ try:
             pid=st.text(),
         ),
     )
-except ModuleNotFoundError:
-    pass
+
+
+# Importing hypothesis is slow, so only register the strategy here if hypothesis
+# is already in use. Otherwise, hypothesis calls scitacean._hypothesis via an
+# entry point when it is imported.
+if "hypothesis" in sys.modules:
+    _register_hypothesis_strategy()
@@ -7,9 +7,9 @@ from __future__ import annotations
 import datetime
 import functools
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
 from copy import deepcopy
-from typing import Any
+from typing import Any, TypeVar
 
 import pydantic
 
@@ -17,6 +17,7 @@ from .. import model
 from .._profile import Profile, gather_login_params
 from ..client import Client, ScicatClient
 from ..error import ScicatCommError
+from ..filesystem import RemotePath
 from ..pid import PID
 from ..typing import FileTransfer
 from ..util.credentials import StrStorage
@@ -43,8 +44,8 @@ class FakeClient(Client):
     `pydantic <https://docs.pydantic.dev/>`_ models, namely
 
     - ``FakeClient.datasets``:
-            :class:`dict` of :class:`scitacean.model.DownloadDataset`,
-            indexed by dataset PID.
+            :class:`DatasetStore` of :class:`scitacean.model.DownloadDataset`,
+            a dict-like object indexed by dataset PID.
     - ``FakeClient.orig_datablocks``:
             :class:`dict` of lists of :class:`scitacean.model.DownloadOrigDatablock`,
             indexed by the *dataset* ID.
@@ -65,6 +66,9 @@ class FakeClient(Client):
     In particular, do not rely on specific error messages or the detailed settings
     in the datasets returned by ``FakeClient.upload_new_dataset_now``!
 
+    Stored models must not be modified in place.
+    Instead, assign a new model, e.g., using ``model_copy(update=...)``.
+
     Examples
     --------
     Set up a fake client for download:
@@ -130,7 +134,7 @@ class FakeClient(Client):
         )
 
         self.disabled = {} if disable is None else dict(disable)
-        self.datasets: dict[PID, model.DownloadDataset] = {}
+        self.datasets = DatasetStore()
         self.orig_datablocks: dict[PID, list[model.DownloadOrigDatablock]] = {}
         self.attachments: dict[PID, list[model.DownloadAttachment]] = {}
         self.instruments: dict[str, model.DownloadInstrument] = {}
@@ -205,7 +209,7 @@ class FakeScicatClient(ScicatClient):
         """Fetch a dataset from SciCat."""
         _ = strict_validation  # unused by fake
         try:
-            ds = self.main.datasets[pid].model_copy(deep=True)
+            ds = _copy_model(self.main.datasets[pid])
             if datablocks:
                 ds.origdatablocks = self.main.orig_datablocks.get(pid, [])
             if attachments:
@@ -214,6 +218,34 @@ class FakeScicatClient(ScicatClient):
         except KeyError:
             raise ScicatCommError(f"Unable to retrieve dataset {pid}") from None
 
+    @_conditionally_disabled
+    def query_datasets(
+        self,
+        fields: dict[str, Any],
+        *,
+        limit: int | None = None,
+        order: str | None = None,
+        strict_validation: bool = False,
+    ) -> list[model.DownloadDataset]:
+        """Query for datasets in SciCat."""
+        _ = strict_validation  # unused by fake
+        if limit is not None and order is None:
+            raise ValueError("`order` is required when `limit` is specified.")
+        found = self.main.datasets.query(fields)
+        if order is not None:
+            key, _, direction = order.partition(":")
+            found.sort(
+                # Datasets without the field go last in ascending order.
+                key=lambda ds: (
+                    (value := getattr(ds, key, None)) is None,
+                    0 if value is None else value,
+                ),
+                reverse=direction == "desc",
+            )
+        if limit is not None:
+            found = found[:limit]
+        return [_copy_model(ds) for ds in found]
+
     @_conditionally_disabled
     def get_instrument_model(
         self, instrument_id: str, strict_validation: bool = False
@@ -351,9 +383,179 @@ class FakeScicatClient(ScicatClient):
         )
 
 
+class DatasetStore(MutableMapping[PID, model.DownloadDataset]):
+    """Datasets of a :class:`FakeClient`.
+
+    This behaves like a :class:`dict` from PID to
+    :class:`scitacean.model.DownloadDataset` but additionally maintains indices
+    to look up datasets by owner group and proposal without scanning
+    all datasets.
+
+    Stored datasets must not be modified in place because the indices would
+    not be updated.
+    Assign a new model instead.
+    """
+
+    __slots__ = ("_by_owner_group", "_by_proposal", "_datasets")
+
+    def __init__(
+        self,
+        datasets: Mapping[PID, model.DownloadDataset]
+        | Iterable[tuple[PID, model.DownloadDataset]] = (),
+    ) -> None:
+        self._datasets: dict[PID, model.DownloadDataset] = {}
+        # Dicts with None values serve as ordered sets.
+        self._by_owner_group: dict[str, dict[PID, None]] = {}
+        self._by_proposal: dict[str, dict[PID, None]] = {}
+        self.update(datasets)
+
+    def __getitem__(self, pid: PID) -> model.DownloadDataset:
+        return self._datasets[pid]
+
+    def __setitem__(self, pid: PID, dataset: model.DownloadDataset) -> None:
+        if (old := self._datasets.get(pid)) is not None:
+            self._unindex(pid, old)
+        self._datasets[pid] = dataset
+        if dataset.ownerGroup is not None:
+            self._by_owner_group.setdefault(dataset.ownerGroup, {})[pid] = None
+        for proposal_id in dataset.proposalIds or ():
+            self._by_proposal.setdefault(proposal_id, {})[pid] = None
+
+    def __delitem__(self, pid: PID) -> None:
+        self._unindex(pid, self._datasets.pop(pid))
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self._datasets
+
+    def __iter__(self) -> Iterator[PID]:
+        return iter(self._datasets)
+
+    def __len__(self) -> int:
+        return len(self._datasets)
+
+    def __repr__(self) -> str:
+        return f"DatasetStore({self._datasets!r})"
+
+    def clear(self) -> None:
+        """Remove all datasets."""
+        self._datasets.clear()
+        self._by_owner_group.clear()
+        self._by_proposal.clear()
+
+    def by_owner_group(self, owner_group: str) -> list[model.DownloadDataset]:
+        """Return all datasets with the given owner group."""
+        return [
+            self._datasets[pid] for pid in self._by_owner_group.get(owner_group, ())
+        ]
+
+    def by_proposal(self, proposal_id: str) -> list[model.DownloadDataset]:
+        """Return all datasets that belong to the given proposal."""
+        return [self._datasets[pid] for pid in self._by_proposal.get(proposal_id, ())]
+
+    def query(self, fields: Mapping[str, Any]) -> list[model.DownloadDataset]:
+        """Return all datasets that match ``fields``.
+
+        Like in SciCat, a field matches if it is equal to the given value or
+        if it is a list that contains the given value.
+        The indices are used if ``fields`` contains ``ownerGroup``
+        or a single ``proposalIds``.
+
+        Parameters
+        ----------
+        fields:
+            Map from SciCat field names (e.g., ``"ownerGroup"``) to values.
+
+        Returns
+        -------
+        :
+            The matching datasets in insertion order.
+        """
+        if isinstance(owner_group := fields.get("ownerGroup"), str):
+            candidates = self.by_owner_group(owner_group)
+        elif isinstance(proposal_id := fields.get("proposalIds"), str):
+            candidates = self.by_proposal(proposal_id)
+        else:
+            candidates = list(self._datasets.values())
+        return [
+            dataset
+            for dataset in candidates
+            if all(
+                _field_matches(getattr(dataset, key, None), value)
+                for key, value in fields.items()
+            )
+        ]
+
+    def _unindex(self, pid: PID, dataset: model.DownloadDataset) -> None:
+        if dataset.ownerGroup is not None:
+            _discard_from_index(self._by_owner_group, dataset.ownerGroup, pid)
+        for proposal_id in dataset.proposalIds or ():
+            _discard_from_index(self._by_proposal, proposal_id, pid)
+
+
+def _discard_from_index(index: dict[str, dict[PID, None]], key: str, pid: PID) -> None:
+    pids = index.get(key)
+    if pids is not None:
+        pids.pop(pid, None)
+        if not pids:
+            del index[key]
+
+
+def _field_matches(stored: Any, wanted: Any) -> bool:
+    if stored == wanted:
+        return True
+    return (
+        isinstance(stored, list) and not isinstance(wanted, list) and wanted in stored
+    )
+
+
+# Values of these types are never modified and don't need to be copied.
+_IMMUTABLE_TYPES = frozenset(
+    (
+        bool,
+        bytes,
+        datetime.date,
+        datetime.datetime,
+        datetime.timedelta,
+        float,
+        int,
+        str,
+        type(None),
+        PID,
+        RemotePath,
+    )
+)
+
+_M = TypeVar("_M", bound=pydantic.BaseModel)
+
+
+def _copy_value(value: Any) -> Any:
+    # Much faster than deepcopy because immutable values are shared and
+    # the structure of models is known to be a tree.
+    typ = type(value)
+    if typ in _IMMUTABLE_TYPES:
+        return value
+    if typ is list:
+        return [_copy_value(v) for v in value]
+    if typ is dict:
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, pydantic.BaseModel):
+        return _copy_model(value)
+    return deepcopy(value)
+
+
+def _copy_model(mod: _M) -> _M:
+    return mod.model_copy(
+        update={
+            key: _copy_value(val)
+            for key, val in mod.__dict__.items()
+            if type(val) not in _IMMUTABLE_TYPES
+        }
+    )
+
+
 def _model_dict(mod: model.BaseModel) -> dict[str, Any]:
     return {
-        key: deepcopy(val)
+        key: _copy_value(val)
         for key in mod.__class__.model_fields.keys()
         if (val := getattr(mod, key)) is not None
     }
@@ -0,0 +1,523 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""In-process emulator of a SciCat server.
+
+:class:`ScicatEmulator` answers the HTTP requests that :class:`scitacean.Client`
+and :class:`scitacean.client.ScicatClient` send
+through an :class:`httpx.MockTransport`.
+In contrast to :class:`scitacean.testing.client.FakeClient`, requests go through
+the entire client stack including serialization, HTTP, and response parsing.
+And in contrast to :mod:`scitacean.testing.backend`, no Docker containers
+or network connections are needed.
+
+This makes the emulator suitable for load tests and for measuring the performance
+of the client, in particular together with artificial latency and injected errors.
+
+Important
+---------
+Like the :class:`scitacean.testing.client.FakeClient`, the emulator only
+approximates a real SciCat backend.
+Always also test against a real server.
+
+Examples
+--------
+Upload a dataset through the emulator with 20 ms latency per request:
+
+.. code-block:: python
+
+    from scitacean.testing.emulator import ScicatEmulator
+    from scitacean.testing.transfer import FakeFileTransfer
+
+    emulator = ScicatEmulator(latency=0.02)
+    client = emulator.client(file_transfer=FakeFileTransfer())
+    uploaded = client.upload_new_dataset_now(dataset)
+    assert uploaded.pid in emulator.datasets
+
+Make the next two requests to create a dataset fail:
+
+.. code-block:: python
+
+    from scitacean.testing.emulator import Fault
+
+    emulator.inject_fault(Fault(status_code=503, route="POST datasets"), count=2)
+
+Make 10% of all requests fail because of connection errors:
+
+.. code-block:: python
+
+    emulator = ScicatEmulator(
+        error_rate=0.1, error=Fault(exception=httpx.ConnectError), seed=1234
+    )
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import unquote
+
+import httpx
+import pydantic
+
+from .. import model
+from .._profile import Profile
+from ..client import Client, ScicatClient
+from ..pid import PID
+from ..typing import FileTransfer
+from .client import (
+    _process_attachment,
+    _process_dataset,
+    _process_orig_datablock,
+    _process_proposal,
+    _process_sample,
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Fault:
+    """An error that :class:`ScicatEmulator` produces instead of a response."""
+
+    status_code: int = 503
+    """HTTP status code of the error response."""
+    exception: type[httpx.TransportError] | None = None
+    """If set, raise this exception instead of returning an error response.
+
+    For example, use :class:`httpx.ConnectError` to emulate network errors.
+    """
+    route: str | None = None
+    """Only requests to this route fail.
+
+    Routes have the form ``"<METHOD> <path>"`` where ``<path>`` has
+    placeholders for IDs, e.g., ``"GET datasets/{pid}"`` or ``"POST origdatablocks"``.
+    See :attr:`ScicatEmulator.request_counts` for the names of all routes.
+    If ``None``, requests to any route fail.
+    """
+
+    def matches(self, route: str) -> bool:
+        """Return True if this fault applies to the given route."""
+        return self.route is None or self.route == route
+
+
+_Handler = Callable[["ScicatEmulator", httpx.Request, dict[str, str]], httpx.Response]
+
+
+class ScicatEmulator:
+    """Emulates a SciCat server in the current process.
+
+    The emulator stores the same models as
+    :class:`scitacean.testing.client.FakeClient`, namely
+
+    - ``ScicatEmulator.datasets``:
+            :class:`dict` of :class:`scitacean.model.DownloadDataset`,
+            indexed by dataset PID.
+    - ``ScicatEmulator.orig_datablocks``:
+            :class:`dict` of lists of :class:`scitacean.model.DownloadOrigDatablock`,
+            indexed by the *dataset* ID.
+    - ``ScicatEmulator.attachments``:
+            :class:`dict` of lists of :class:`scitacean.model.DownloadAttachment`,
+            indexed by the *dataset* ID.
+    - ``ScicatEmulator.instruments``, ``ScicatEmulator.proposals``,
+      ``ScicatEmulator.samples``:
+            :class:`dict` of the respective download models, indexed by their ID.
+
+    Requests are handled in the thread that sends them.
+    So concurrent requests are handled concurrently, including their latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str = "https://scicat.emulator/api",
+        latency: float | Callable[[httpx.Request], float] = 0.0,
+        error_rate: float = 0.0,
+        error: Fault | None = None,
+        seed: int | None = None,
+        users: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize an emulator with empty storage.
+
+        Parameters
+        ----------
+        url:
+            URL of the emulated API.
+            Only requests to this URL are handled.
+        latency:
+            Time in seconds that every request takes in addition to processing.
+            Can be a function of the request, e.g., to add jitter.
+        error_rate:
+            Probability that a request fails with ``error``.
+        error:
+            The error produced for a fraction ``error_rate`` of requests.
+            Defaults to a 503 response.
+        seed:
+            Seed for the random number generator that selects failing requests.
+        users:
+            Usernames and passwords that can log in.
+            If ``None``, any credentials are accepted.
+        """
+        self.url = url.rstrip("/")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error = Fault() if error is None else error
+        self.users = users
+
+        self.datasets: dict[PID, model.DownloadDataset] = {}
+        self.orig_datablocks: dict[PID, list[model.DownloadOrigDatablock]] = {}
+        self.attachments: dict[PID, list[model.DownloadAttachment]] = {}
+        self.instruments: dict[str, model.DownloadInstrument] = {}
+        self.proposals: dict[str, model.DownloadProposal] = {}
+        self.samples: dict[str, model.DownloadSample] = {}
+
+        self.request_counts: Counter[str] = Counter()
+        """Number of handled requests per route, including failed ones."""
+
+        self._base_path = httpx.URL(self.url).path.rstrip("/")
+        self._rng = random.Random(seed)  # noqa: S311
+        self._faults: deque[Fault] = deque()
+        self._tokens: set[str] = set()
+        self._lock = threading.RLock()
+
+    def transport(self) -> httpx.MockTransport:
+        """Return a new transport that sends requests to this emulator."""
+        return httpx.MockTransport(self.handle_request)
+
+    def issue_token(self) -> str:
+        """Return a new token that the emulator accepts."""
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._tokens.add(token)
+        return token
+
+    def scicat_client(self, *, authenticated: bool = True) -> ScicatClient:
+        """Return a low-level client that is connected to this emulator.
+
+        Parameters
+        ----------
+        authenticated:
+            If ``True``, the client uses a new token issued by the emulator.
+            Otherwise, the client is not logged in.
+        """
+        if authenticated:
+            return ScicatClient.from_token(
+                url=self.url, token=self.issue_token(), transport=self.transport()
+            )
+        return ScicatClient.without_login(url=self.url, transport=self.transport())
+
+    def client(
+        self,
+        *,
+        file_transfer: FileTransfer | None = None,
+        authenticated: bool = True,
+    ) -> Client:
+        """Return a client that is connected to this emulator.
+
+        Parameters
+        ----------
+        file_transfer:
+            Handler for down-/uploads of files.
+        authenticated:
+            If ``True``, the client uses a new token issued by the emulator.
+            Otherwise, the client is not logged in.
+        """
+        return Client(
+            client=self.scicat_client(authenticated=authenticated),
+            file_transfer=file_transfer,
+            profile=Profile(url=self.url, file_transfer=file_transfer),
+        )
+
+    def inject_fault(self, fault: Fault, *, count: int = 1) -> None:
+        """Make the next ``count`` requests that match ``fault.route`` fail.
+
+        Injected faults are used in addition to the random errors
+        configured by ``error_rate``.
+        """
+        with self._lock:
+            self._faults.extend([fault] * count)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Handle a single HTTP request."""
+        handler, route, path_params = self._route(request)
+        latency = self.latency(request) if callable(self.latency) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+
+        with self._lock:
+            self.request_counts[route] += 1
+            fault = self._take_fault(route)
+        if fault is not None:
+            if fault.exception is not None:
+                raise fault.exception(f"Emulated error in {route}", request=request)
+            return _error_response(fault.status_code, f"Emulated error in {route}")
+
+        if handler is None:
+            return _error_response(404, f"Cannot {request.method} {request.url.path}")
+        if (denied := self._check_authorization(request, route)) is not None:
+            return denied
+        try:
+            with self._lock:
+                return handler(self, request, path_params)
+        except pydantic.ValidationError as exc:
+            return _error_response(400, str(exc))
+
+    def _take_fault(self, route: str) -> Fault | None:
+        for i, fault in enumerate(self._faults):
+            if fault.matches(route):
+                del self._faults[i]
+                return fault
+        if self.error_rate > 0 and self.error.matches(route):
+            if self._rng.random() < self.error_rate:
+                return self.error
+        return None
+
+    def _route(
+        self, request: httpx.Request
+    ) -> tuple[_Handler | None, str, dict[str, str]]:
+        # raw_path keeps escaped slashes in PIDs intact.
+        path = request.url.raw_path.decode("ascii").partition("?")[0]
+        if request.method == "POST" and path.endswith(("/auth/login", "/auth/msad")):
+            return _log_in, f"POST auth/{path.rsplit('/', 1)[-1]}", {}
+        if not path.startswith(self._base_path + "/"):
+            return None, f"{request.method} <unknown>", {}
+        path = _VERSION_PREFIX.sub("", path[len(self._base_path) + 1 :])
+        for method, pattern, route, handler in _ROUTES:
+            if method == request.method and (match := pattern.fullmatch(path)):
+                params = {key: unquote(val) for key, val in match.groupdict().items()}
+                return handler, route, params
+        return None, f"{request.method} <unknown>", {}
+
+    def _check_authorization(
+        self, request: httpx.Request, route: str
+    ) -> httpx.Response | None:
+        if route.startswith("POST auth/"):
+            return None
+        authorization = request.headers.get("Authorization")
+        if authorization is None:
+            if request.method == "GET":
+                return None
+            return _error_response(401, "Unauthorized")
+        token = authorization.removeprefix("Bearer ")
+        with self._lock:
+            if token not in self._tokens:
+                return _error_response(401, "Unauthorized")
+        return None
+
+
+def _error_response(status_code: int, message: str) -> httpx.Response:
+    return httpx.Response(
+        status_code, json={"statusCode": status_code, "message": message}
+    )
+
+
+def _json_response(content: Any, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, json=content)
+
+
+def _dump(mod: pydantic.BaseModel) -> dict[str, Any]:
+    return mod.model_dump(mode="json", exclude_none=True)
+
+
+def _log_in(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    credentials = json.loads(request.content)
+    if emulator.users is not None and (
+        emulator.users.get(credentials.get("username")) != credentials.get("password")
+    ):
+        return _error_response(401, "Unauthorized")
+    token = emulator.issue_token()
+    if request.url.path.endswith("/auth/msad"):
+        return _json_response({"access_token": token})
+    return _json_response({"id": token})
+
+
+def _get_dataset(
+    emulator: ScicatEmulator, request: httpx.Request, params: dict[str, str]
+) -> httpx.Response:
+    return _dataset_response(emulator, request, params["pid"], public_only=False)
+
+
+def _get_public_dataset(
+    emulator: ScicatEmulator, request: httpx.Request, params: dict[str, str]
+) -> httpx.Response:
+    return _dataset_response(emulator, request, params["pid"], public_only=True)
+
+
+def _dataset_response(
+    emulator: ScicatEmulator, request: httpx.Request, pid_str: str, public_only: bool
+) -> httpx.Response:
+    pid = PID.parse(pid_str)
+    dataset = emulator.datasets.get(pid)
+    if dataset is None:
+        return _error_response(404, f"Dataset {pid} not found")
+    if public_only and not dataset.isPublished:
+        return _error_response(403, f"Dataset {pid} is not public")
+    content = _dump(dataset)
+    include = request.url.params.get_list("include")
+    if "origdatablocks" in include:
+        content["origdatablocks"] = [
+            _dump(dblock) for dblock in emulator.orig_datablocks.get(pid, [])
+        ]
+    if "attachments" in include:
+        content["attachments"] = [
+            _dump(attachment) for attachment in emulator.attachments.get(pid, [])
+        ]
+    return _json_response(content)
+
+
+def _query_datasets(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    fields = json.loads(request.url.params.get("fields", "{}"))
+    limits = json.loads(request.url.params.get("limits", "{}"))
+    found = [
+        content
+        for content in map(_dump, emulator.datasets.values())
+        if all(content.get(key) == value for key, value in fields.items())
+    ]
+    if (order := limits.get("order")) is not None:
+        key, _, direction = order.partition(":")
+        found.sort(
+            # Datasets without the field go last in ascending order.
+            key=lambda content: (key not in content, content.get(key, 0)),
+            reverse=direction == "desc",
+        )
+    if (limit := limits.get("limit")) is not None:
+        found = found[: int(limit)]
+    return _json_response(found)
+
+
+def _create_dataset(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    dataset = _process_dataset(model.UploadDataset.model_validate_json(request.content))
+    pid: PID = dataset.pid  # type: ignore[assignment]
+    emulator.datasets[pid] = dataset
+    return _json_response(_dump(dataset), status_code=201)
+
+
+def _validate_dataset(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    try:
+        model.UploadDataset.model_validate_json(request.content)
+    except pydantic.ValidationError:
+        return _json_response({"valid": False})
+    return _json_response({"valid": True})
+
+
+def _create_orig_datablock(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    upload = model.UploadOrigDatablock.model_validate_json(request.content)
+    if (dataset := emulator.datasets.get(upload.datasetId)) is None:
+        return _error_response(404, f"Dataset {upload.datasetId} not found")
+    dblock = _process_orig_datablock(upload, dataset)
+    emulator.orig_datablocks.setdefault(upload.datasetId, []).append(dblock)
+    return _json_response(_dump(dblock), status_code=201)
+
+
+def _create_attachment(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    attachment = _process_attachment(
+        model.UploadAttachment.model_validate_json(request.content)
+    )
+    relationships = attachment.relationships or []
+    if len(relationships) != 1:
+        return _error_response(400, "Expected exactly one attachment relationship")
+    dataset_id = PID.parse(relationships[0].targetId)
+    if dataset_id not in emulator.datasets:
+        return _error_response(404, f"Dataset {dataset_id} not found")
+    emulator.attachments.setdefault(dataset_id, []).append(attachment)
+    return _json_response(_dump(attachment), status_code=201)
+
+
+def _get_instrument(
+    emulator: ScicatEmulator, request: httpx.Request, params: dict[str, str]
+) -> httpx.Response:
+    if (instrument := emulator.instruments.get(params["id"])) is None:
+        return _error_response(404, f"Instrument {params['id']} not found")
+    return _json_response(_dump(instrument))
+
+
+def _get_all_instruments(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    return _json_response([_dump(i) for i in emulator.instruments.values()])
+
+
+def _get_proposal(
+    emulator: ScicatEmulator, request: httpx.Request, params: dict[str, str]
+) -> httpx.Response:
+    if (proposal := emulator.proposals.get(params["id"])) is None:
+        return _error_response(404, f"Proposal {params['id']} not found")
+    return _json_response(_dump(proposal))
+
+
+def _create_proposal(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    proposal = _process_proposal(
+        model.UploadProposal.model_validate_json(request.content)
+    )
+    proposal_id: str = proposal.proposalId  # type: ignore[assignment]
+    if proposal_id in emulator.proposals:
+        return _error_response(409, f"Proposal {proposal_id} already exists")
+    emulator.proposals[proposal_id] = proposal
+    return _json_response(_dump(proposal), status_code=201)
+
+
+def _get_sample(
+    emulator: ScicatEmulator, request: httpx.Request, params: dict[str, str]
+) -> httpx.Response:
+    if (sample := emulator.samples.get(params["id"])) is None:
+        return _error_response(404, f"Sample {params['id']} not found")
+    return _json_response(_dump(sample))
+
+
+def _create_sample(
+    emulator: ScicatEmulator, request: httpx.Request, _params: dict[str, str]
+) -> httpx.Response:
+    sample = _process_sample(model.UploadSample.model_validate_json(request.content))
+    sample_id: str = sample.sampleId  # type: ignore[assignment]
+    if sample_id in emulator.samples:
+        return _error_response(409, f"Sample {sample_id} already exists")
+    emulator.samples[sample_id] = sample
+    return _json_response(_dump(sample), status_code=201)
+
+
+_VERSION_PREFIX = re.compile(r"^v\d+/")
+
+# (method, path pattern, route name, handler)
+# The more specific patterns must come first.
+_ROUTES: list[tuple[str, re.Pattern[str], str, _Handler]] = [
+    (method, re.compile(pattern), f"{method} {name}", handler)
+    for method, pattern, name, handler in (
+        ("GET", r"datasets/fullquery", "datasets/fullquery", _query_datasets),
+        (
+            "GET",
+            r"datasets/public/(?P<pid>[^/]+)",
+            "datasets/public/{pid}",
+            _get_public_dataset,
+        ),
+        ("GET", r"datasets/(?P<pid>[^/]+)", "datasets/{pid}", _get_dataset),
+        ("POST", r"datasets/isValid", "datasets/isValid", _validate_dataset),
+        ("POST", r"datasets", "datasets", _create_dataset),
+        ("POST", r"origdatablocks", "origdatablocks", _create_orig_datablock),
+        ("POST", r"attachments", "attachments", _create_attachment),
+        ("GET", r"instruments", "instruments", _get_all_instruments),
+        ("GET", r"instruments/(?P<id>[^/]+)", "instruments/{id}", _get_instrument),
+        ("GET", r"proposals/(?P<id>[^/]+)", "proposals/{id}", _get_proposal),
+        ("POST", r"proposals", "proposals", _create_proposal),
+        ("GET", r"samples/(?P<id>[^/]+)", "samples/{id}", _get_sample),
+        ("POST", r"samples", "samples", _create_sample),
+    )
+]
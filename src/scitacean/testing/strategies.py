@@ -36,8 +36,13 @@ from email_validator import EmailNotValidError, ValidatedEmail, validate_email
 from hypothesis import strategies as st
 
 from .. import Dataset, RemotePath, model
+from .._hypothesis import _hypothesis_setup_hook
 from .._internal.orcid import orcid_id_checksum
 
+# Make sure that strategies for Scitacean types are registered even if
+# Scitacean was imported before Hypothesis and the entry point is not installed.
+_hypothesis_setup_hook()
+
 
 # email_validator and by extension pydantic is more picky than hypothesis
 # so make sure that generated emails actually pass model validation.
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
 """Fake file transfer."""
 
+import os
 from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
 from pathlib import Path
@@ -33,6 +34,9 @@ class FakeDownloadConnection:
     def download_file(self, *, remote: RemotePath, local: Path) -> None:
         """Download a single file."""
         if self.fs is not None:
+            # Overwrite existing files like real file transfers do.
+            if self.fs.exists(local):
+                self.fs.remove(os.fspath(local))
             self.fs.create_file(local, contents=self.files[remote])
         else:
             with open(local, "wb") as f:
@@ -13,7 +13,7 @@ from ..dataset import Dataset
 from ..error import FileNotAccessibleError, FileUploadError
 from ..file import File
 from ..filesystem import RemotePath
-from ..logging import get_logger
+from ..logging import _file_log_level, get_logger
 from ._util import source_folder_for
 
 
@@ -34,11 +34,8 @@ class CopyDownloadConnection:
 
     def download_file(self, *, remote: RemotePath, local: Path) -> None:
         """Download a file from the given remote path."""
-        get_logger().info(
-            "Copying file %s to %s",
-            remote,
-            local,
-        )
+        if (level := _file_log_level()) is not None:
+            get_logger().log(level, "Copying file %s to %s", remote.posix, local)
         remote_path = Path(remote.posix)
         if not remote_path.exists():
             raise FileNotAccessibleError(
@@ -104,11 +101,10 @@ class CopyUploadConnection:
                 f"File already exists at {remote_path}."
             )
 
-        get_logger().info(
-            "Copying file %s to %s",
-            file.local_path,
-            remote_path,
-        )
+        if (level := _file_log_level()) is not None:
+            get_logger().log(
+                level, "Copying file %s to %s", file.local_path, remote_path.posix
+            )
         if self._hard_link:
             os.link(src=file.local_path, dst=remote_path.posix)
         else:
@@ -10,7 +10,7 @@ from ..dataset import Dataset
 from ..error import FileNotAccessibleError
 from ..file import File
 from ..filesystem import RemotePath
-from ..logging import get_logger
+from ..logging import _file_log_level, get_logger
 from ._util import source_folder_for
 
 
@@ -28,11 +28,8 @@ class LinkDownloadConnection:
 
     def download_file(self, *, remote: RemotePath, local: Path) -> None:
         """Download a file from the given remote path."""
-        get_logger().info(
-            "Linking file %s to %s",
-            remote,
-            local,
-        )
+        if (level := _file_log_level()) is not None:
+            get_logger().log(level, "Linking file %s to %s", remote.posix, local)
         remote_path = Path(remote.posix)
         if not remote_path.exists():
             raise FileNotAccessibleError(
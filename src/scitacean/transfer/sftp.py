@@ -14,7 +14,7 @@ from ..dataset import Dataset
 from ..error import FileNotAccessibleError, FileUploadError
 from ..file import File
 from ..filesystem import RemotePath
-from ..logging import get_logger
+from ..logging import _file_log_level, get_logger
 from ..util.credentials import SecretStr, StrStorage
 from ._util import source_folder_for
 
@@ -37,12 +37,14 @@ class SFTPDownloadConnection:
 
     def download_file(self, *, remote: RemotePath, local: Path) -> None:
         """Download a file from the given remote path."""
-        get_logger().info(
-            "Downloading file %s from host %s to %s",
-            remote,
-            self._host,
-            local,
-        )
+        if (level := _file_log_level()) is not None:
+            get_logger().log(
+                level,
+                "Downloading file %s from host %s to %s",
+                remote.posix,
+                self._host,
+                local,
+            )
         try:
             self._sftp_client.get(remotepath=remote.posix, localpath=os.fspath(local))
         except FileNotFoundError:
@@ -104,12 +106,14 @@ class SFTPUploadConnection:
                 f"Refusing to upload file{file.local_path}: "
                 f"File already exists at {remote_path}."
             )
-        get_logger().info(
-            "Uploading file %s to %s on host %s",
-            file.local_path,
-            remote_path,
-            self._host,
-        )
+        if (level := _file_log_level()) is not None:
+            get_logger().log(
+                level,
+                "Uploading file %s to %s on host %s",
+                file.local_path,
+                remote_path.posix,
+                self._host,
+            )
         st = self._sftp_client.put(
             remotepath=remote_path.posix, localpath=os.fspath(file.local_path)
         )
@@ -0,0 +1,546 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Background queue for uploading and downloading datasets.
+
+The :class:`TransferQueue` runs uploads and downloads on a pool of worker threads
+and records the state of every job in a local SQLite database.
+
+Examples
+--------
+Hand off uploads and continue with other work:
+
+.. code-block:: python
+
+    from scitacean.transfer_queue import TransferQueue
+
+    with TransferQueue(client, database="transfers.sqlite") as queue:
+        future = queue.submit_upload(dataset)
+        ...  # do other work
+        uploaded = future.result()
+
+After a restart, continue the jobs that had not finished:
+
+.. code-block:: python
+
+    with TransferQueue(client, database="transfers.sqlite") as queue:
+        futures = queue.resume()
+"""
+
+from __future__ import annotations
+
+import array
+import dataclasses
+import io
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from datetime import UTC, date, datetime, timedelta, timezone
+from pathlib import Path, PosixPath, PurePosixPath, PureWindowsPath, WindowsPath
+from typing import Any, Literal, Self, cast
+
+from .client import Client, FileSelector
+from .dataset import Dataset
+from .logging import get_logger
+
+JobKind = Literal["upload", "download"]
+JobState = Literal["queued", "running", "done", "failed"]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Job:
+    """Record of a job in a :class:`TransferQueue`."""
+
+    id: int
+    """Unique ID of the job in the database."""
+    kind: JobKind
+    state: JobState
+    dataset_id: str | None
+    """PID of the input dataset.
+
+    ``None`` for uploads because new datasets do not have a PID yet.
+    """
+    result_id: str | None
+    """PID of the uploaded or downloaded dataset once the job is done."""
+    error: str | None
+    """Error message if the job failed."""
+    created_at: datetime
+    updated_at: datetime
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    state TEXT NOT NULL,
+    dataset_id TEXT,
+    result_id TEXT,
+    error TEXT,
+    payload BLOB,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    owner TEXT,
+    lease_expires_at REAL
+)
+"""
+
+_JOB_COLUMNS = "id, kind, state, dataset_id, result_id, error, created_at, updated_at"
+
+
+class TransferQueue:
+    """Run uploads and downloads in the background.
+
+    Jobs are executed by a pool of worker threads.
+    Their state (``queued``, ``running``, ``done``, or ``failed``) is stored in
+    a SQLite database such that it survives restarts of the program.
+
+    Multiple queues, also in different processes, can share a database.
+    Each queue holds a lease on the jobs that it has scheduled and renews it
+    in the background while it is alive.
+    Jobs whose lease has expired, e.g., because the program that scheduled them
+    stopped, are recovered when a queue is opened or :meth:`TransferQueue.resume`
+    is called:
+
+    - Downloads are marked as ``queued`` because they can be repeated safely.
+    - Uploads are marked as ``failed`` because they may have partially
+      succeeded and repeating them could create duplicate datasets.
+      Check the SciCat server and the file server before re-submitting them.
+
+    Queued jobs are not started automatically, call :meth:`TransferQueue.resume`
+    to run them.
+    Each job is claimed by exactly one queue, so it runs at most once even if
+    multiple queues resume jobs at the same time.
+
+    Use the queue as a context manager or call :meth:`TransferQueue.shutdown`
+    when done.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        database: str | Path,
+        max_workers: int | None = None,
+        lease_duration: timedelta | None = None,
+    ) -> None:
+        """Initialize a queue.
+
+        Parameters
+        ----------
+        client:
+            Used to perform all uploads and downloads.
+        database:
+            Path to the SQLite database file.
+            It is created if it does not exist.
+        max_workers:
+            Maximum number of jobs that run at the same time.
+            Defaults to the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+        lease_duration:
+            Time after which other queues consider the jobs of this queue abandoned
+            unless this queue renews its lease.
+            The lease is renewed every third of this duration.
+            Defaults to one minute.
+        """
+        self._client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scitacean-transfer"
+        )
+        self._database = Path(database)
+        self._owner = uuid.uuid4().hex
+        self._lease_duration = (
+            timedelta(minutes=1) if lease_duration is None else lease_duration
+        ).total_seconds()
+        with self._connect() as db:
+            db.execute(_SCHEMA)
+        self._recover_interrupted_jobs()
+
+        self._stopped = threading.Event()
+        self._heartbeat = threading.Thread(
+            target=self._renew_leases,
+            name="scitacean-transfer-lease",
+            daemon=True,
+        )
+        self._heartbeat.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown(wait=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads.
+
+        Parameters
+        ----------
+        wait:
+            If ``True``, wait for all running and queued jobs to finish.
+            Otherwise, queued jobs that have not started remain ``queued``
+            in the database and can be resumed later.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        self._stopped.set()
+        self._heartbeat.join()
+        # Allow other queues to resume the jobs that were cancelled.
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET owner = NULL, lease_expires_at = NULL "
+                "WHERE owner = ? AND state = 'queued'",
+                (self._owner,),
+            )
+
+    def submit_upload(
+        self,
+        dataset: Dataset,
+        *,
+        callback: Callable[[Job], None] | None = None,
+    ) -> Future[Dataset]:
+        """Schedule a dataset for upload.
+
+        Parameters
+        ----------
+        dataset:
+            Passed to :meth:`scitacean.Client.upload_new_dataset_now`.
+        callback:
+            Called with the final job record when the job is done or failed.
+            Runs in the worker thread.
+
+        Returns
+        -------
+        :
+            A future that resolves to the uploaded dataset.
+        """
+        return self._submit("upload", dataset, {}, callback)
+
+    def submit_download(
+        self,
+        dataset: Dataset,
+        *,
+        target: str | Path,
+        select: FileSelector = True,
+        checksum_algorithm: str | None = None,
+        force: bool = False,
+        callback: Callable[[Job], None] | None = None,
+    ) -> Future[Dataset]:
+        """Schedule files of a dataset for download.
+
+        Parameters
+        ----------
+        dataset:
+            Passed to :meth:`scitacean.Client.download_files`.
+        target:
+            Passed to :meth:`scitacean.Client.download_files`.
+        select:
+            Passed to :meth:`scitacean.Client.download_files`.
+            If this is a callable, the job cannot be resumed after a restart.
+        checksum_algorithm:
+            Passed to :meth:`scitacean.Client.download_files`.
+        force:
+            Passed to :meth:`scitacean.Client.download_files`.
+        callback:
+            Called with the final job record when the job is done or failed.
+            Runs in the worker thread.
+
+        Returns
+        -------
+        :
+            A future that resolves to the dataset with downloaded files.
+        """
+        kwargs = {
+            "target": str(target),
+            "select": select,
+            "checksum_algorithm": checksum_algorithm,
+            "force": force,
+        }
+        return self._submit("download", dataset, kwargs, callback)
+
+    def resume(
+        self, *, callback: Callable[[Job], None] | None = None
+    ) -> dict[int, Future[Dataset]]:
+        """Run all queued jobs that are not scheduled by any live queue.
+
+        Jobs whose inputs could not be stored or loaded are marked as ``failed``.
+
+        Parameters
+        ----------
+        callback:
+            Called with the final job record of each resumed job.
+
+        Returns
+        -------
+        :
+            Futures of the resumed jobs indexed by job ID.
+        """
+        self._recover_interrupted_jobs()
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT id, kind, payload FROM jobs "
+                "WHERE state = 'queued' AND owner IS NULL ORDER BY id"
+            ).fetchall()
+        futures = {}
+        for job_id, kind, payload in rows:
+            if not self._claim(job_id):
+                continue  # Claimed by another queue in the meantime.
+            if payload is None:
+                self._set_state(
+                    job_id, "failed", error="The job inputs could not be stored."
+                )
+                continue
+            try:
+                dataset, kwargs = _load_payload(payload)
+            except Exception as exc:
+                self._set_state(
+                    job_id,
+                    "failed",
+                    error=f"The job inputs could not be loaded: {exc}",
+                )
+                continue
+            futures[job_id] = self._schedule(job_id, kind, dataset, kwargs, callback)
+        return futures
+
+    def job(self, job_id: int) -> Job:
+        """Return the current record of a job."""
+        with self._connect() as db:
+            row = db.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?",  # noqa: S608
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No job with ID {job_id}")
+        return _job_from_row(row)
+
+    def jobs(self, state: JobState | None = None) -> list[Job]:
+        """Return the records of all jobs, optionally only those in a given state."""
+        query = f"SELECT {_JOB_COLUMNS} FROM jobs"  # noqa: S608
+        params: tuple[str, ...] = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._connect() as db:
+            rows = db.execute(query + " ORDER BY id", params).fetchall()
+        return [_job_from_row(row) for row in rows]
+
+    def _connect(self) -> AbstractContextManager[sqlite3.Connection]:
+        return _connect(self._database)
+
+    def _submit(
+        self,
+        kind: JobKind,
+        dataset: Dataset,
+        kwargs: dict[str, Any],
+        callback: Callable[[Job], None] | None,
+    ) -> Future[Dataset]:
+        try:
+            payload: bytes | None = pickle.dumps((dataset, kwargs))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            payload = None
+        now = _now()
+        with self._connect() as db:
+            job_id = cast(
+                int,
+                db.execute(
+                    "INSERT INTO jobs "
+                    "(kind, state, dataset_id, payload, created_at, updated_at, "
+                    "owner, lease_expires_at) "
+                    "VALUES (?, 'queued', ?, ?, ?, ?, ?, ?)",
+                    (
+                        kind,
+                        _pid_str(dataset),
+                        payload,
+                        now,
+                        now,
+                        self._owner,
+                        self._lease_expiry(),
+                    ),
+                ).lastrowid,
+            )
+        return self._schedule(job_id, kind, dataset, kwargs, callback)
+
+    def _claim(self, job_id: int) -> bool:
+        # Atomically take ownership of a queued job that has no owner.
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET owner = ?, lease_expires_at = ? "
+                "WHERE id = ? AND state = 'queued' AND owner IS NULL",
+                (self._owner, self._lease_expiry(), job_id),
+            )
+        return cursor.rowcount == 1
+
+    def _schedule(
+        self,
+        job_id: int,
+        kind: JobKind,
+        dataset: Dataset,
+        kwargs: dict[str, Any],
+        callback: Callable[[Job], None] | None,
+    ) -> Future[Dataset]:
+        return self._executor.submit(self._run, job_id, kind, dataset, kwargs, callback)
+
+    def _run(
+        self,
+        job_id: int,
+        kind: JobKind,
+        dataset: Dataset,
+        kwargs: dict[str, Any],
+        callback: Callable[[Job], None] | None,
+    ) -> Dataset:
+        if not self._start(job_id):
+            raise RuntimeError(
+                f"Transfer job {job_id} was taken over by another queue "
+                "because the lease of this queue expired."
+            )
+        try:
+            if kind == "upload":
+                result = self._client.upload_new_dataset_now(dataset)
+            else:
+                result = self._client.download_files(dataset, **kwargs)
+        except Exception as exc:
+            get_logger().error("Transfer job %d (%s) failed: %s", job_id, kind, exc)
+            self._set_state(job_id, "failed", error=f"{type(exc).__name__}: {exc}")
+            self._notify(job_id, callback)
+            raise
+        self._set_state(job_id, "done", result_id=_pid_str(result))
+        self._notify(job_id, callback)
+        return result
+
+    def _start(self, job_id: int) -> bool:
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET state = 'running', updated_at = ? "
+                "WHERE id = ? AND state = 'queued' AND owner = ?",
+                (_now(), job_id, self._owner),
+            )
+        return cursor.rowcount == 1
+
+    def _notify(self, job_id: int, callback: Callable[[Job], None] | None) -> None:
+        if callback is not None:
+            callback(self.job(job_id))
+
+    def _set_state(
+        self,
+        job_id: int,
+        state: JobState,
+        *,
+        error: str | None = None,
+        result_id: str | None = None,
+    ) -> None:
+        with self._connect() as db:
+            # Finished jobs are no longer owned by any queue.
+            db.execute(
+                "UPDATE jobs SET state = ?, error = ?, result_id = ?, updated_at = ?, "
+                "owner = NULL, lease_expires_at = NULL "
+                "WHERE id = ?",
+                (state, error, result_id, _now(), job_id),
+            )
+
+    def _lease_expiry(self) -> float:
+        return time.time() + self._lease_duration
+
+    def _renew_leases(self) -> None:
+        while not self._stopped.wait(self._lease_duration / 3):
+            with self._connect() as db:
+                db.execute(
+                    "UPDATE jobs SET lease_expires_at = ? "
+                    "WHERE owner = ? AND state IN ('queued', 'running')",
+                    (self._lease_expiry(), self._owner),
+                )
+
+    def _recover_interrupted_jobs(self) -> None:
+        # Only recover jobs whose owner stopped renewing its lease.
+        now = _now()
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET state = 'failed', error = ?, updated_at = ?, "
+                "owner = NULL, lease_expires_at = NULL "
+                "WHERE state = 'running' AND kind = 'upload' "
+                "AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+                (
+                    "Interrupted, the upload may have partially succeeded.",
+                    now,
+                    time.time(),
+                ),
+            )
+            db.execute(
+                "UPDATE jobs SET state = 'queued', updated_at = ?, "
+                "owner = NULL, lease_expires_at = NULL "
+                "WHERE (state = 'running' OR (state = 'queued' AND owner IS NOT NULL)) "
+                "AND (lease_expires_at IS NULL OR lease_expires_at < ?)",
+                (now, time.time()),
+            )
+
+
+@contextmanager
+def _connect(database: Path) -> Iterator[sqlite3.Connection]:
+    # Each operation uses its own connection such that worker threads
+    # do not share connections.
+    db = sqlite3.connect(database, timeout=30, isolation_level=None)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _job_from_row(row: tuple[Any, ...]) -> Job:
+    job_id, kind, state, dataset_id, result_id, error, created_at, updated_at = row
+    return Job(
+        id=job_id,
+        kind=kind,
+        state=state,
+        dataset_id=dataset_id,
+        result_id=result_id,
+        error=error,
+        created_at=datetime.fromisoformat(created_at),
+        updated_at=datetime.fromisoformat(updated_at),
+    )
+
+
+# Only these globals may be loaded from payloads in addition to classes
+# defined by Scitacean to prevent the execution of arbitrary code.
+_ALLOWED_PAYLOAD_GLOBALS = {
+    ("array", "_array_reconstructor"): array._array_reconstructor,  # type: ignore[attr-defined]
+    ("array", "array"): array.array,
+    ("builtins", "bytearray"): bytearray,
+    ("builtins", "frozenset"): frozenset,
+    ("builtins", "set"): set,
+    ("datetime", "date"): date,
+    ("datetime", "datetime"): datetime,
+    ("datetime", "timedelta"): timedelta,
+    ("datetime", "timezone"): timezone,
+    ("pathlib", "Path"): Path,
+    ("pathlib", "PosixPath"): PosixPath,
+    ("pathlib", "PurePosixPath"): PurePosixPath,
+    ("pathlib", "PureWindowsPath"): PureWindowsPath,
+    ("pathlib", "WindowsPath"): WindowsPath,
+    ("re", "_compile"): re._compile,  # type: ignore[attr-defined]
+}
+
+
+class _PayloadUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (allowed := _ALLOWED_PAYLOAD_GLOBALS.get((module, name))) is not None:
+            return allowed
+        if module == "scitacean" or module.startswith("scitacean."):
+            cls = super().find_class(module, name)
+            if isinstance(cls, type):
+                return cls
+        raise pickle.UnpicklingError(f"Forbidden global in job inputs: {module}.{name}")
+
+
+def _load_payload(payload: bytes) -> tuple[Dataset, dict[str, Any]]:
+    dataset, kwargs = _PayloadUnpickler(io.BytesIO(payload)).load()
+    if not isinstance(dataset, Dataset) or not isinstance(kwargs, dict):
+        raise TypeError("Malformed job inputs")
+    return dataset, kwargs
+
+
+def _pid_str(dataset: Dataset) -> str | None:
+    return None if dataset.pid is None else str(dataset.pid)
+
+
+def _now() -> str:
+    return datetime.now(tz=UTC).isoformat()
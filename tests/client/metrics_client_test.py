@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+import re
+
+import httpx
+import pytest
+
+from scitacean import ScicatCommError
+from scitacean.model import DownloadInstrument, UploadSample
+from scitacean.testing.emulator import Fault, ScicatEmulator
+
+
+@pytest.fixture
+def emulator() -> ScicatEmulator:
+    emulator = ScicatEmulator()
+    emulator.instruments["inst/1"] = DownloadInstrument(
+        pid="inst/1", uniqueName="hex", name="Hex"
+    )
+    return emulator
+
+
+def test_metrics_are_empty_initially(emulator: ScicatEmulator) -> None:
+    assert emulator.scicat_client().metrics() == {}
+
+
+def test_metrics_count_calls_per_operation(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    for _ in range(3):
+        client.get_instrument_model("inst/1")
+    client.get_all_instrument_models()
+
+    metrics = client.metrics()
+    assert list(metrics) == ["get_all_instrument_models", "get_instrument_model"]
+    instrument = metrics["get_instrument_model"]
+    assert instrument.operation == "get_instrument_model"
+    assert instrument.count == 3
+    assert instrument.error_count == 0
+    assert metrics["get_all_instrument_models"].count == 1
+
+
+def test_metrics_record_latency(emulator: ScicatEmulator) -> None:
+    emulator.latency = 0.01
+    client = emulator.scicat_client()
+    client.get_instrument_model("inst/1")
+    client.get_instrument_model("inst/1")
+
+    metrics = client.metrics()["get_instrument_model"]
+    assert metrics.latency_p50 >= 0.01
+    assert metrics.latency_p50 <= metrics.latency_p90 <= metrics.latency_p99
+    assert metrics.latency_p99 <= metrics.latency_max
+    assert metrics.latency_sum >= 0.02
+    assert metrics.latency_mean == pytest.approx(metrics.latency_sum / 2)
+
+
+def test_metrics_record_payload_sizes(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    sample = UploadSample(ownerGroup="uu", sampleName="Octarine")
+    client.create_sample_model(sample)
+    client.get_instrument_model("inst/1")
+
+    metrics = client.metrics()
+    create = metrics["create_sample_model"]
+    assert create.request_bytes == len(sample.model_dump_json(exclude_none=True))
+    assert create.response_bytes > create.request_bytes
+    get = metrics["get_instrument_model"]
+    assert get.request_bytes == 0
+    assert get.response_bytes > 0
+
+
+def test_metrics_count_error_responses(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    emulator.inject_fault(Fault(status_code=503))
+    with pytest.raises(ScicatCommError):
+        client.get_instrument_model("inst/1")
+    client.get_instrument_model("inst/1")
+
+    metrics = client.metrics()["get_instrument_model"]
+    assert metrics.count == 2
+    assert metrics.error_count == 1
+
+
+def test_metrics_count_exceptions(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    emulator.inject_fault(Fault(exception=httpx.ConnectError))
+    with pytest.raises(httpx.ConnectError):
+        client.get_instrument_model("inst/1")
+
+    metrics = client.metrics()["get_instrument_model"]
+    assert metrics.count == 1
+    assert metrics.error_count == 1
+    assert metrics.response_bytes == 0
+
+
+def test_reset_metrics(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    client.get_instrument_model("inst/1")
+    client.reset_metrics()
+    assert client.metrics() == {}
+
+
+def test_prometheus_metrics(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    emulator.inject_fault(Fault(status_code=500))
+    with pytest.raises(ScicatCommError):
+        client.get_instrument_model("inst/1")
+    client.get_instrument_model("inst/1")
+
+    text = client.prometheus_metrics()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# TYPE scitacean_scicat_request_duration_seconds summary" in lines
+    assert "# TYPE scitacean_scicat_requests_total counter" in lines
+    assert 'scitacean_scicat_requests_total{operation="get_instrument_model"} 2' in (
+        lines
+    )
+    assert (
+        'scitacean_scicat_request_errors_total{operation="get_instrument_model"} 1'
+        in lines
+    )
+    assert (
+        'scitacean_scicat_request_duration_seconds_count{operation="get_instrument_model"} 2'  # noqa: E501
+        in lines
+    )
+    sample_pattern = re.compile(
+        r'^scitacean_scicat_\w+\{operation="get_instrument_model"'
+        r'(,quantile="[\d.]+")?\} [\d.e+-]+$'
+    )
+    assert all(line.startswith("# ") or sample_pattern.match(line) for line in lines)
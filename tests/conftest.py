@@ -30,6 +30,12 @@ hypothesis.settings.register_profile(
 def pytest_addoption(parser: pytest.Parser) -> None:
     add_backend_options(parser)
     add_sftp_option(parser)
+    parser.addoption(
+        "--skip-timing-tests",
+        action="store_true",
+        default=False,
+        help="Skip tests that check wall-clock times, e.g., on slow CI machines.",
+    )
 
 
 @pytest.fixture
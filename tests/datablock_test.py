@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pydantic
+import pytest
+
+from scitacean import PID, File, RemotePath, model
+from scitacean.datablock import OrigDatablock
+
+
+def make_download_model(n_files: int) -> model.DownloadOrigDatablock:
+    files = [
+        model.DownloadDataFile(
+            path=f"data/run{i}.nxs",
+            size=100 + i,
+            time=datetime(2025, 3, 4, 5, 6, 7, 890 + i, tzinfo=UTC),
+            chk=f"abc{i}" if i % 2 == 0 else None,
+            uid="ponder",
+            gid="faculty" if i % 3 else "wizards",
+            perm="-rw-r--r--",
+        )
+        for i in range(n_files)
+    ]
+    return model.DownloadOrigDatablock(
+        chkAlg="sha256", dataFileList=files, size=sum(f.size or 0 for f in files)
+    )
+
+
+@pytest.mark.parametrize("compact_files", [False, True])
+def test_from_download_model_files(compact_files: bool) -> None:
+    dblock_model = make_download_model(7)
+    dblock = OrigDatablock.from_download_model(
+        dblock_model, compact_files=compact_files
+    )
+    assert dblock_model.dataFileList is not None
+    expected = [
+        File.from_download_model(f, checksum_algorithm="sha256")
+        for f in dblock_model.dataFileList
+    ]
+    assert list(dblock.files) == expected
+    assert dblock.number_of_files == 7
+    assert dblock.size == dblock_model.size
+    assert list(dblock.remote_paths()) == [f.path for f in dblock_model.dataFileList]
+
+
+def test_compact_and_lazy_datablocks_compare_equal() -> None:
+    dblock_model = make_download_model(4)
+    compact = OrigDatablock.from_download_model(dblock_model, compact_files=True)
+    lazy = OrigDatablock.from_download_model(dblock_model, compact_files=False)
+    assert compact == lazy
+
+
+def test_compact_datablock_converts_times_to_utc() -> None:
+    tz = timezone(timedelta(hours=2))
+    time = datetime(2025, 3, 4, 5, 6, 7, 123456, tzinfo=tz)
+    dblock = OrigDatablock.from_download_model(
+        model.DownloadOrigDatablock(
+            dataFileList=[model.DownloadDataFile(path="a", size=1, time=time)]
+        ),
+        compact_files=True,
+    )
+    [file] = dblock.files
+    assert file.creation_time == time
+    assert file.creation_time.tzinfo == UTC
+
+
+def test_compact_datablock_handles_missing_values() -> None:
+    dblock = OrigDatablock.from_download_model(
+        model.DownloadOrigDatablock(
+            dataFileList=[model.DownloadDataFile(path="a", size=3)]
+        ),
+        compact_files=True,
+    )
+    [file] = dblock.files
+    assert file.checksum() is None
+    assert file.remote_uid is None
+    assert dblock.size == 3
+    # Checked last because File.creation_time is annotated as non-optional.
+    assert file.creation_time is None
+
+
+def test_compact_datablock_add_files() -> None:
+    dblock = OrigDatablock.from_download_model(
+        make_download_model(2), compact_files=True
+    )
+    remote = File.from_remote(
+        "other/remote.dat",
+        size=9,
+        creation_time=datetime(2025, 1, 1, tzinfo=UTC),
+        checksum="def",
+        checksum_algorithm="sha256",
+    )
+    local = File.from_download_model(
+        model.DownloadDataFile(path="other/local.dat", size=5),
+        local_path=Path("local.dat"),
+    )
+    dblock.add_files(remote, local)
+
+    files = list(dblock.files)
+    assert len(files) == 4
+    assert files[2] == remote
+    assert files[3].local_path == Path("local.dat")
+    assert files[3].remote_path == RemotePath("other/local.dat")
+    assert list(dblock.remote_paths())[2:] == ["other/remote.dat", "other/local.dat"]
+
+
+def test_compact_datablock_make_upload_model() -> None:
+    dblock_model = make_download_model(3)
+    compact = OrigDatablock.from_download_model(dblock_model, compact_files=True)
+    lazy = OrigDatablock.from_download_model(dblock_model, compact_files=False)
+    pid = "abc/123"
+    assert compact.make_upload_model(pid) == lazy.make_upload_model(pid)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("compact_files", [False, True])
+def test_make_upload_model_rejects_missing_size(compact_files: bool) -> None:
+    dblock = OrigDatablock.from_download_model(
+        model.DownloadOrigDatablock(
+            dataFileList=[
+                model.DownloadDataFile(path="a", time=datetime(2025, 1, 1, tzinfo=UTC))
+            ]
+        ),
+        compact_files=compact_files,
+    )
+    with pytest.raises(pydantic.ValidationError, match="size") as exc_info:
+        dblock.make_upload_model(PID(pid="abc/123"))
+    assert str(-(2**63)) not in str(exc_info.value)
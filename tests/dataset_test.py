@@ -2,6 +2,8 @@
 # Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
 # mypy: disable-error-code="arg-type, union-attr"
 
+import hashlib
+import re
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -11,6 +13,7 @@ from hypothesis import strategies as st
 from pyfakefs.fake_filesystem import FakeFilesystem
 
 from scitacean import PID, Dataset, File, RemotePath, Thumbnail, model
+from scitacean.datablock import OrigDatablock
 from scitacean.testing import strategies as sst
 from scitacean.testing.client import process_uploaded_dataset
 
@@ -103,6 +106,238 @@ def test_from_download_model_initializes_fields(
         assert getattr(dset, field.name) == get_model_field(field.scicat_name)
 
 
+def _download_model_with_files(
+    download_model: model.DownloadDataset, n_files: int
+) -> model.DownloadDataset:
+    files = [
+        model.DownloadDataFile(
+            path=f"sub/file{i}.dat",
+            size=10 * i,
+            time=datetime(2024, 5, 1, tzinfo=UTC),
+            chk=f"{i:04x}",
+        )
+        for i in range(n_files)
+    ]
+    return download_model.model_copy(
+        update={
+            "origdatablocks": [
+                model.DownloadOrigDatablock(
+                    chkAlg="md5",
+                    dataFileList=files,
+                    size=sum(10 * i for i in range(n_files)),
+                )
+            ]
+        }
+    )
+
+
+def test_from_download_model_does_not_construct_files(
+    download_model: model.DownloadDataset, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    download_model = _download_model_with_files(download_model, 5)
+
+    constructed = []
+    original = File.from_download_model.__func__  # type: ignore[attr-defined]
+
+    def counting_from_download_model(cls, *args, **kwargs):  # type: ignore[no-untyped-def]
+        constructed.append(args[0].path)
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(
+        File, "from_download_model", classmethod(counting_from_download_model)
+    )
+
+    dset = Dataset.from_download_model(download_model)
+    assert dset.number_of_files == 5
+    assert dset.size == sum(10 * i for i in range(5))
+    assert constructed == []
+
+    selected = dset._select_files(lambda path: path == "sub/file3.dat")
+    assert [f.remote_path for f in selected] == [RemotePath("sub/file3.dat")]
+    assert constructed == ["sub/file3.dat"]
+
+    files = dset.files
+    assert len(files) == 5
+    assert sorted(constructed) == sorted(f"sub/file{i}.dat" for i in range(5))
+
+
+def test_from_download_model_lazy_files_match_eager_files(
+    download_model: model.DownloadDataset,
+) -> None:
+    download_model = _download_model_with_files(download_model, 4)
+    dset = Dataset.from_download_model(download_model)
+    expected = [
+        File.from_download_model(f, checksum_algorithm="md5")
+        for f in download_model.origdatablocks[0].dataFileList  # type: ignore[index]
+    ]
+    assert list(dset.files) == expected
+    assert all(f.checksum_algorithm == "md5" for f in dset.files)
+
+
+def test_from_download_model_lazy_files_compare_equal(
+    download_model: model.DownloadDataset,
+) -> None:
+    download_model = _download_model_with_files(download_model, 3)
+    dset1 = Dataset.from_download_model(download_model)
+    dset2 = Dataset.from_download_model(download_model)
+    _ = dset1.files  # only materialize one of them
+    assert dset1 == dset2
+
+
+@pytest.mark.parametrize("compact_files", [False, True])
+def test_replace_files_replaces_by_remote_path(
+    download_model: model.DownloadDataset, compact_files: bool
+) -> None:
+    download_model = _download_model_with_files(download_model, 4)
+    dset = Dataset.from_download_model(download_model, compact_files=compact_files)
+    new1 = File.from_remote(
+        "sub/file1.dat", size=123, creation_time="2025-01-01T00:00:00Z"
+    )
+    new3 = File.from_remote(
+        "sub/file3.dat", size=456, creation_time="2025-01-01T00:00:00Z"
+    )
+    unrelated = File.from_remote(
+        "other.dat", size=7, creation_time="2025-01-01T00:00:00Z"
+    )
+
+    replaced = dset.replace_files(new3, unrelated, new1)
+    files = list(replaced.files)
+    assert [f.remote_path.posix for f in files] == [
+        f"sub/file{i}.dat" for i in range(4)
+    ]
+    assert files[0] == dset.get_file("sub/file0.dat")
+    assert files[1].size == 123
+    assert files[2] == dset.get_file("sub/file2.dat")
+    assert files[3].size == 456
+    # The original dataset is unchanged.
+    assert dset.get_file("sub/file1.dat").size == 10
+    assert replaced.get_file("sub/file1.dat") == new1
+
+
+def test_replace_files_prefers_first_of_duplicates(
+    download_model: model.DownloadDataset,
+) -> None:
+    download_model = _download_model_with_files(download_model, 2)
+    dset = Dataset.from_download_model(download_model)
+    first = File.from_remote(
+        "sub/file1.dat", size=1, creation_time="2025-01-01T00:00:00Z"
+    )
+    second = File.from_remote(
+        "sub/file1.dat", size=2, creation_time="2025-01-01T00:00:00Z"
+    )
+    replaced = dset.replace_files(first, second)
+    assert replaced.get_file("sub/file1.dat") == first
+
+
+@pytest.mark.parametrize("compact_files", [False, True])
+def test_get_file(download_model: model.DownloadDataset, compact_files: bool) -> None:
+    download_model = _download_model_with_files(download_model, 3)
+    dset = Dataset.from_download_model(download_model, compact_files=compact_files)
+    file = dset.get_file(RemotePath("sub/file2.dat"))
+    assert file is not None
+    assert file.size == 20
+    assert dset.get_file("sub/file2.dat") == file
+    assert dset.get_file("sub/file3.dat") is None
+
+
+def test_files_are_cached_until_files_are_added() -> None:
+    dset = Dataset(type="raw")
+    file1 = File.from_remote("file1.dat", size=1, creation_time="2025-01-01T00:00:00Z")
+    file2 = File.from_remote("file2.dat", size=2, creation_time="2025-01-01T00:00:00Z")
+    dset.add_files(file1)
+    files = dset.files
+    assert dset.files is files
+
+    dset.add_files(file2)
+    assert dset.files is not files
+    assert [f.remote_path.posix for f in dset.files] == ["file1.dat", "file2.dat"]
+
+    dset.add_orig_datablock(checksum_algorithm=None).add_files(
+        File.from_remote("file3.dat", size=3, creation_time="2025-01-01T00:00:00Z")
+    )
+    assert dset.number_of_files == 3
+    assert dset.size == 6
+    assert len(dset.files) == 3
+
+
+def test_files_of_compact_datablocks_are_not_cached(
+    download_model: model.DownloadDataset,
+) -> None:
+    download_model = _download_model_with_files(download_model, 3)
+    dset = Dataset.from_download_model(download_model, compact_files=True)
+    files = dset.files
+    assert len(files) == 3
+    assert dset.files == files
+    assert dset._files_cache is None
+
+
+def test_files_cache_is_invalidated_when_datablocks_are_replaced() -> None:
+    def make_datablock(name: str) -> OrigDatablock:
+        return OrigDatablock(
+            checksum_algorithm=None,
+            init_files=[
+                File.from_remote(name, size=1, creation_time="2025-01-01T00:00:00Z")
+            ],
+        )
+
+    dset = Dataset(type="raw")
+    dset._orig_datablocks.append(make_datablock("old.dat"))
+    assert [f.remote_path.posix for f in dset.files] == ["old.dat"]
+
+    # The new datablock has the same version as the old one.
+    dset._orig_datablocks[0] = make_datablock("new.dat")
+    assert [f.remote_path.posix for f in dset.files] == ["new.dat"]
+
+
+def test_size_is_updated_by_refresh(fs: FakeFilesystem) -> None:
+    make_file(fs, "data.dat", contents=b"abc")
+    dset = Dataset(type="raw")
+    dset.add_local_files("data.dat")
+    assert dset.size == 3
+
+    Path("data.dat").write_bytes(b"abcdef")
+    assert dset.size == 3
+    dset.refresh()
+    assert dset.size == 6
+
+
+def test_refresh_takes_snapshot_of_local_files(fs: FakeFilesystem) -> None:
+    make_file(fs, "data1.dat", contents=b"abc")
+    make_file(fs, "data2.dat", contents=b"12345")
+    dset = Dataset(type="raw", checksum_algorithm="md5")
+    dset.add_local_files("data1.dat", "data2.dat")
+    dset.refresh()
+    [file1, file2] = dset.files
+    checksum = file1.checksum()
+
+    Path("data1.dat").write_bytes(b"abcdef")
+    assert file1.size == 3
+    assert file2.size == 5
+    assert file1.checksum() == checksum
+
+    dset.refresh(use_scandir=True)
+    assert file1.size == 6
+    assert file1.checksum() == hashlib.md5(b"abcdef").hexdigest()
+
+
+def test_get_file_finds_added_files() -> None:
+    dset = Dataset(type="raw")
+    assert dset.get_file("file.dat") is None
+    file = File.from_remote("file.dat", size=1, creation_time="2025-01-01T00:00:00Z")
+    dset.add_files(file)
+    found = dset.get_file("file.dat")
+    assert found is not None
+    assert found.remote_path == file.remote_path
+    assert found.size == 1
+
+
+def test_dataset_accepts_chunked_checksum_algorithm() -> None:
+    dset = Dataset(type="raw", checksum_algorithm="merkle-sha256-16M")
+    assert dset._default_checksum_algorithm == "merkle-sha256-16M"
+    with pytest.raises(ValueError, match="not recognized"):
+        Dataset(type="raw", checksum_algorithm="merkle-nonsense")
+
+
 @pytest.mark.parametrize("typ", ["raw", "derived"])
 def test_new_dataset_has_no_files(typ: str) -> None:
     dset = Dataset(type=typ)
@@ -298,6 +533,72 @@ def test_add_files_given_algorithm_overrides_default(
     assert f2.checksum_algorithm == "md5"
 
 
+def _make_run_directory(fs: FakeFilesystem) -> None:
+    fs.create_file("run/data.h5", contents=b"12345")
+    fs.create_file("run/raw/scan1.h5", contents=b"1")
+    fs.create_file("run/raw/scan2.h5", contents=b"22")
+    fs.create_file("run/raw/notes.txt", contents=b"333")
+    fs.create_file("run/raw/deep/nested/scan3.h5", contents=b"4444")
+    fs.create_file("run/.cache/scan4.h5", contents=b"55555")
+
+
+def test_add_local_files_from_directory(fs: FakeFilesystem) -> None:
+    _make_run_directory(fs)
+    dset = Dataset(type="raw")
+    dset.add_local_files_from_directory("run", max_workers=3)
+
+    assert [f.remote_path.posix for f in dset.files] == [
+        ".cache/scan4.h5",
+        "data.h5",
+        "raw/deep/nested/scan3.h5",
+        "raw/notes.txt",
+        "raw/scan1.h5",
+        "raw/scan2.h5",
+    ]
+    file = dset.get_file("raw/scan2.h5")
+    assert file.local_path == Path("run", "raw", "scan2.h5")
+    assert file.size == 2
+    assert dset.size == 20
+
+
+def test_add_local_files_from_directory_include_glob(fs: FakeFilesystem) -> None:
+    _make_run_directory(fs)
+    dset = Dataset(type="raw")
+    dset.add_local_files_from_directory("run", include="raw/*.h5")
+    assert [f.remote_path.posix for f in dset.files] == [
+        "raw/deep/nested/scan3.h5",
+        "raw/scan1.h5",
+        "raw/scan2.h5",
+    ]
+
+
+def test_add_local_files_from_directory_include_regex_exclude_glob(
+    fs: FakeFilesystem,
+) -> None:
+    _make_run_directory(fs)
+    dset = Dataset(type="raw")
+    dset.add_local_files_from_directory(
+        "run", include=re.compile(r"\.h5$"), exclude=[".cache", "*/deep"]
+    )
+    assert [f.remote_path.posix for f in dset.files] == [
+        "data.h5",
+        "raw/scan1.h5",
+        "raw/scan2.h5",
+    ]
+
+
+def test_add_local_files_from_directory_uses_stat_snapshot(
+    fs: FakeFilesystem,
+) -> None:
+    _make_run_directory(fs)
+    dset = Dataset(type="raw")
+    dset.add_local_files_from_directory("run", include="data.h5")
+    Path("run/data.h5").write_bytes(b"123456789")
+    assert dset.size == 5
+    dset.refresh()
+    assert dset.size == 9
+
+
 @pytest.mark.parametrize("typ", ["raw", "derived"])
 @pytest.mark.parametrize("ds_algorithm", ["sha256", None])
 def test_add_files_rejects_files_with_different_checksum_algorithms(
@@ -1,12 +1,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
 import hashlib
+import os
 import re
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
 import pytest
 from pyfakefs.fake_filesystem import FakeFilesystem
@@ -47,21 +50,18 @@ def data_files() -> tuple[list[DownloadDataFile], dict[str, bytes]]:
 DatasetAndFiles = tuple[Dataset, dict[str, bytes]]
 
 
-@pytest.fixture
-def dataset_and_files(
-    data_files: tuple[list[DownloadDataFile], dict[str, bytes]],
-) -> DatasetAndFiles:
+def _make_dataset(files: list[DownloadDataFile]) -> Dataset:
     model = DownloadDataset(
         contactEmail="p.stibbons@uu.am",
         creationTime=datetime.fromisoformat("1995-08-06T14:14:14"),
-        numberOfFiles=len(data_files[0]),
+        numberOfFiles=len(files),
         numberOfFilesArchived=0,
         owner="pstibbons",
         ownerGroup="faculty",
         packedSize=0,
         pid=PID(prefix="UU.000", pid="5125.ab.663.8c9f"),
         principalInvestigators=["m.ridcully@uu.am"],
-        size=sum(f.size for f in data_files[0]),  # type: ignore[misc]
+        size=sum(f.size for f in files),  # type: ignore[misc]
         sourceFolder=RemotePath("/src/stibbons/774"),
         type="raw",
         scientificMetadata={
@@ -72,14 +72,20 @@ def dataset_and_files(
     block = DownloadOrigDatablock(
         chkAlg="md5",
         ownerGroup="faculty",
-        size=sum(f.size for f in data_files[0]),  # type: ignore[misc]
+        size=sum(f.size for f in files),  # type: ignore[misc]
         datasetId=PID(prefix="UU.000", pid="5125.ab.663.8c9f"),
-        dataFileList=data_files[0],
+        dataFileList=files,
     )
-    dset = Dataset.from_download_model(
+    return Dataset.from_download_model(
         dataset_model=model.model_copy(update={"origdatablocks": [block]})
     )
 
+
+@pytest.fixture
+def dataset_and_files(
+    data_files: tuple[list[DownloadDataFile], dict[str, bytes]],
+) -> DatasetAndFiles:
+    dset = _make_dataset(data_files[0])
     content_abs_path = {
         file_absolute_path(name, dset.source_folder): content
         for name, content in data_files[1].items()
@@ -467,3 +473,427 @@ def test_force_file_download(
             checksum_algorithm="md5",
             force=True,
         )
+
+
+class _RaisingDownloader(FakeFileTransfer):
+    source_dir = "/"
+
+    @contextmanager
+    def connect_for_download(
+        self, dataset: Dataset, representative_file_path: RemotePath
+    ) -> Iterator[FakeDownloadConnection]:
+        raise RuntimeError("Download disabled")
+
+
+def _forbid_checksums(monkeypatch: pytest.MonkeyPatch) -> None:
+    def raise_if_called(*args: object, **kwargs: object) -> None:
+        raise AssertionError("Checksum must not be computed")
+
+    monkeypatch.setattr("scitacean.file.checksums_of_file", raise_if_called)
+
+
+@pytest.mark.parametrize("verify", ["size", "mtime"])
+def test_download_verify_fast_does_not_compute_checksum(
+    fs: FakeFilesystem,
+    dataset_and_files: DatasetAndFiles,
+    monkeypatch: pytest.MonkeyPatch,
+    verify: Literal["size", "mtime"],
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.download_files(dataset, target="./download", select=True)
+
+    _forbid_checksums(monkeypatch)
+    client = Client.without_login(url="/", file_transfer=_RaisingDownloader(fs=fs))
+    # Does not raise
+    downloaded = client.download_files(
+        dataset, target="./download", select=True, verify=verify
+    )
+    assert all(file.local_path is not None for file in downloaded.files)
+
+
+@pytest.mark.parametrize("verify", ["size", "mtime"])
+def test_download_verify_fast_downloads_file_with_different_size(
+    fs: FakeFilesystem,
+    dataset_and_files: DatasetAndFiles,
+    monkeypatch: pytest.MonkeyPatch,
+    verify: Literal["size", "mtime"],
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.download_files(dataset, target="./download", select=True)
+    Path("download/file1.dat").write_bytes(b"short")
+
+    _forbid_checksums(monkeypatch)
+    client = Client.without_login(url="/", file_transfer=_RaisingDownloader(fs=fs))
+    with pytest.raises(RuntimeError, match="Download disabled"):
+        client.download_files(dataset, target="./download", select=True, verify=verify)
+
+
+def test_download_verify_mtime_falls_back_to_checksum_for_old_files(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.download_files(dataset, target="./download", select=True)
+    # Same size but different content and older than the remote file.
+    Path("download/file1.dat").write_bytes(b"x" * len(b"contents-of-file1"))
+    old = datetime.fromisoformat("1990-01-01T00:00:00+00:00").timestamp()
+    os.utime("download/file1.dat", (old, old))
+
+    client = Client.without_login(url="/", file_transfer=_RaisingDownloader(fs=fs))
+    with pytest.raises(RuntimeError, match="Download disabled"):
+        client.download_files(dataset, target="./download", select=True, verify="mtime")
+    # A size check alone cannot detect the modification.
+    client.download_files(dataset, target="./download", select=True, verify="size")
+
+
+def test_download_validates_redownloaded_file_with_preserved_mtime(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    Path("download").mkdir()
+    Path("download/file1.dat").write_bytes(b"x" * len(b"contents-of-file1"))
+    old = datetime.fromisoformat("1990-01-01T00:00:00+00:00").timestamp()
+
+    class PreservingConnection(FakeDownloadConnection):
+        # Like copy2 or rsync -t, keep the modification time of the source.
+        def download_file(self, *, remote: RemotePath, local: Path) -> None:
+            super().download_file(remote=remote, local=local)
+            os.utime(local, (old, old))
+
+    class PreservingTransfer(FakeFileTransfer):
+        @contextmanager
+        def connect_for_download(
+            self, dataset: Dataset, representative_file_path: RemotePath
+        ) -> Iterator[FakeDownloadConnection]:
+            yield PreservingConnection(fs=self.fs, files=self.files)
+
+    client = Client.without_login(
+        url="/", file_transfer=PreservingTransfer(fs=fs, files=contents)
+    )
+    client.download_files(dataset, target="./download", select="file1.dat")
+    assert load("download/file1.dat") == contents["/src/stibbons/774/file1.dat"]
+
+
+def test_download_rejects_invalid_verify(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    with pytest.raises(ValueError, match="verify"):
+        client.download_files(
+            dataset,
+            target="./download",
+            select=True,
+            verify="telepathy",  # type: ignore[arg-type]
+        )
+
+
+def test_download_files_validates_while_downloading(
+    fs: FakeFilesystem,
+    dataset_and_files: DatasetAndFiles,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset, contents = dataset_and_files
+    first_validated = threading.Event()
+    original_validate = File.validate_after_download
+
+    def validate(file: File) -> None:
+        original_validate(file)
+        first_validated.set()
+
+    monkeypatch.setattr(File, "validate_after_download", validate)
+
+    class WaitingConnection(FakeDownloadConnection):
+        def download_file(self, *, remote: RemotePath, local: Path) -> None:
+            # Only the first file can be downloaded before any file is validated.
+            if any(fs.exists(p) for p in Path("download").iterdir()):
+                assert first_validated.wait(timeout=10)
+            super().download_file(remote=remote, local=local)
+
+    class WaitingTransfer(FakeFileTransfer):
+        @contextmanager
+        def connect_for_download(
+            self, dataset: Dataset, representative_file_path: RemotePath
+        ) -> Iterator[FakeDownloadConnection]:
+            yield WaitingConnection(fs=self.fs, files=self.files)
+
+    client = Client.without_login(
+        url="/", file_transfer=WaitingTransfer(fs=fs, files=contents)
+    )
+    downloaded = client.download_files(dataset, target="./download", select=True)
+    assert all(file.local_path is not None for file in downloaded.files)
+
+
+def test_sync_dataset_downloads_all_files_initially(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    result = client.sync_dataset(dataset, local_root="./mirror")
+    assert load("mirror/file1.dat") == contents["/src/stibbons/774/file1.dat"]
+    assert load("mirror/grades.csv") == contents["/src/ridcully/grades.csv"]
+    assert set(result.downloaded) == {f.remote_path for f in dataset.files}
+    assert result.unchanged == []
+    assert all(f.local_path is not None for f in result.dataset.files)
+    assert Path("mirror/.scitacean-manifest.json").exists()
+
+
+def test_sync_dataset_skips_tracked_files_without_checksums(
+    fs: FakeFilesystem,
+    dataset_and_files: DatasetAndFiles,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.sync_dataset(dataset, local_root="./mirror")
+
+    _forbid_checksums(monkeypatch)
+    client = Client.without_login(url="/", file_transfer=_RaisingDownloader(fs=fs))
+    result = client.sync_dataset(dataset, local_root="./mirror")
+    assert result.downloaded == []
+    assert set(result.unchanged) == {f.remote_path for f in dataset.files}
+    assert all(f.local_path is not None for f in result.dataset.files)
+
+
+def test_sync_dataset_downloads_changed_and_missing_files(
+    fs: FakeFilesystem,
+    data_files: tuple[list[DownloadDataFile], dict[str, bytes]],
+    dataset_and_files: DatasetAndFiles,
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.sync_dataset(dataset, local_root="./mirror")
+    Path("mirror/grades.csv").unlink()
+
+    new_content = b"contents-of-file1 version 2"
+    changed = [
+        f.model_copy(update={"size": len(new_content), "chk": _checksum(new_content)})
+        if f.path == "file1.dat"
+        else f
+        for f in data_files[0]
+    ]
+    contents = {**contents, "/src/stibbons/774/file1.dat": new_content}
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    result = client.sync_dataset(_make_dataset(changed), local_root="./mirror")
+    assert set(result.downloaded) == {
+        RemotePath("/src/ridcully/grades.csv"),
+        RemotePath("file1.dat"),
+    }
+    assert load("mirror/file1.dat") == new_content
+    assert load("mirror/grades.csv") == contents["/src/ridcully/grades.csv"]
+
+
+def test_sync_dataset_adopts_existing_downloads(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.download_files(dataset, target="./mirror")
+
+    client = Client.without_login(url="/", file_transfer=_RaisingDownloader(fs=fs))
+    result = client.sync_dataset(dataset, local_root="./mirror")
+    assert result.downloaded == []
+
+
+@pytest.mark.parametrize("prune", [True, False])
+def test_sync_dataset_prune(
+    fs: FakeFilesystem,
+    data_files: tuple[list[DownloadDataFile], dict[str, bytes]],
+    dataset_and_files: DatasetAndFiles,
+    prune: bool,
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.sync_dataset(dataset, local_root="./mirror")
+    Path("mirror/untracked.txt").write_text("keep me")
+
+    remaining = [f for f in data_files[0] if f.path != "file1.dat"]
+    result = client.sync_dataset(
+        _make_dataset(remaining), local_root="./mirror", prune=prune
+    )
+    assert result.downloaded == []
+    assert Path("mirror/file1.dat").exists() != prune
+    assert Path("mirror/untracked.txt").exists()
+    if prune:
+        assert result.removed == [RemotePath("file1.dat")]
+        assert result.stale == []
+    else:
+        assert result.removed == []
+        assert result.stale == [RemotePath("file1.dat")]
+
+
+def test_sync_dataset_prune_keeps_file_that_moved_on_remote(
+    fs: FakeFilesystem,
+    data_files: tuple[list[DownloadDataFile], dict[str, bytes]],
+    dataset_and_files: DatasetAndFiles,
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.sync_dataset(dataset, local_root="./mirror")
+
+    # Both remote paths map to the same local path.
+    moved = [
+        f.model_copy(update={"path": "/src/bursar/grades.csv"})
+        if f.path == "/src/ridcully/grades.csv"
+        else f
+        for f in data_files[0]
+    ]
+    contents = {
+        **contents,
+        "/src/bursar/grades.csv": contents["/src/ridcully/grades.csv"],
+    }
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    result = client.sync_dataset(
+        _make_dataset(moved), local_root="./mirror", prune=True
+    )
+    assert result.downloaded == []
+    assert RemotePath("/src/bursar/grades.csv") in result.unchanged
+    assert result.removed == [RemotePath("/src/ridcully/grades.csv")]
+    assert load("mirror/grades.csv") == contents["/src/ridcully/grades.csv"]
+
+
+def test_sync_dataset_refuses_mirror_of_other_dataset(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.sync_dataset(dataset, local_root="./mirror")
+    other = dataset.replace(_read_only={"pid": PID(pid="other")})
+    with pytest.raises(ValueError, match="mirror of dataset"):
+        client.sync_dataset(other, local_root="./mirror")
+
+
+class _CountingFileTransfer(FakeFileTransfer):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.n_connections = 0
+        self.connected: list[PID | None] = []
+        self.downloaded: list[RemotePath] = []
+
+    @contextmanager
+    def connect_for_download(
+        self, dataset: Dataset, representative_file_path: RemotePath
+    ) -> Iterator[FakeDownloadConnection]:
+        self.n_connections += 1
+        self.connected.append(dataset.pid)
+        transfer = self
+
+        class Connection(FakeDownloadConnection):
+            def download_file(self, *, remote: RemotePath, local: Path) -> None:
+                transfer.downloaded.append(remote)
+                super().download_file(remote=remote, local=local)
+
+        yield Connection(fs=self.fs, files=self.files)
+
+
+def test_download_files_for_downloads_all_datasets(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    other = dataset.replace(_read_only={"pid": PID(prefix="UU.000", pid="other")})
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    downloaded = client.download_files_for([dataset, other], target="./download")
+
+    for name in ("5125.ab.663.8c9f", "other"):
+        assert (
+            load(f"download/{name}/file1.dat")
+            == contents["/src/stibbons/774/file1.dat"]
+        )
+        assert (
+            load(f"download/{name}/grades.csv") == contents["/src/ridcully/grades.csv"]
+        )
+    assert [d.pid for d in downloaded] == [dataset.pid, other.pid]
+    assert all(f.local_path is not None for d in downloaded for f in d.files)
+    assert downloaded[1].files[0].local_path == Path("download/other/file1.dat")
+
+
+def test_download_files_for_callable_target(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.download_files_for(
+        [dataset], target=lambda dset: f"./{dset.owner}", select="file1.dat"
+    )
+    assert load("pstibbons/file1.dat") == contents["/src/stibbons/774/file1.dat"]
+
+
+def test_download_files_for_shares_connections_and_orders_by_size(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    other = dataset.replace(_read_only={"pid": PID(prefix="UU.000", pid="other")})
+    transfer = _CountingFileTransfer(fs=fs, files=contents)
+    client = Client.without_login(url="/", file_transfer=transfer)
+    client.download_files_for([dataset, other], target="./download", max_workers=1)
+
+    assert transfer.n_connections == 1
+    sizes = [len(contents[remote.posix]) for remote in transfer.downloaded]
+    assert len(sizes) == 8
+    assert sizes == sorted(sizes, reverse=True)
+
+
+def test_download_files_for_connects_per_source_folder(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    other = dataset.replace(
+        source_folder="/src/other",
+        _read_only={"pid": PID(prefix="UU.000", pid="other")},
+    )
+    transfer = _CountingFileTransfer(fs=fs, files=contents)
+    client = Client.without_login(url="/", file_transfer=transfer)
+    client.download_files_for(
+        [dataset, other],
+        target="./download",
+        select="/src/ridcully/grades.csv",
+        max_workers=1,
+    )
+
+    assert transfer.connected == [dataset.pid, other.pid]
+
+
+def test_download_files_for_skips_up_to_date_files(
+    fs: FakeFilesystem, dataset_and_files: DatasetAndFiles
+) -> None:
+    dataset, contents = dataset_and_files
+    client = Client.without_login(
+        url="/", file_transfer=FakeFileTransfer(fs=fs, files=contents)
+    )
+    client.download_files_for([dataset], target="./download")
+
+    client = Client.without_login(url="/", file_transfer=_RaisingDownloader(fs=fs))
+    downloaded = client.download_files_for([dataset], target="./download")
+    assert all(f.local_path is not None for f in downloaded[0].files)
@@ -9,7 +9,9 @@ from typing import Any
 import pytest
 from pyfakefs.fake_filesystem import FakeFilesystem
 
+import scitacean.file
 from scitacean import File, IntegrityError, RemotePath
+from scitacean.client import _remove_up_to_date_local_files
 from scitacean.filesystem import checksum_of_file
 from scitacean.logging import logger_name
 from scitacean.model import DownloadDataFile
@@ -276,6 +278,58 @@ def test_checksum_is_always_local_checksum(fake_file: dict[str, Any]) -> None:
     ).checksum() == checksum_of_file(fake_file["path"], algorithm="sha256")
 
 
+def _count_checksum_passes(monkeypatch: pytest.MonkeyPatch) -> list[set[str]]:
+    passes: list[set[str]] = []
+    original = scitacean.file.checksums_of_file  # type: ignore[attr-defined]
+
+    def counting(path: Path, *, algorithms: set[str]) -> dict[str, str]:
+        passes.append(set(algorithms))
+        return original(path, algorithms=algorithms)
+
+    monkeypatch.setattr(scitacean.file, "checksums_of_file", counting)
+    return passes
+
+
+def test_checksums_of_other_algorithms_are_cached(
+    fake_file: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    passes = _count_checksum_passes(monkeypatch)
+    file = File.from_local(fake_file["path"])
+    file = replace(
+        file.uploaded(),
+        _remote_checksum=checksum_of_file(fake_file["path"], algorithm="sha256"),
+        checksum_algorithm="md5",
+    )
+    # Checking with an overridden algorithm also computes the file's own checksum.
+    assert _remove_up_to_date_local_files([file], checksum_algorithm="sha256") == []
+    assert passes == [{"sha256", "md5"}]
+
+    assert file.checksum() == fake_file["checksum"]
+    assert replace(file, checksum_algorithm="sha256").checksum() == (
+        checksum_of_file(fake_file["path"], algorithm="sha256")
+    )
+    assert len(passes) == 1
+
+
+def test_checksum_cache_is_invalidated_for_all_algorithms(
+    fs: FakeFilesystem, fake_file: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    passes = _count_checksum_passes(monkeypatch)
+    file = replace(File.from_local(fake_file["path"]), checksum_algorithm="md5")
+    file._local_checksum("md5", also=("sha256",))
+    assert passes == [{"md5", "sha256"}]
+
+    new_contents = b"new contents"
+    with open(fake_file["path"], "wb") as f:
+        f.write(new_contents)
+    fs.utime(fake_file["path"], (1e10, 1e10))  # make sure mtime is after the cache
+    assert (
+        replace(file, checksum_algorithm="sha256").checksum()
+        == hashlib.sha256(new_contents).hexdigest()
+    )
+    assert passes == [{"md5", "sha256"}, {"sha256"}]
+
+
 def test_creation_time_is_up_to_date(
     fs: FakeFilesystem, fake_file: dict[str, Any]
 ) -> None:
@@ -330,6 +384,28 @@ def test_validate_after_download_detects_bad_checksum(
         downloaded.validate_after_download()
 
 
+def test_validate_after_download_reports_damaged_chunks(tmp_path: Path) -> None:
+    mib = 1 << 20
+    path = tmp_path / "file.dat"
+    path.write_bytes(b"x" * (3 * mib))
+    stored = checksum_of_file(path, algorithm="merkle-sha256-1M")
+    path.write_bytes(b"x" * mib + b"y" + b"x" * (2 * mib - 1))
+
+    model = DownloadDataFile(
+        path=path.name,
+        size=3 * mib,
+        time=datetime.fromisoformat("2022-06-22T15:42:53.123Z"),
+        chk=stored,
+    )
+    file = replace(
+        File.from_download_model(model), checksum_algorithm="merkle-sha256-1M"
+    )
+    downloaded = file.downloaded(local_path=path)
+
+    with pytest.raises(IntegrityError, match=rf"\[\({mib}, {2 * mib}\)\]"):
+        downloaded.validate_after_download()
+
+
 def test_validate_after_download_ignores_checksum_if_no_algorithm(
     fake_file: dict[str, Any],
 ) -> None:
@@ -429,3 +505,8 @@ def test_local_is_not_up_to_date_differing_checksum(fake_file: dict[str, Any]) -
         checksum_algorithm="md5",
     )
     assert not file.local_is_up_to_date()
+
+
+def test_file_has_no_dict() -> None:
+    file = File.from_remote("file.dat", size=1, creation_time="2025-01-01T00:00:00Z")
+    assert not hasattr(file, "__dict__")
@@ -10,12 +10,18 @@ from hypothesis import given
 from hypothesis import strategies as st
 from pyfakefs.fake_filesystem import FakeFilesystem
 
+from scitacean import filesystem
 from scitacean.filesystem import (
     RemotePath,
     checksum_of_file,
+    checksums_of_file,
     escape_path,
     file_modification_time,
     file_size,
+    find_damaged_chunks,
+    is_chunked_checksum_algorithm,
+    set_checksum_engine,
+    stat_files,
 )
 
 
@@ -92,6 +98,21 @@ def test_remote_path_neq(types: Any) -> None:
     assert ta("/source/data.csv") != tb("/host/dir/song.mp3")
 
 
+def test_remote_path_neq_other_types() -> None:
+    assert RemotePath("file.dat") != PurePath("file.dat")
+    assert RemotePath("3") != 3
+
+
+@given(st.text())
+def test_remote_path_hash_matches_str(path: str) -> None:
+    assert hash(RemotePath(path)) == hash(path)
+    assert {RemotePath(path)} == {RemotePath(RemotePath(path))}
+
+
+def test_remote_path_has_no_dict() -> None:
+    assert not hasattr(RemotePath("file.dat"), "__dict__")
+
+
 @pytest.mark.parametrize(
     "types", [(RemotePath, RemotePath), (RemotePath, str), (str, RemotePath)]
 )
@@ -195,6 +216,38 @@ def test_file_modification_time(fs: FakeFilesystem) -> None:
     )
 
 
+@pytest.mark.parametrize("use_scandir", [False, True])
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_stat_files(fs: FakeFilesystem, use_scandir: bool, max_workers: int) -> None:
+    paths = [Path("dir", f"sub{i % 3}", f"file{i}.dat") for i in range(600)]
+    for i, path in enumerate(paths):
+        fs.create_file(path, st_size=i)
+    fs.create_file("dir/sub0/unrelated.dat", st_size=12345)
+
+    results = stat_files(paths, max_workers=max_workers, use_scandir=use_scandir)
+    assert [r.st_size for r in results] == list(range(600))
+
+
+@pytest.mark.parametrize("use_scandir", [False, True])
+def test_stat_files_repeated_path(fs: FakeFilesystem, use_scandir: bool) -> None:
+    fs.create_file("dir/a.dat", st_size=1)
+    fs.create_file("dir/b.dat", st_size=2)
+    paths = [Path("dir/a.dat"), Path("dir/b.dat"), Path("dir/a.dat")]
+    results = stat_files(paths, use_scandir=use_scandir)
+    assert [r.st_size for r in results] == [1, 2, 1]
+
+
+@pytest.mark.parametrize("use_scandir", [False, True])
+def test_stat_files_raises_for_missing_file(
+    fs: FakeFilesystem, use_scandir: bool
+) -> None:
+    fs.create_file("dir/file.dat")
+    with pytest.raises(FileNotFoundError):
+        stat_files(
+            [Path("dir/file.dat"), Path("dir/missing.dat")], use_scandir=use_scandir
+        )
+
+
 @pytest.mark.parametrize(
     "contents",
     [b"small file contents", b"large contents " * 100000],
@@ -213,6 +266,168 @@ def test_checksum_of_file(fs: FakeFilesystem, contents: bytes) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "engine", ["auto", "read", "read-ahead", "mmap", "file_digest"]
+)
+@pytest.mark.parametrize("block_size", [None, 1000, 1 << 20])
+@pytest.mark.parametrize(
+    "contents",
+    [b"", b"small file contents", b"large contents " * 100000],
+    ids=("empty", "small", "large"),
+)
+def test_checksum_of_file_engines(
+    tmp_path: Path, engine: str, block_size: int | None, contents: bytes
+) -> None:
+    # Use a real file because mmap does not work with pyfakefs.
+    path = tmp_path / "file.dat"
+    path.write_bytes(contents)
+    assert (
+        checksum_of_file(path, algorithm="sha256", engine=engine, block_size=block_size)
+        == hashlib.sha256(contents).hexdigest()
+    )
+
+
+@pytest.mark.parametrize("engine", ["read", "read-ahead", "file_digest"])
+def test_checksums_of_file(fs: FakeFilesystem, engine: str) -> None:
+    contents = b"large contents " * 100000
+    fs.create_file("file.txt", contents=contents)
+    algorithms = ("md5", "sha256", "blake2b")
+    assert checksums_of_file("file.txt", algorithms=algorithms, engine=engine) == {
+        algorithm: hashlib.new(algorithm, contents).hexdigest()
+        for algorithm in algorithms
+    }
+
+
+@pytest.mark.parametrize(
+    ("algorithm", "expected"),
+    [
+        ("merkle-sha256", True),
+        ("merkle-blake2b-16M", True),
+        ("merkle-sha3_256-1M", True),
+        ("merkle-md5-0M", False),
+        ("merkle-not-a-hash", False),
+        ("merkle", False),
+        ("sha256", False),
+    ],
+)
+def test_is_chunked_checksum_algorithm(algorithm: str, expected: bool) -> None:
+    assert is_chunked_checksum_algorithm(algorithm) == expected
+
+
+def _merkle_md5(contents: bytes, chunk_size: int) -> tuple[str, list[str]]:
+    leaves = [
+        hashlib.md5(b"\x00" + contents[i : i + chunk_size]).digest()
+        for i in range(0, max(len(contents), 1), chunk_size)
+    ]
+    level = leaves
+    while len(level) > 1:
+        level = [
+            hashlib.md5(b"\x01" + level[i] + level[i + 1]).digest()
+            if i + 1 < len(level)
+            else level[i]
+            for i in range(0, len(level), 2)
+        ]
+    return level[0].hex(), [leaf.hex() for leaf in leaves]
+
+
+@pytest.mark.parametrize("n_bytes", [0, 100, 1 << 20, 5 * (1 << 20) + 17])
+def test_checksum_of_file_chunked(tmp_path: Path, n_bytes: int) -> None:
+    contents = bytes(i % 251 for i in range(n_bytes))
+    path = tmp_path / "file.dat"
+    path.write_bytes(contents)
+
+    root, leaves = _merkle_md5(contents, 1 << 20)
+    assert checksum_of_file(path, algorithm="merkle-md5-1M", block_size=1000) == (
+        f"{root}:{','.join(leaves)}"
+    )
+
+
+def test_checksums_of_file_mixes_chunked_and_plain(tmp_path: Path) -> None:
+    contents = b"some contents" * 1000
+    path = tmp_path / "file.dat"
+    path.write_bytes(contents)
+    root, leaves = _merkle_md5(contents, 64 << 20)
+    assert checksums_of_file(path, algorithms=["merkle-md5", "sha256"]) == {
+        "merkle-md5": f"{root}:{','.join(leaves)}",
+        "sha256": hashlib.sha256(contents).hexdigest(),
+    }
+
+
+def test_find_damaged_chunks(tmp_path: Path) -> None:
+    mib = 1 << 20
+    contents = bytearray(b"abc" * (2 * mib))  # 6 chunks of 1 MiB
+    path = tmp_path / "file.dat"
+    path.write_bytes(contents)
+    expected = checksum_of_file(path, algorithm="merkle-md5-1M")
+
+    contents[2 * mib + 5] ^= 0xFF
+    contents[5 * mib] ^= 0xFF
+    path.write_bytes(contents)
+    actual = checksum_of_file(path, algorithm="merkle-md5-1M")
+
+    assert find_damaged_chunks(actual, expected, algorithm="merkle-md5-1M") == [
+        (2 * mib, 3 * mib),
+        (5 * mib, 6 * mib),
+    ]
+    assert find_damaged_chunks(expected, expected, algorithm="merkle-md5-1M") == []
+
+    path.write_bytes(contents[: 4 * mib])
+    truncated = checksum_of_file(path, algorithm="merkle-md5-1M")
+    assert find_damaged_chunks(truncated, expected, algorithm="merkle-md5-1M") == [
+        (2 * mib, 3 * mib),
+        (4 * mib, 5 * mib),
+        (5 * mib, 6 * mib),
+    ]
+
+
+def test_find_damaged_chunks_rejects_plain_algorithm() -> None:
+    with pytest.raises(ValueError, match="chunked"):
+        find_damaged_chunks("a:b", "a:b", algorithm="md5")
+
+
+def test_checksum_of_file_custom_engine(fs: FakeFilesystem) -> None:
+    fs.create_file("file.txt", contents=b"ignored")
+
+    def engine(path: Path, chk: Any, block_size: int) -> None:
+        chk.update(str(path).encode() + str(block_size).encode())
+
+    assert (
+        checksum_of_file("file.txt", algorithm="md5", engine=engine, block_size=3)
+        == hashlib.md5(b"file.txt3").hexdigest()
+    )
+
+
+def test_checksum_of_file_rejects_unknown_engine(fs: FakeFilesystem) -> None:
+    fs.create_file("file.txt")
+    with pytest.raises(ValueError, match="engine"):
+        checksum_of_file("file.txt", algorithm="md5", engine="telepathy")
+
+
+def test_set_checksum_engine(
+    fs: FakeFilesystem, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(filesystem, "_checksum_engine", "read")
+    monkeypatch.setattr(filesystem, "_checksum_block_size", 128 * 1024)
+    fs.create_file("file.txt", contents=b"contents")
+    calls = []
+
+    def engine(path: Path, chk: Any, block_size: int) -> None:
+        calls.append(block_size)
+        filesystem._hash_read(path, chk, block_size)
+
+    set_checksum_engine(engine, block_size=5)
+    assert (
+        checksum_of_file("file.txt", algorithm="md5")
+        == hashlib.md5(b"contents").hexdigest()
+    )
+    assert calls == [5]
+
+    with pytest.raises(ValueError, match="engine"):
+        set_checksum_engine("telepathy")
+    with pytest.raises(ValueError, match="Block size"):
+        set_checksum_engine(block_size=0)
+
+
 @pytest.mark.parametrize("path_type", [str, Path, RemotePath])
 def test_escape_path_returns_same_type_as_input(path_type: type) -> None:
     assert isinstance(escape_path(path_type("x")), path_type)
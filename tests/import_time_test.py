@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+import re
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Generous upper limit for the time of `import scitacean` relative to the startup
+# time of the interpreter to catch modules that are accidentally imported eagerly.
+# Using the startup time as a reference makes the limit robust against slow machines.
+# Eagerly importing all modules takes about five times as long as starting up.
+# The import time is tracked more precisely by the benchmarks in tools/benchmarks.
+IMPORT_BUDGET_FACTOR = 2
+
+# Modules that must be imported lazily to keep `import scitacean` fast.
+HEAVY_MODULES = (
+    "httpx",
+    "hypothesis",
+    "paramiko",
+    "pydantic",
+    "scitacean._dataset_fields",
+    "scitacean.client",
+    "scitacean.dataset",
+    "scitacean.model",
+    "scitacean.ontology",
+    "scitacean.thumbnail",
+)
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every imported module."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    pattern = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$")
+    return {
+        m[3]: int(m[1])
+        for line in result.stderr.splitlines()
+        if (m := pattern.match(line)) is not None
+    }
+
+
+def test_import_scitacean_does_not_import_heavy_modules() -> None:
+    imported = import_times("import scitacean")
+    assert not [name for name in HEAVY_MODULES if name in imported]
+
+
+def fastest_run_time(statement: str) -> float:
+    """Return the fastest of several wall-clock times of running a statement."""
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)  # noqa: S603
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_import_scitacean_is_within_budget(request: pytest.FixtureRequest) -> None:
+    if request.config.getoption("--skip-timing-tests"):
+        pytest.skip("Timing tests are disabled")
+    startup = fastest_run_time("pass")
+    with_import = fastest_run_time("import scitacean")
+    assert with_import - startup < IMPORT_BUDGET_FACTOR * startup
+
+
+@pytest.mark.parametrize(
+    "name", ["Client", "Dataset", "File", "PID", "Profile", "RemotePath"]
+)
+def test_lazy_attributes_do_not_import_optional_dependencies(name: str) -> None:
+    imported = import_times(f"from scitacean import {name}")
+    assert "paramiko" not in imported
+    assert "hypothesis" not in imported
+
+
+def test_lazy_attributes_are_the_module_attributes() -> None:
+    import scitacean
+    from scitacean.dataset import Dataset
+    from scitacean.filesystem import RemotePath
+
+    assert scitacean.Dataset is Dataset
+    assert scitacean.RemotePath is RemotePath
+    assert set(scitacean.__all__) <= set(dir(scitacean))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    import scitacean
+
+    with pytest.raises(AttributeError, match="no attribute 'NotAThing'"):
+        scitacean.NotAThing  # noqa: B018
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from scitacean import Dataset, instrumentation, model
+from scitacean.filesystem import checksum_of_file
+from scitacean.instrumentation import CallbackExporter, SpanRecord
+from scitacean.testing.emulator import ScicatEmulator
+from scitacean.testing.transfer import FakeFileTransfer
+
+
+@pytest.fixture
+def records() -> Iterator[list[SpanRecord]]:
+    records: list[SpanRecord] = []
+    instrumentation.enable(CallbackExporter(records.append))
+    yield records
+    instrumentation.disable()
+
+
+def test_disabled_by_default() -> None:
+    assert not instrumentation.is_enabled()
+
+
+def test_disabled_span_does_nothing() -> None:
+    records: list[SpanRecord] = []
+    exporter = CallbackExporter(records.append)
+    instrumentation.enable(exporter)
+    instrumentation.disable()
+
+    with instrumentation.span("test.span", a=1) as s:
+        s.set_attribute("b", 2)
+    assert not instrumentation.is_enabled()
+    assert records == []
+
+
+def test_span_records_attributes_and_duration(records: list[SpanRecord]) -> None:
+    with instrumentation.span("test.span", a=1) as s:
+        s.set_attribute("b", "two")
+
+    [record] = records
+    assert record.name == "test.span"
+    assert record.attributes == {"a": 1, "b": "two"}
+    assert record.duration >= 0
+    assert record.error is None
+
+
+def test_span_records_error(records: list[SpanRecord]) -> None:
+    with pytest.raises(ValueError, match="bad"), instrumentation.span("test.span"):
+        raise ValueError("bad")
+
+    [record] = records
+    assert isinstance(record.error, ValueError)
+
+
+def test_nested_spans_end_inner_first(records: list[SpanRecord]) -> None:
+    with instrumentation.span("outer"), instrumentation.span("inner"):
+        pass
+    assert [record.name for record in records] == ["inner", "outer"]
+
+
+def test_checksum_of_file_is_instrumented(
+    records: list[SpanRecord], tmp_path: Path
+) -> None:
+    path = tmp_path / "file.dat"
+    path.write_bytes(b"some content")
+    checksum_of_file(path, algorithm="md5")
+
+    [record] = records
+    assert record.name == "scitacean.checksums_of_file"
+    assert record.attributes == {"algorithms": "md5"}
+
+
+def test_failed_model_validation_is_recorded(records: list[SpanRecord]) -> None:
+    model.construct(model.UploadSample, _strict_validation=False, _quiet=True)
+
+    [record] = records
+    assert record.name == "scitacean.model.construct"
+    assert record.attributes == {"model": "UploadSample", "validation_failed": True}
+
+
+def test_upload_is_instrumented(records: list[SpanRecord], fs: FakeFilesystem) -> None:
+    fs.create_file("data/file.nxs", contents=b"neutrons")
+    client = ScicatEmulator().client(file_transfer=FakeFileTransfer(fs=fs))
+    dataset = Dataset(
+        type="raw",
+        owner_group="uu",
+        access_groups=["faculty"],
+        contact_email="p.stibbons@uu.am",
+        principal_investigators=["Mustrum Ridcully"],
+        owner="PonderStibbons",
+        creation_time=datetime(2024, 1, 1, tzinfo=UTC),
+        source_folder="/hex/data",
+    )
+    dataset.add_local_files("data/file.nxs")
+    client.upload_new_dataset_now(dataset)
+
+    names = {record.name for record in records}
+    assert {
+        "scitacean.Client.upload_new_dataset_now",
+        "scitacean.Client.refresh_local_files",
+        "scitacean.Dataset.make_upload_model",
+        "scitacean.transfer.connect",
+        "scitacean.transfer.upload_files",
+        "scitacean.ScicatClient.call_endpoint",
+        "scitacean.model.construct",
+    } <= names
+    assert records[-1].name == "scitacean.Client.upload_new_dataset_now"
+
+    operations = [
+        (record.attributes["operation"], record.attributes["status_code"])
+        for record in records
+        if record.name == "scitacean.ScicatClient.call_endpoint"
+    ]
+    assert operations == [
+        ("validate_dataset_model", 200),
+        ("create_dataset_model", 201),
+        ("create_orig_datablock", 201),
+    ]
+
+
+def test_open_telemetry_exporter() -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.trace import StatusCode
+
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    metric_reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[metric_reader])
+
+    instrumentation.enable(
+        instrumentation.OpenTelemetryExporter(
+            tracer=tracer_provider.get_tracer("scitacean"),
+            meter=meter_provider.get_meter("scitacean"),
+        )
+    )
+    try:
+        with instrumentation.span("outer", a=1) as s:
+            s.set_attribute("b", 2)
+            with (
+                pytest.raises(RuntimeError),
+                instrumentation.span("inner"),
+            ):
+                raise RuntimeError("failed")
+    finally:
+        instrumentation.disable()
+
+    inner, outer = span_exporter.get_finished_spans()
+    assert outer.name == "outer"
+    assert dict(outer.attributes or {}) == {"a": 1, "b": 2}
+    assert inner.parent is not None
+    assert inner.parent.span_id == outer.context.span_id
+    assert inner.status.status_code == StatusCode.ERROR
+    assert inner.events[0].name == "exception"
+
+    metrics = metric_reader.get_metrics_data()
+    assert metrics is not None
+    [metric] = metrics.resource_metrics[0].scope_metrics[0].metrics
+    assert metric.name == "scitacean.span.duration"
+    assert {
+        dict(point.attributes or {})["scitacean.span"]
+        for point in metric.data.data_points
+    } == {"inner", "outer"}
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from scitacean import Dataset, RemotePath
+from scitacean.logging import (
+    get_file_log_mode,
+    get_logger,
+    logger_name,
+    set_file_log_mode,
+)
+from scitacean.testing.client import FakeClient
+from scitacean.transfer.copy import CopyFileTransfer
+
+
+@pytest.fixture(autouse=True)
+def _reset_file_log_mode() -> Iterator[None]:
+    yield
+    set_file_log_mode("per-file")
+
+
+def upload_files(tmp_path: Path, n_files: int) -> None:
+    dataset = Dataset(
+        type="raw",
+        owner_group="uu",
+        access_groups=["faculty"],
+        contact_email="p.stibbons@uu.am",
+        principal_investigators=["Mustrum Ridcully"],
+        owner="PonderStibbons",
+        creation_time=datetime(2024, 1, 1, tzinfo=UTC),
+        source_folder=RemotePath((tmp_path / "server").as_posix()),
+    )
+    for i in range(n_files):
+        path = tmp_path / "local" / f"file{i}.dat"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(f"file {i}")
+        dataset.add_local_files(path)
+    client = FakeClient.without_login(url="", file_transfer=CopyFileTransfer())
+    client.upload_new_dataset_now(dataset)
+
+
+def test_get_logger_returns_scitacean_logger() -> None:
+    assert get_logger() is logging.getLogger(logger_name())
+
+
+def test_file_log_mode_is_per_file_by_default() -> None:
+    assert get_file_log_mode() == "per-file"
+
+
+def test_set_file_log_mode_rejects_invalid_mode() -> None:
+    with pytest.raises(ValueError, match="Invalid file log mode"):
+        set_file_log_mode("none")  # type: ignore[arg-type]
+    assert get_file_log_mode() == "per-file"
+
+
+def test_per_file_mode_logs_every_file(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level("INFO", logger=logger_name()):
+        upload_files(tmp_path, n_files=3)
+    copies = [r for r in caplog.records if r.getMessage().startswith("Copying file")]
+    assert len(copies) == 3
+    assert all(r.levelno == logging.INFO for r in copies)
+    assert not any(r.getMessage().startswith("Uploaded") for r in caplog.records)
+
+
+def test_summary_mode_logs_one_line_per_batch(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    set_file_log_mode("summary")
+    assert get_file_log_mode() == "summary"
+    with caplog.at_level("INFO", logger=logger_name()):
+        upload_files(tmp_path, n_files=3)
+    assert not any(r.getMessage().startswith("Copying file") for r in caplog.records)
+    [summary] = [r for r in caplog.records if r.getMessage().startswith("Uploaded")]
+    assert summary.levelno == logging.INFO
+    assert summary.getMessage().startswith(
+        f"Uploaded 3 files to {(tmp_path / 'server').as_posix()} in "
+    )
+
+
+def test_summary_mode_logs_files_at_debug_level(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    set_file_log_mode("summary")
+    with caplog.at_level("DEBUG", logger=logger_name()):
+        upload_files(tmp_path, n_files=2)
+    copies = [r for r in caplog.records if r.getMessage().startswith("Copying file")]
+    assert len(copies) == 2
+    assert all(r.levelno == logging.DEBUG for r in copies)
@@ -67,3 +67,96 @@ def test_can_look_up_technique_by_iri() -> None:
 def test_lookup_rejects_ambiguous_label() -> None:
     with pytest.raises(ValueError, match="multiple techniques"):
         ontology.find_technique("diffraction")
+
+
+def test_find_techniques_looks_up_all_labels_and_iris() -> None:
+    techniques = ontology.find_techniques(
+        [
+            "SXRD",
+            "http://purl.org/pan-science/PaNET/PaNET01239",
+            "Total Scattering",
+            "sxrd",
+            "SXRD",
+        ]
+    )
+    assert techniques == [
+        ontology.find_technique("sxrd"),
+        ontology.find_technique("neutron reflectometry"),
+        ontology.find_technique("total scattering"),
+        ontology.find_technique("sxrd"),
+        ontology.find_technique("sxrd"),
+    ]
+    assert techniques[0] is not techniques[4]
+
+
+def test_find_techniques_rejects_unknown_label() -> None:
+    with pytest.raises(ValueError, match="Unknown technique label"):
+        ontology.find_techniques(["total scattering", "not a technique"])
+
+
+def test_every_label_finds_a_technique_with_that_label() -> None:
+    techniques = ontology.expands_techniques()
+    for iri, labels in techniques.items():
+        for label in labels:
+            try:
+                technique = ontology.find_technique(label)
+            except ValueError as err:
+                assert "multiple techniques" in str(err)  # noqa: PT017
+                assert iri in str(err)  # noqa: PT017
+            else:
+                assert label in techniques[technique.pid]
+
+
+def test_label_index_matches_techniques() -> None:
+    techniques = ontology.expands_techniques()
+    expected: dict[str, list[str]] = {}
+    for iri, labels in techniques.items():
+        for label in labels:
+            if iri not in expected.setdefault(label, []):
+                expected[label].append(iri)
+    assert ontology._expands_label_index() == expected
+
+
+def test_search_techniques_finds_exact_label_first() -> None:
+    [best, *_] = ontology.search_techniques("Neutron  Reflectometry ")
+    assert best.technique == ontology.find_technique("neutron reflectometry")
+    assert best.label == "neutron reflectometry"
+    assert best.score == 1.0
+
+
+def test_search_techniques_tolerates_typos() -> None:
+    [best, *_] = ontology.search_techniques("small angle neutron scatering")
+    assert best.technique == ontology.find_technique("small angle neutron scattering")
+    assert 0.5 < best.score < 1.0
+
+
+def test_search_techniques_finds_alternative_labels() -> None:
+    [best, *_] = ontology.search_techniques("sxrd")
+    assert best.technique == ontology.find_technique("sxrd")
+    assert best.technique.name == "x-ray single crystal diffraction"
+    assert best.label == "sxrd"
+
+
+def test_search_techniques_finds_labels_by_prefix() -> None:
+    [match] = ontology.search_techniques("polarized neutron refl", limit=1)
+    assert match.label.startswith("polarized neutron refl")
+    assert match.technique == ontology.find_technique(match.label)
+
+
+def test_search_techniques_returns_sorted_unique_techniques() -> None:
+    matches = ontology.search_techniques("x-ray diffraction", limit=20)
+    assert len(matches) == 20
+    scores = [m.score for m in matches]
+    assert scores == sorted(scores, reverse=True)
+    assert len({m.technique.pid for m in matches}) == 20
+
+
+def test_search_techniques_respects_min_score() -> None:
+    matches = ontology.search_techniques("x-ray diffraction", min_score=0.6)
+    assert matches
+    assert all(m.score >= 0.6 for m in matches)
+
+
+@pytest.mark.parametrize("query", ["", "   ", "§§§§"])
+def test_search_techniques_without_match(query: str) -> None:
+    assert ontology.search_techniques(query) == []
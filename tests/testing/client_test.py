@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+from datetime import UTC, datetime
+
+import pytest
+
+from scitacean import PID, RemotePath
+from scitacean.model import DownloadDataset, UploadDataset
+from scitacean.testing.client import DatasetStore, FakeClient
+
+
+def make_upload_model(
+    name: str = "Data",
+    owner_group: str = "uu",
+    proposal_ids: list[str] | None = None,
+    creation_time: datetime = datetime(2024, 1, 1, tzinfo=UTC),
+) -> UploadDataset:
+    return UploadDataset(
+        type="raw",
+        datasetName=name,
+        ownerGroup=owner_group,
+        accessGroups=["faculty"],
+        contactEmail="p.stibbons@uu.am",
+        principalInvestigators=["Mustrum Ridcully"],
+        owner="PonderStibbons",
+        creationTime=creation_time,
+        creationLocation="UU",
+        sourceFolder=RemotePath("/hex/data"),
+        proposalIds=proposal_ids,
+        scientificMetadata={"temperature": {"value": 123, "unit": "K"}},
+    )
+
+
+def make_download_model(
+    pid: PID, owner_group: str, proposal_ids: list[str] | None = None
+) -> DownloadDataset:
+    return DownloadDataset(pid=pid, ownerGroup=owner_group, proposalIds=proposal_ids)
+
+
+PID_A = PID(prefix="p", pid="a")
+PID_B = PID(prefix="p", pid="b")
+PID_C = PID(prefix="p", pid="c")
+
+
+def test_dataset_store_index_by_owner_group() -> None:
+    store = DatasetStore()
+    a = make_download_model(PID_A, "uu")
+    b = make_download_model(PID_B, "faculty")
+    c = make_download_model(PID_C, "uu")
+    store[PID_A] = a
+    store[PID_B] = b
+    store[PID_C] = c
+    assert store.by_owner_group("uu") == [a, c]
+    assert store.by_owner_group("faculty") == [b]
+    assert store.by_owner_group("nobody") == []
+
+
+def test_dataset_store_index_by_proposal() -> None:
+    a = make_download_model(PID_A, "uu", ["prop1", "prop2"])
+    b = make_download_model(PID_B, "uu", ["prop2"])
+    c = make_download_model(PID_C, "uu")
+    store = DatasetStore({PID_A: a, PID_B: b, PID_C: c})
+    assert store.by_proposal("prop1") == [a]
+    assert store.by_proposal("prop2") == [a, b]
+
+
+def test_dataset_store_updates_index_on_replace_and_delete() -> None:
+    a = make_download_model(PID_A, "uu", ["prop1"])
+    store = DatasetStore([(PID_A, a)])
+    replaced = a.model_copy(update={"ownerGroup": "faculty", "proposalIds": None})
+    store[PID_A] = replaced
+    assert store.by_owner_group("uu") == []
+    assert store.by_owner_group("faculty") == [replaced]
+    assert store.by_proposal("prop1") == []
+
+    del store[PID_A]
+    assert store.by_owner_group("faculty") == []
+    assert len(store) == 0
+
+
+def test_dataset_store_behaves_like_dict() -> None:
+    a = make_download_model(PID_A, "uu")
+    b = make_download_model(PID_B, "uu")
+    store = DatasetStore()
+    store.update({PID_A: a, PID_B: b})
+    assert store == {PID_A: a, PID_B: b}
+    assert list(store) == [PID_A, PID_B]
+    assert PID_A in store
+    assert store.pop(PID_A) is a
+    assert store.get(PID_A) is None
+    store.clear()
+    assert store.by_owner_group("uu") == []
+
+
+def test_query_datasets_by_owner_group_and_proposal() -> None:
+    client = FakeClient.without_login(url="")
+    scicat = client.scicat
+    a = scicat.create_dataset_model(make_upload_model("a", "uu", ["prop1"]))
+    b = scicat.create_dataset_model(make_upload_model("b", "faculty", ["prop1"]))
+    c = scicat.create_dataset_model(make_upload_model("c", "uu", ["prop2"]))
+
+    assert [ds.pid for ds in scicat.query_datasets({"ownerGroup": "uu"})] == [
+        a.pid,
+        c.pid,
+    ]
+    assert [ds.pid for ds in scicat.query_datasets({"proposalIds": "prop1"})] == [
+        a.pid,
+        b.pid,
+    ]
+    assert [
+        ds.pid
+        for ds in scicat.query_datasets({"ownerGroup": "uu", "proposalIds": "prop1"})
+    ] == [a.pid]
+    assert [ds.pid for ds in scicat.query_datasets({"datasetName": "b"})] == [b.pid]
+    assert scicat.query_datasets({"datasetName": "d"}) == []
+
+
+def test_query_datasets_order_and_limit() -> None:
+    scicat = FakeClient.without_login(url="").scicat
+    for i, name in enumerate(("a", "b", "a", "a")):
+        scicat.create_dataset_model(
+            make_upload_model(name, creation_time=datetime(2024, 1, 1 + i, tzinfo=UTC))
+        )
+    newest = scicat.query_datasets(
+        {"datasetName": "a"}, order="creationTime:desc", limit=2
+    )
+    assert [ds.creationTime.day for ds in newest] == [4, 3]  # type: ignore[union-attr]
+    with pytest.raises(ValueError, match="order"):
+        scicat.query_datasets({}, limit=1)
+
+
+def test_stored_dataset_is_isolated_from_input_and_output() -> None:
+    client = FakeClient.without_login(url="")
+    upload = make_upload_model()
+    created = client.scicat.create_dataset_model(upload)
+    upload.scientificMetadata["temperature"]["value"] = 0  # type: ignore[index]
+
+    fetched = client.scicat.get_dataset_model(created.pid)  # type: ignore[arg-type]
+    fetched.scientificMetadata["temperature"]["value"] = 1  # type: ignore[index]
+    fetched.accessGroups.append("everyone")  # type: ignore[union-attr]
+
+    stored = client.datasets[created.pid]  # type: ignore[index]
+    assert stored.scientificMetadata == {"temperature": {"value": 123, "unit": "K"}}
+    assert stored.accessGroups == ["faculty"]
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+
+from scitacean import PID, Dataset, ScicatCommError, ScicatLoginError
+from scitacean.client import ScicatClient
+from scitacean.model import DownloadInstrument, UploadDataset, UploadSample
+from scitacean.testing.emulator import Fault, ScicatEmulator
+from scitacean.testing.transfer import FakeFileTransfer
+
+
+def make_dataset(
+    name: str = "Data",
+    creation_time: datetime = datetime(2024, 1, 1, tzinfo=UTC),
+    is_published: bool = False,
+) -> Dataset:
+    return Dataset(
+        type="raw",
+        name=name,
+        owner="PonderStibbons",
+        owner_group="uu",
+        access_groups=["faculty"],
+        contact_email="p.stibbons@uu.am",
+        principal_investigators=["Mustrum Ridcully"],
+        creation_time=creation_time,
+        source_folder="/hex/data",
+        is_published=is_published,
+    )
+
+
+def make_upload_model(
+    name: str = "Data", creation_time: datetime = datetime(2024, 1, 1, tzinfo=UTC)
+) -> UploadDataset:
+    return make_dataset(name=name, creation_time=creation_time).make_upload_model()
+
+
+@pytest.fixture
+def emulator() -> ScicatEmulator:
+    emulator = ScicatEmulator()
+    emulator.instruments["inst/1"] = DownloadInstrument(
+        pid="inst/1", uniqueName="hex", name="Hex"
+    )
+    return emulator
+
+
+def test_upload_and_download_dataset(fs: FakeFilesystem) -> None:
+    fs.create_file("data/file.nxs", contents=b"neutrons")
+    emulator = ScicatEmulator()
+    client = emulator.client(file_transfer=FakeFileTransfer(fs=fs))
+    dataset = make_dataset()
+    dataset.add_local_files("data/file.nxs")
+
+    uploaded = client.upload_new_dataset_now(dataset)
+    assert uploaded.pid in emulator.datasets
+    assert len(emulator.orig_datablocks[uploaded.pid]) == 1
+
+    downloaded = client.get_dataset(uploaded.pid)
+    assert downloaded.name == "Data"
+    assert [f.remote_path.posix for f in downloaded.files] == ["file.nxs"]
+    assert emulator.request_counts["POST datasets"] == 1
+    assert emulator.request_counts["POST origdatablocks"] == 1
+    assert emulator.request_counts["GET datasets/{pid}"] == 1
+
+
+def test_get_dataset_that_does_not_exist_raises() -> None:
+    client = ScicatEmulator().scicat_client()
+    with pytest.raises(ScicatCommError, match="404"):
+        client.get_dataset_model(PID(prefix="abc", pid="def"))
+
+
+def test_unauthenticated_client_can_only_get_public_datasets() -> None:
+    emulator = ScicatEmulator()
+    authenticated = emulator.scicat_client()
+    private = authenticated.create_dataset_model(make_upload_model("private"))
+    public = authenticated.create_dataset_model(
+        make_dataset(name="public", is_published=True).make_upload_model()
+    )
+
+    client = emulator.scicat_client(authenticated=False)
+    assert client.get_dataset_model(public.pid).datasetName == "public"  # type: ignore[arg-type]
+    with pytest.raises(ScicatCommError, match="403"):
+        client.get_dataset_model(private.pid)  # type: ignore[arg-type]
+    with pytest.raises(ScicatCommError, match="401"):
+        client.create_dataset_model(make_upload_model())
+
+
+def test_query_datasets() -> None:
+    client = ScicatEmulator().scicat_client()
+    for i, name in enumerate(("a", "b", "a", "a")):
+        client.create_dataset_model(
+            make_upload_model(name, datetime(2024, 1, 1 + i, tzinfo=UTC))
+        )
+
+    found = client.query_datasets({"datasetName": "a"})
+    assert len(found) == 3
+    newest = client.query_datasets(
+        {"datasetName": "a"}, order="creationTime:desc", limit=2
+    )
+    assert [ds.creationTime.day for ds in newest] == [4, 3]  # type: ignore[union-attr]
+
+
+def test_query_datasets_without_filter_returns_all() -> None:
+    client = ScicatEmulator().scicat_client()
+    client.create_dataset_model(make_upload_model("a"))
+    client.create_dataset_model(make_upload_model("b"))
+    found = client.query_datasets({})
+    assert sorted(ds.datasetName for ds in found) == ["a", "b"]  # type: ignore[type-var]
+
+
+def test_log_in_with_credentials() -> None:
+    emulator = ScicatEmulator(users={"ponder": "hex"})
+    client = ScicatClient.from_credentials(
+        url=emulator.url,
+        username="ponder",
+        password="hex",  # noqa: S106
+        transport=emulator.transport(),
+    )
+    client.create_dataset_model(make_upload_model())
+    with pytest.raises(ScicatLoginError):
+        ScicatClient.from_credentials(
+            url=emulator.url,
+            username="ponder",
+            password="wrong",  # noqa: S106
+            transport=emulator.transport(),
+        )
+
+
+def test_instruments_and_samples(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+
+    assert client.get_instrument_model("inst/1").name == "Hex"
+    assert [i.pid for i in client.get_all_instrument_models()] == ["inst/1"]
+
+    sample = client.create_sample_model(
+        UploadSample(ownerGroup="uu", sampleName="Octarine")
+    )
+    assert client.get_sample_model(sample.sampleId).sampleName == "Octarine"  # type: ignore[arg-type]
+
+
+def test_injected_fault_response(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    emulator.inject_fault(Fault(status_code=503, route="POST datasets"), count=2)
+    model = make_upload_model()
+
+    # Not affected because the route does not match.
+    assert client.get_instrument_model("inst/1").name == "Hex"
+    for _ in range(2):
+        with pytest.raises(ScicatCommError, match="503"):
+            client.create_dataset_model(model)
+    client.create_dataset_model(model)
+    assert emulator.request_counts["POST datasets"] == 3
+    assert len(emulator.datasets) == 1
+
+
+def test_injected_fault_exception(emulator: ScicatEmulator) -> None:
+    client = emulator.scicat_client()
+    emulator.inject_fault(Fault(exception=httpx.ConnectError))
+    with pytest.raises(httpx.ConnectError):
+        client.get_instrument_model("inst/1")
+    assert client.get_instrument_model("inst/1").name == "Hex"
+
+
+def test_random_errors(emulator: ScicatEmulator) -> None:
+    emulator.error_rate = 0.5
+    client = emulator.scicat_client()
+    n_failed = 0
+    for _ in range(100):
+        try:
+            client.get_instrument_model("inst/1")
+        except ScicatCommError:
+            n_failed += 1
+    assert 25 < n_failed < 75
+
+
+def test_latency_applies_to_concurrent_requests_independently(
+    emulator: ScicatEmulator,
+) -> None:
+    latencies: list[str] = []
+
+    def latency(request: httpx.Request) -> float:
+        latencies.append(request.url.path)
+        return 0.1
+
+    emulator.latency = latency
+    client = emulator.scicat_client()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: client.get_instrument_model("inst/1"), range(8))
+        )
+    elapsed = time.perf_counter() - start
+
+    assert [r.name for r in results] == ["Hex"] * 8
+    assert latencies == ["/api/v3/instruments/inst/1"] * 8
+    assert elapsed < 0.5
+
+
+def test_requests_to_other_urls_are_not_found(emulator: ScicatEmulator) -> None:
+    client = ScicatClient.from_token(
+        url="https://other.server/scicat/api",
+        token=emulator.issue_token(),
+        transport=emulator.transport(),
+    )
+    with pytest.raises(ScicatCommError, match="404"):
+        client.get_instrument_model("inst/1")
+
+
+def test_scicat_client_closes_http_clients(emulator: ScicatEmulator) -> None:
+    closed = 0
+
+    class Transport(httpx.MockTransport):
+        def close(self) -> None:
+            nonlocal closed
+            closed += 1
+
+    client = ScicatClient.from_token(
+        url=emulator.url,
+        token=emulator.issue_token(),
+        transport=Transport(emulator.handle_request),
+    )
+    client.get_instrument_model("inst/1")
+    client.get_instrument_model("inst/1")
+    assert closed == 2
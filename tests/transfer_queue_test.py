@@ -0,0 +1,284 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from scitacean import PID, Client, Dataset, RemotePath
+from scitacean.model import DownloadDataFile, DownloadDataset, DownloadOrigDatablock
+from scitacean.testing.backend import config as backend_config
+from scitacean.testing.client import FakeClient
+from scitacean.testing.transfer import FakeDownloadConnection, FakeFileTransfer
+from scitacean.transfer_queue import Job, TransferQueue
+
+
+@pytest.fixture
+def client(scicat_access: backend_config.SciCatAccess) -> FakeClient:
+    return FakeClient.from_credentials(
+        url="",
+        **scicat_access.user.credentials,
+        file_transfer=FakeFileTransfer(
+            files={RemotePath("/src/data/file.dat"): b"remote contents"}
+        ),
+    )
+
+
+@pytest.fixture
+def local_dataset(tmp_path: Path) -> Dataset:
+    path = tmp_path / "upload.dat"
+    path.write_bytes(b"local contents")
+    dataset = Dataset(
+        type="raw",
+        owner="PonderStibbons",
+        owner_group="uu",
+        contact_email="p.stibbons@uu.am",
+        principal_investigators=["ridcully@uu.am"],
+        creation_time=datetime.fromisoformat("2011-08-24T12:34:56Z"),
+        source_folder="/src/upload",
+    )
+    dataset.add_local_files(path)
+    return dataset
+
+
+@pytest.fixture
+def remote_dataset() -> Dataset:
+    content = b"remote contents"
+    model = DownloadDataset(
+        contactEmail="p.stibbons@uu.am",
+        creationTime=datetime.fromisoformat("1995-08-06T14:14:14Z"),
+        owner="pstibbons",
+        ownerGroup="faculty",
+        pid=PID(prefix="UU.000", pid="5125.ab.663.8c9f"),
+        principalInvestigators=["m.ridcully@uu.am"],
+        sourceFolder=RemotePath("/src/data"),
+        type="raw",
+    )
+    block = DownloadOrigDatablock(
+        chkAlg="md5",
+        ownerGroup="faculty",
+        size=len(content),
+        datasetId=PID(prefix="UU.000", pid="5125.ab.663.8c9f"),
+        dataFileList=[
+            DownloadDataFile(
+                path="file.dat",
+                size=len(content),
+                chk=hashlib.md5(content).hexdigest(),
+                time=datetime.fromisoformat("1995-08-06T14:14:14Z"),
+            )
+        ],
+    )
+    return Dataset.from_download_model(
+        dataset_model=model.model_copy(update={"origdatablocks": [block]})
+    )
+
+
+def test_upload_job(client: FakeClient, local_dataset: Dataset, tmp_path: Path) -> None:
+    finished: list[Job] = []
+    with TransferQueue(client, database=tmp_path / "jobs.sqlite") as queue:
+        future = queue.submit_upload(local_dataset, callback=finished.append)
+        uploaded = future.result()
+        [job] = queue.jobs()
+
+    assert uploaded.pid is not None
+    assert job.kind == "upload"
+    assert job.state == "done"
+    assert job.result_id == str(uploaded.pid)
+    assert finished == [job]
+
+
+def test_download_job(
+    client: FakeClient, remote_dataset: Dataset, tmp_path: Path
+) -> None:
+    with TransferQueue(client, database=tmp_path / "jobs.sqlite") as queue:
+        future = queue.submit_download(remote_dataset, target=tmp_path / "download")
+        downloaded = future.result()
+        [job] = queue.jobs(state="done")
+
+    assert (tmp_path / "download" / "file.dat").read_bytes() == b"remote contents"
+    assert downloaded.files[0].local_path == tmp_path / "download" / "file.dat"
+    assert job.kind == "download"
+    assert job.dataset_id == str(remote_dataset.pid)
+
+
+class _FailingFileTransfer(FakeFileTransfer):
+    @contextmanager
+    def connect_for_download(
+        self, dataset: Dataset, representative_file_path: RemotePath
+    ) -> Iterator[FakeDownloadConnection]:
+        raise RuntimeError("Connection refused")
+
+
+def test_failed_job(remote_dataset: Dataset, tmp_path: Path) -> None:
+    client = Client.without_login(url="/", file_transfer=_FailingFileTransfer())
+    finished: list[Job] = []
+    with TransferQueue(client, database=tmp_path / "jobs.sqlite") as queue:
+        future = queue.submit_download(
+            remote_dataset, target=tmp_path / "download", callback=finished.append
+        )
+        with pytest.raises(RuntimeError, match="Connection refused"):
+            future.result()
+        [job] = queue.jobs()
+
+    assert job.state == "failed"
+    assert job.error == "RuntimeError: Connection refused"
+    assert finished == [job]
+
+
+def test_queued_jobs_can_be_resumed_after_shutdown(
+    client: FakeClient, remote_dataset: Dataset, tmp_path: Path
+) -> None:
+    release = threading.Event()
+    queue = TransferQueue(client, database=tmp_path / "jobs.sqlite", max_workers=1)
+    blocker = queue._executor.submit(release.wait)
+    queue.submit_download(remote_dataset, target=tmp_path / "download")
+    queue.shutdown(wait=False)
+    release.set()
+    blocker.result()
+
+    with TransferQueue(client, database=tmp_path / "jobs.sqlite") as queue:
+        assert [job.state for job in queue.jobs()] == ["queued"]
+        futures = queue.resume()
+        futures[1].result()
+        assert [job.state for job in queue.jobs()] == ["done"]
+    assert (tmp_path / "download" / "file.dat").read_bytes() == b"remote contents"
+
+
+def test_interrupted_jobs_are_recovered(
+    client: FakeClient,
+    local_dataset: Dataset,
+    remote_dataset: Dataset,
+    tmp_path: Path,
+) -> None:
+    database = tmp_path / "jobs.sqlite"
+    with TransferQueue(client, database=database) as queue:
+        queue.submit_upload(local_dataset).result()
+        queue.submit_download(remote_dataset, target=tmp_path / "download").result()
+    # Simulate a program that stopped while both jobs were running.
+    with sqlite3.connect(database) as db:
+        db.execute("UPDATE jobs SET state = 'running'")
+    db.close()
+
+    with TransferQueue(client, database=database) as queue:
+        upload, download = queue.jobs()
+        assert upload.state == "failed"
+        assert upload.error is not None
+        assert download.state == "queued"
+        queue.resume()[download.id].result()
+        assert queue.job(download.id).state == "done"
+
+
+def _queue_download_without_running_it(
+    client: FakeClient, remote_dataset: Dataset, database: Path, target: Path
+) -> None:
+    release = threading.Event()
+    queue = TransferQueue(client, database=database, max_workers=1)
+    blocker = queue._executor.submit(release.wait)
+    queue.submit_download(remote_dataset, target=target)
+    queue.shutdown(wait=False)
+    release.set()
+    blocker.result()
+
+
+@pytest.mark.parametrize("kind", ["upload", "download"])
+def test_running_jobs_of_live_queue_are_not_recovered(
+    client: FakeClient,
+    local_dataset: Dataset,
+    remote_dataset: Dataset,
+    tmp_path: Path,
+    kind: str,
+) -> None:
+    database = tmp_path / "jobs.sqlite"
+    with TransferQueue(client, database=database) as queue:
+        if kind == "upload":
+            queue.submit_upload(local_dataset).result()
+        else:
+            queue.submit_download(remote_dataset, target=tmp_path / "dl").result()
+    # Simulate a job that is running in another process.
+    with sqlite3.connect(database) as db:
+        db.execute(
+            "UPDATE jobs SET state = 'running', owner = 'other', lease_expires_at = ?",
+            (time.time() + 3600,),
+        )
+    db.close()
+
+    with TransferQueue(client, database=database) as queue:
+        assert queue.resume() == {}
+        [job] = queue.jobs()
+        assert job.state == "running"
+
+    # The other process stopped renewing its lease.
+    with sqlite3.connect(database) as db:
+        db.execute("UPDATE jobs SET lease_expires_at = ?", (time.time() - 1,))
+    db.close()
+
+    with TransferQueue(client, database=database) as queue:
+        [job] = queue.jobs()
+        assert job.state == ("failed" if kind == "upload" else "queued")
+
+
+def test_queued_job_is_resumed_by_only_one_queue(
+    client: FakeClient, remote_dataset: Dataset, tmp_path: Path
+) -> None:
+    database = tmp_path / "jobs.sqlite"
+    _queue_download_without_running_it(
+        client, remote_dataset, database, tmp_path / "download"
+    )
+
+    release = threading.Event()
+    first = TransferQueue(client, database=database, max_workers=1)
+    blocker = first._executor.submit(release.wait)
+    try:
+        first_futures = first.resume()
+        with TransferQueue(client, database=database) as second:
+            assert second.resume() == {}
+    finally:
+        release.set()
+        blocker.result()
+        first.shutdown()
+
+    [future] = first_futures.values()
+    future.result()
+    assert [job.state for job in first.jobs()] == ["done"]
+
+
+class _Evil:
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return print, ("should not be called",)
+
+
+def test_resume_fails_jobs_with_invalid_inputs(
+    client: FakeClient, remote_dataset: Dataset, tmp_path: Path
+) -> None:
+    database = tmp_path / "jobs.sqlite"
+    for _ in range(3):
+        _queue_download_without_running_it(
+            client, remote_dataset, database, tmp_path / "download"
+        )
+    with sqlite3.connect(database) as db:
+        db.execute("UPDATE jobs SET payload = ? WHERE id = 1", (b"not a pickle",))
+        db.execute(
+            "UPDATE jobs SET payload = ? WHERE id = 2", (pickle.dumps((_Evil(), {})),)
+        )
+    db.close()
+
+    with TransferQueue(client, database=database) as queue:
+        futures = queue.resume()
+        assert list(futures) == [3]
+        futures[3].result()
+        corrupt, forbidden, valid = queue.jobs()
+
+    assert corrupt.state == "failed"
+    assert corrupt.error is not None
+    assert corrupt.error.startswith("The job inputs could not be loaded")
+    assert forbidden.state == "failed"
+    assert forbidden.error is not None
+    assert "builtins.print" in forbidden.error
+    assert valid.state == "done"
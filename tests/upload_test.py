@@ -19,6 +19,7 @@ from scitacean import (
     ScicatCommError,
     Thumbnail,
 )
+from scitacean.filesystem import checksum_of_file
 from scitacean.testing.backend import config as backend_config
 from scitacean.testing.client import FakeClient
 from scitacean.testing.transfer import FakeFileTransfer
@@ -121,6 +122,21 @@ def test_upload_returns_updated_dataset_with_attachments(
     assert finalized == expected
 
 
+def test_upload_does_not_freeze_metadata_of_input_files(
+    client: FakeClient, dataset_with_files: Dataset
+) -> None:
+    client.upload_new_dataset_now(dataset_with_files)
+    with open("file.nxs", "wb") as f:
+        f.write(b"new contents")
+    file = dataset_with_files.get_file("file.nxs")
+    assert file is not None
+    assert file.size == len(b"new contents")
+    assert file.checksum_algorithm is not None
+    assert file.checksum() == checksum_of_file(
+        "file.nxs", algorithm=file.checksum_algorithm
+    )
+
+
 def test_upload_without_files_creates_dataset(
     client: FakeClient, dataset: Dataset
 ) -> None:
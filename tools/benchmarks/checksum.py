@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmark checksum engines and block sizes on a filesystem.
+
+Writes a test file into the given directory, computes its checksum with every
+combination of engine and block size, and prints the fastest one.
+Run with, e.g.,
+
+.. code-block:: sh
+
+    python tools/benchmarks/checksum.py /mnt/gpfs/scratch --size-mib 4096
+
+Use the result with :func:`scitacean.filesystem.set_checksum_engine`.
+Note that repeated reads of the same file may be served from the page cache.
+Use a file larger than the available memory to measure the filesystem itself.
+"""
+# ruff: noqa: T201
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from scitacean.filesystem import checksum_of_file
+
+ENGINES = ("read", "read-ahead", "mmap", "file_digest")
+BLOCK_SIZES = tuple(1 << p for p in range(17, 27))  # 128 KiB to 64 MiB
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directory", type=Path, help="Where to write the test file")
+    parser.add_argument("--size-mib", type=int, default=1024)
+    parser.add_argument("--algorithm", default="blake2b")
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def write_test_file(path: Path, size_mib: int) -> None:
+    chunk = os.urandom(1 << 20)
+    with path.open("wb") as f:
+        for _ in range(size_mib):
+            f.write(chunk)
+
+
+def measure(path: Path, algorithm: str, engine: str, block_size: int, n: int) -> float:
+    best = float("inf")
+    for _ in range(n):
+        start = time.perf_counter()
+        checksum_of_file(
+            path, algorithm=algorithm, engine=engine, block_size=block_size
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(dir=args.directory) as tmp:
+        path = Path(tmp) / "checksum-benchmark.dat"
+        write_test_file(path, args.size_mib)
+        print(f"Hashing {args.size_mib} MiB with {args.algorithm}")
+
+        results = {}
+        for engine in ENGINES:
+            # file_digest uses a fixed block size.
+            for block_size in (
+                BLOCK_SIZES[:1] if engine == "file_digest" else BLOCK_SIZES
+            ):
+                seconds = measure(path, args.algorithm, engine, block_size, args.repeat)
+                results[engine, block_size] = seconds
+                print(
+                    f"{engine:<12} {block_size >> 10:>8} KiB "
+                    f"{args.size_mib / seconds:10.1f} MiB/s"
+                )
+
+    engine, block_size = min(results, key=results.__getitem__)
+    print(
+        "\nFastest configuration:\n"
+        "    scitacean.filesystem.set_checksum_engine("
+        f"{engine!r}, block_size={block_size})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Micro-benchmark for File and RemotePath on datasets with many files.
+
+Measures the time to construct files from download models and common
+operations on remote paths as well as the memory used per file.
+Run with, e.g.,
+
+.. code-block:: sh
+
+    python tools/benchmarks/files.py --n-files 1000000
+"""
+# ruff: noqa: T201
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from scitacean import File, RemotePath, model
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-files", type=int, default=1_000_000)
+    return parser.parse_args()
+
+
+def make_models(n_files: int) -> list[model.DownloadDataFile]:
+    creation_time = datetime(2025, 1, 1, tzinfo=UTC)
+    return [
+        model.DownloadDataFile.model_construct(
+            path=f"raw/scan_{i:07d}.nxs",
+            size=i,
+            time=creation_time,
+            chk="d41d8cd98f00b204e9800998ecf8427e",
+            uid="1000",
+            gid="1000",
+            perm="-rw-r--r--",
+        )
+        for i in range(n_files)
+    ]
+
+
+def timed(name: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    print(f"{name:<28} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def make_files(models: list[model.DownloadDataFile]) -> list[File]:
+    return [File.from_download_model(m, checksum_algorithm="md5") for m in models]
+
+
+def benchmark_remote_paths(paths: list[RemotePath]) -> None:
+    target = RemotePath("raw/scan_0000005.nxs")
+    timed("RemotePath == str", lambda: sum(p == target.posix for p in paths))
+    timed("RemotePath == RemotePath", lambda: sum(p == target for p in paths))
+    timed("hash(RemotePath)", lambda: set(paths))
+    timed("RemotePath.parent", lambda: [p.parent for p in paths])
+    timed("RemotePath / str", lambda: [p / "sub" for p in paths])
+
+
+def measure_memory_per_file(models: list[model.DownloadDataFile]) -> float:
+    tracemalloc.start()
+    files = make_files(models)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used / len(files)
+
+
+def main() -> None:
+    args = parse_args()
+    models = make_models(args.n_files)
+    print(f"Benchmarking with {args.n_files} files")
+
+    files = timed("File.from_download_model", lambda: make_files(models))
+    benchmark_remote_paths([f.remote_path for f in files])
+    del files
+
+    per_file = measure_memory_per_file(models[:100_000])
+    print(f"{'Memory per file':<28} {per_file:8.1f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmark cold-start load times of the techniques ontology.
+
+Compares the shipped resource (uncompressed JSON with precomputed indices)
+with the previous format (bz2 compressed JSON without indices that are then
+built after loading).
+Each measurement runs in a fresh Python process to include first-use overheads
+but excludes the time to import Scitacean itself.
+Run with, e.g.,
+
+.. code-block:: sh
+
+    python tools/benchmarks/ontology.py --repeat 20
+"""
+# ruff: noqa: S603, T201
+
+import argparse
+import bz2
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+CURRENT = """
+import time
+from scitacean import ontology
+start = time.perf_counter()
+ontology.find_technique("small angle neutron scattering")
+print(time.perf_counter() - start)
+"""
+
+LEGACY = """
+import bz2, json, time
+from scitacean import ontology
+start = time.perf_counter()
+with bz2.open({path!r}, "rb") as f:
+    techniques = json.loads(f.read())
+index = {{}}
+for iri, labels in techniques.items():
+    for label in labels:
+        index.setdefault(label, {{}})[iri] = None
+index = {{label: list(iris) for label, iris in index.items()}}
+index["small angle neutron scattering"]
+print(time.perf_counter() - start)
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    return parser.parse_args()
+
+
+def measure(code: str, repeat: int) -> list[float]:
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], check=True, capture_output=True, text=True
+            ).stdout
+        )
+        for _ in range(repeat)
+    ]
+
+
+def report(name: str, seconds: list[float]) -> None:
+    print(
+        f"{name:<10} median {statistics.median(seconds) * 1e3:7.3f} ms"
+        f"    min {min(seconds) * 1e3:7.3f} ms"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    from scitacean import ontology
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "expands_techniques.json.bz2"
+        with bz2.open(legacy_path, "wb") as f:
+            f.write(json.dumps(ontology.expands_techniques()).encode("utf-8"))
+        report("bz2 json", measure(LEGACY.format(path=str(legacy_path)), args.repeat))
+    report("current", measure(CURRENT, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
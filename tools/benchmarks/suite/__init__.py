@@ -0,0 +1,3 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for airspeed velocity (asv), see ``tools/benchmarks/README.md``."""
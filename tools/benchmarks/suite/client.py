@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for the SciCat client against a local HTTP server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scitacean.client import ScicatClient
+
+from .common import make_dataset_json
+
+
+class _StandInServer(ThreadingHTTPServer):
+    """Minimal HTTP server that answers dataset queries with canned responses."""
+
+    def __init__(self, n_datasets: int) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.body = json.dumps(
+            [make_dataset_json(i) for i in range(n_datasets)]
+        ).encode("utf-8")
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/api"
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _StandInServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        if not self.path.startswith("/api/v3/datasets/fullquery"):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class QueryDatasets:
+    params = (1, 100, 1000)
+    param_names = ("n_datasets",)
+
+    def setup(self, n_datasets: int) -> None:
+        self.server = _StandInServer(n_datasets)
+        self.client = ScicatClient.without_login(url=self.server.url)
+
+    def teardown(self, n_datasets: int) -> None:
+        self.server.stop()
+
+    def time_query_datasets(self, n_datasets: int) -> None:
+        self.client.query_datasets({"proposalIds": ["bench.001"]})
+
+    def time_query_datasets_strict(self, n_datasets: int) -> None:
+        self.client.query_datasets(
+            {"proposalIds": ["bench.001"]}, strict_validation=True
+        )
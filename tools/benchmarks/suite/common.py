@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Helpers for constructing benchmark inputs."""
+
+from datetime import UTC, datetime
+
+from scitacean import PID, RemotePath, model
+
+CREATION_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+DATASET_PID = PID(prefix="20.500.12269", pid="bench-0001")
+
+
+def make_file_models(n_files: int) -> list[model.DownloadDataFile]:
+    return [
+        model.DownloadDataFile.model_construct(
+            path=f"raw/scan_{i // 1000:04d}/frame_{i:07d}.nxs",
+            size=i,
+            time=CREATION_TIME,
+            chk="d41d8cd98f00b204e9800998ecf8427e",
+            uid="1000",
+            gid="1000",
+            perm="-rw-r--r--",
+        )
+        for i in range(n_files)
+    ]
+
+
+def make_dataset_json(i: int) -> dict[str, object]:
+    """Return the JSON of a dataset as SciCat sends it."""
+    return {
+        "pid": f"{DATASET_PID.prefix}/bench-{i:06d}",
+        "type": "raw",
+        "contactEmail": "p.stibbons@uu.am",
+        "creationTime": CREATION_TIME.isoformat(),
+        "owner": "Ponder Stibbons",
+        "ownerGroup": "uu",
+        "accessGroups": ["faculty", "students"],
+        "principalInvestigators": ["Mustrum Ridcully"],
+        "sourceFolder": f"/hex/data/{i:06d}",
+        "proposalIds": ["bench.001"],
+        "datasetName": f"Benchmark dataset {i}",
+        "numberOfFiles": 10,
+        "size": 12345,
+        "scientificMetadata": {
+            "temperature": {"value": "273.15", "unit": "K"},
+            "sample": {"name": "Octarine", "mass": {"value": "3", "unit": "g"}},
+        },
+        "createdBy": "bench",
+        "createdAt": CREATION_TIME.isoformat(),
+        "updatedBy": "bench",
+        "updatedAt": CREATION_TIME.isoformat(),
+    }
+
+
+def make_download_model(n_files: int) -> model.DownloadDataset:
+    """Return a dataset model with one orig datablock that contains ``n_files``."""
+    files = make_file_models(n_files)
+    block = model.DownloadOrigDatablock.model_construct(
+        chkAlg="md5",
+        ownerGroup="uu",
+        size=sum(range(n_files)),  # sizes of the files from make_file_models
+        datasetId=DATASET_PID,
+        dataFileList=files,
+    )
+    return model.DownloadDataset.model_construct(
+        pid=DATASET_PID,
+        type="raw",
+        contactEmail="p.stibbons@uu.am",
+        creationTime=CREATION_TIME,
+        owner="Ponder Stibbons",
+        ownerGroup="uu",
+        principalInvestigators=["Mustrum Ridcully"],
+        sourceFolder=RemotePath("/hex/data/bench-0001"),
+        numberOfFiles=n_files,
+        size=block.size,
+        origdatablocks=[block],
+    )
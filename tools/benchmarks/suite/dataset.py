@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for datasets with many files."""
+
+from pathlib import Path
+
+from scitacean import Dataset, File
+
+from .common import make_download_model
+
+N_FILES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+class FromDownloadModel:
+    params = (N_FILES, (False, True))
+    param_names = ("n_files", "compact_files")
+    timeout = 600
+
+    def setup(self, n_files: int, compact_files: bool) -> None:
+        self.dataset_model = make_download_model(n_files)
+
+    def time_from_download_model(self, n_files: int, compact_files: bool) -> None:
+        Dataset.from_download_model(self.dataset_model, compact_files=compact_files)
+
+    def peakmem_from_download_model(self, n_files: int, compact_files: bool) -> None:
+        Dataset.from_download_model(self.dataset_model, compact_files=compact_files)
+
+    def time_iterate_files(self, n_files: int, compact_files: bool) -> None:
+        dataset = Dataset.from_download_model(
+            self.dataset_model, compact_files=compact_files
+        )
+        for _ in dataset.files:
+            pass
+
+
+class MakeUploadModel:
+    params = N_FILES[:3]
+    param_names = ("n_files",)
+
+    def setup(self, n_files: int) -> None:
+        self.dataset = Dataset.from_download_model(make_download_model(n_files))
+
+    def time_make_upload_model(self, n_files: int) -> None:
+        self.dataset.make_upload_model()
+
+    def time_make_datablock_upload_models(self, n_files: int) -> None:
+        self.dataset.make_datablock_upload_models()
+
+
+class ReplaceFiles:
+    params = (N_FILES[:3], (0.001, 0.1, 1.0))
+    param_names = ("n_files", "fraction_replaced")
+
+    def setup(self, n_files: int, fraction_replaced: float) -> None:
+        self.dataset = Dataset.from_download_model(make_download_model(n_files))
+        n_replaced = max(1, int(n_files * fraction_replaced))
+        # Mimic the result of a download.
+        self.replacements = [
+            file.downloaded(local_path=Path("download", file.remote_path.posix))
+            for file in self.dataset.files[:n_replaced]
+        ]
+
+    def time_replace_files(self, n_files: int, fraction_replaced: float) -> None:
+        self.dataset.replace_files(*self.replacements)
+
+
+class AddFile:
+    params = N_FILES[:3]
+    param_names = ("n_files",)
+
+    def setup(self, n_files: int) -> None:
+        self.dataset = Dataset.from_download_model(make_download_model(n_files))
+        self.file = File.from_remote(
+            remote_path="new/file.nxs", size=1, creation_time="2025-01-01T00:00Z"
+        )
+
+    def time_replace_files_with_new_file(self, n_files: int) -> None:
+        self.dataset.replace_files(self.file)
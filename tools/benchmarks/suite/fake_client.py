@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for using FakeClient as an in-memory backend."""
+
+from scitacean import PID, model
+from scitacean.testing.client import FakeClient, FakeScicatClient
+
+from .common import make_dataset_json
+
+N_DATASETS = (1_000, 10_000)
+N_OWNER_GROUPS = 100
+
+
+def _make_upload_model(i: int) -> model.UploadDataset:
+    fields = make_dataset_json(i)
+    for key in ("pid", "createdBy", "createdAt", "updatedBy", "updatedAt"):
+        del fields[key]
+    fields["ownerGroup"] = f"group-{i % N_OWNER_GROUPS}"
+    return model.UploadDataset.model_validate(fields)
+
+
+class CreateDatasets:
+    params = N_DATASETS
+    param_names = ("n_datasets",)
+
+    def setup(self, n_datasets: int) -> None:
+        self.upload_models = [_make_upload_model(i) for i in range(n_datasets)]
+
+    def time_create_datasets(self, n_datasets: int) -> None:
+        scicat = FakeClient.without_login(url="").scicat
+        for upload_model in self.upload_models:
+            scicat.create_dataset_model(upload_model)
+
+
+class GetAndQueryDatasets:
+    params = N_DATASETS
+    param_names = ("n_datasets",)
+
+    def setup(self, n_datasets: int) -> None:
+        self.scicat = FakeClient.without_login(url="").scicat
+        self.pids: list[PID] = [
+            self.scicat.create_dataset_model(_make_upload_model(i)).pid  # type: ignore[misc]
+            for i in range(n_datasets)
+        ]
+
+    def time_get_datasets(self, n_datasets: int) -> None:
+        for pid in self.pids:
+            self.scicat.get_dataset_model(pid)
+
+    def time_query_by_owner_group(self, n_datasets: int) -> None:
+        if "query_datasets" not in FakeScicatClient.__dict__:
+            raise NotImplementedError("FakeClient does not support queries")
+        for i in range(N_OWNER_GROUPS):
+            self.scicat.query_datasets({"ownerGroup": f"group-{i}"})
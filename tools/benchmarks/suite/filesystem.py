@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for checksums and remote paths."""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from scitacean import RemotePath
+from scitacean.filesystem import checksum_of_file
+
+KiB = 1024
+MiB = 1024 * KiB
+
+
+class ChecksumOfFile:
+    params = ((KiB, MiB, 64 * MiB, 512 * MiB), ("md5", "blake2b", "sha256"))
+    param_names = ("size", "algorithm")
+    timeout = 300
+
+    def setup(self, size: int, algorithm: str) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "file.dat"
+        chunk = os.urandom(min(size, MiB))
+        with self.path.open("wb") as f:
+            for _ in range(size // len(chunk)):
+                f.write(chunk)
+
+    def teardown(self, size: int, algorithm: str) -> None:
+        self._tmp.cleanup()
+
+    def time_checksum_of_file(self, size: int, algorithm: str) -> None:
+        checksum_of_file(self.path, algorithm=algorithm)
+
+    def track_throughput(self, size: int, algorithm: str) -> float:
+        # Single measurement, use time_checksum_of_file for robust statistics.
+        start = time.perf_counter()
+        checksum_of_file(self.path, algorithm=algorithm)
+        return size / MiB / (time.perf_counter() - start)
+
+    track_throughput.unit = "MiB/s"  # type: ignore[attr-defined]
+
+
+class RemotePathOperations:
+    def setup(self) -> None:
+        self.paths = [
+            RemotePath(f"/hex/data/scan_{i // 1000:04d}/frame_{i:07d}.nxs")
+            for i in range(10_000)
+        ]
+        self.strings = [p.posix for p in self.paths]
+        self.target = self.paths[5000]
+
+    def time_construct(self) -> None:
+        for s in self.strings:
+            RemotePath(s)
+
+    def time_join(self) -> None:
+        for p in self.paths:
+            p / "sub" / "file.nxs"
+
+    def time_parent(self) -> None:
+        for p in self.paths:
+            _ = p.parent
+
+    def time_name_and_suffix(self) -> None:
+        for p in self.paths:
+            _ = p.name
+            _ = p.suffix
+
+    def time_eq(self) -> None:
+        target = self.target
+        for p in self.paths:
+            _ = p == target
+
+    def time_hash(self) -> None:
+        set(self.paths)
+
+    def time_truncated(self) -> None:
+        for p in self.paths:
+            p.truncated(32)
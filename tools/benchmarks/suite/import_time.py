@@ -0,0 +1,15 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for importing scitacean in a fresh interpreter."""
+
+
+def timeraw_import_scitacean() -> str:
+    return "import scitacean"
+
+
+def timeraw_import_client() -> str:
+    return "from scitacean import Client"
+
+
+def timeraw_import_dataset() -> str:
+    return "from scitacean import Dataset"
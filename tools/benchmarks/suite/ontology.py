@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for looking up techniques."""
+
+import functools
+
+from scitacean import ontology
+
+LABEL = "small angle neutron scattering"
+IRI = "http://purl.org/pan-science/PaNET/PaNET01189"
+
+
+def _clear_caches() -> None:
+    # Only clear caches that exist in the benchmarked version.
+    for name in dir(ontology):
+        attr = getattr(ontology, name)
+        if isinstance(attr, functools._lru_cache_wrapper):
+            attr.cache_clear()
+
+
+class FindTechnique:
+    def setup(self) -> None:
+        # Load the ontology outside of the measurement.
+        ontology.find_technique(LABEL)
+
+    def time_find_technique_by_label(self) -> None:
+        ontology.find_technique(LABEL)
+
+    def time_find_technique_by_iri(self) -> None:
+        ontology.find_technique(IRI)
+
+
+class LoadOntology:
+    # Every sample needs to load the ontology from scratch.
+    number = 1
+    repeat = 20
+
+    def setup(self) -> None:
+        _clear_caches()
+
+    def time_first_find_technique(self) -> None:
+        ontology.find_technique(LABEL)
+
+
+class SearchTechniques:
+    def setup(self) -> None:
+        ontology.search_techniques(LABEL)
+
+    def time_search_techniques_prefix(self) -> None:
+        ontology.search_techniques("small angle")
+
+    def time_search_techniques_typo(self) -> None:
+        ontology.search_techniques("smal angel neutorn scatering")
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
+"""Benchmarks for file transfers.
+
+The SFTP benchmarks need the SFTP test server.
+Start it with
+
+.. code-block:: python
+
+    from scitacean.testing import sftp
+    sftp.configure("sftp-server")
+
+and then ``docker compose -f sftp-server/docker-compose.yaml up -d``.
+The benchmarks are skipped if the server is not reachable.
+"""
+
+import itertools
+import os
+import tempfile
+from pathlib import Path
+
+from scitacean import Dataset, File, RemotePath
+from scitacean.transfer.copy import CopyFileTransfer
+
+KiB = 1024
+MiB = 1024 * KiB
+
+
+def _write_files(directory: Path, n_files: int, file_size: int) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    content = os.urandom(file_size)
+    paths = [directory / f"file_{i:05d}.dat" for i in range(n_files)]
+    for path in paths:
+        path.write_bytes(content)
+    return paths
+
+
+class _TransferBenchmark:
+    params = ((1, 100, 1000), (4 * KiB, MiB))
+    param_names = ("n_files", "file_size")
+    timeout = 300
+    # Uploads refuse to overwrite files, so every call needs a new target
+    # which is prepared by setup.
+    number = 1
+    warmup_time = 0.0
+
+
+class CopyTransfer(_TransferBenchmark):
+    def setup(self, n_files: int, file_size: int) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        self.local_paths = _write_files(self.base / "local", n_files, file_size)
+        self.files = [File.from_local(path) for path in self.local_paths]
+        self.remote = [RemotePath.from_local(path) for path in self.local_paths]
+        self.transfer = CopyFileTransfer()
+        self._counter = itertools.count()
+
+    def teardown(self, n_files: int, file_size: int) -> None:
+        self._tmp.cleanup()
+
+    def time_upload(self, n_files: int, file_size: int) -> None:
+        dataset = Dataset(
+            type="raw",
+            source_folder=RemotePath.from_local(
+                self.base / f"remote-{next(self._counter)}"
+            ),
+        )
+        with self.transfer.connect_for_upload(dataset, self.remote[0]) as con:
+            con.upload_files(*self.files)
+
+    def time_download(self, n_files: int, file_size: int) -> None:
+        target = self.base / f"download-{next(self._counter)}"
+        target.mkdir()
+        dataset = Dataset(type="raw", source_folder=self.remote[0].parent)
+        with self.transfer.connect_for_download(dataset, self.remote[0]) as con:
+            con.download_files(
+                remote=self.remote,
+                local=[target / path.name for path in self.local_paths],
+            )
+
+
+class SFTPTransfer(_TransferBenchmark):
+    def setup(self, n_files: int, file_size: int) -> None:
+        try:
+            from scitacean.testing.sftp import local_access
+            from scitacean.transfer.sftp import SFTPFileTransfer
+        except ImportError:
+            raise NotImplementedError("paramiko is not installed") from None
+
+        # Teardown also runs when setup skips the benchmark.
+        self._uploaded: list[tuple[RemotePath, list[File]]] = []
+        access = local_access()
+        self.transfer = SFTPFileTransfer(
+            host=access.host,
+            port=int(access.port),
+            username=access.user.username,
+            password=access.user.password,
+        )
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        self.local_paths = _write_files(self.base / "local", n_files, file_size)
+        self.files = [File.from_local(path) for path in self.local_paths]
+        # Upload once to have files to download.
+        self.source_folder = RemotePath(f"/data/bench-{os.getpid()}")
+        dataset = Dataset(type="raw", source_folder=self.source_folder / "download")
+        try:
+            with self.transfer.connect_for_upload(
+                dataset, self.files[0].remote_path
+            ) as con:
+                self.download_source = con.upload_files(*self.files)
+        except Exception as exc:
+            raise NotImplementedError(f"SFTP server is not reachable: {exc}") from None
+        self._uploaded.append((self.source_folder / "download", self.download_source))
+        self._counter = itertools.count()
+
+    def teardown(self, n_files: int, file_size: int) -> None:
+        for folder, files in self._uploaded:
+            dataset = Dataset(type="raw", source_folder=folder)
+            with self.transfer.connect_for_upload(dataset, files[0].remote_path) as con:
+                con.revert_upload(*files)
+        self._tmp.cleanup()
+
+    def time_upload(self, n_files: int, file_size: int) -> None:
+        folder = self.source_folder / f"upload-{next(self._counter)}"
+        dataset = Dataset(type="raw", source_folder=folder)
+        with self.transfer.connect_for_upload(
+            dataset, self.files[0].remote_path
+        ) as con:
+            self._uploaded.append((folder, con.upload_files(*self.files)))
+
+    def time_download(self, n_files: int, file_size: int) -> None:
+        target = self.base / f"download-{next(self._counter)}"
+        target.mkdir()
+        dataset = Dataset(type="raw", source_folder=self.source_folder / "download")
+        with self.transfer.connect_for_download(
+            dataset, self.download_source[0].remote_path
+        ) as con:
+            con.download_files(
+                remote=[
+                    self.source_folder / "download" / file.remote_path
+                    for file in self.download_source
+                ],
+                local=[target / path.name for path in self.local_paths],
+            )
@@ -2,25 +2,34 @@
 # Copyright (c) 2025 SciCat Project (https://github.com/SciCatProject/scitacean)
 """Download and parse the ExPaNDS experimental techniques ontology.
 
-This script extracts a mapping from ids (IRI) to class labels from the ontology.
+This script extracts a mapping from ids (IRI) to class labels from the ontology
+and a reverse index from labels to ids.
 The resulting dict has this structure:
 
 .. code-block:: python
 
     {
-      id: [main-label, alternative-label, ...]
+      "version": 1,
+      "techniques": {
+        id: [main-label, alternative-label, ...]
+      },
+      "labels": {
+        label: [id, ...]
+      }
     }
 
 Labels are converted to lowercase and stripped of leading and trailing whitespace.
+The ids in ``"labels"`` are in the same order as in ``"techniques"``.
 
-The results are saved to a given file as a bz2 compressed JSON file.
-The bz2 format was chosen as it yielded the smallest file among the
-algorithms available in the standard library.
+The results are saved to a given file as an uncompressed JSON file.
+Decompressing, e.g., bz2 took longer than parsing the JSON itself.
+marshal and pickle load slightly faster but their formats are tied to Python
+and loading pickles from files is a security risk.
+Use ``tools/benchmarks/ontology.py`` to compare load times.
 """
 # ruff: noqa: T201
 
 import argparse
-import bz2
 import json
 from pathlib import Path
 from typing import Any, TypeAlias
@@ -103,12 +112,26 @@ def parse_to_dict(ontology: Ontology) -> dict[str, list[str]]:
     }
 
 
+def build_label_index(mapping: dict[str, list[str]]) -> dict[str, list[str]]:
+    index: dict[str, dict[str, None]] = {}
+    for iri, labels in mapping.items():
+        for label in labels:
+            index.setdefault(label, {})[iri] = None
+    return {label: list(iris) for label, iris in index.items()}
+
+
 def write_result(mapping: dict[str, list[str]], out: Path) -> None:
-    serialized = json.dumps(mapping).encode("utf-8")
-    # replace all suffixes with `.json.bz2`
-    path = out.parent.joinpath(out.name.split(".", 1)[0] + ".json.bz2")
-    with bz2.open(path, "wb") as f:
-        f.write(serialized)
+    serialized = json.dumps(
+        {
+            "version": 1,
+            "techniques": mapping,
+            "labels": build_label_index(mapping),
+        },
+        separators=(",", ":"),
+    )
+    # replace all suffixes with `.json`
+    path = out.parent.joinpath(out.name.split(".", 1)[0] + ".json")
+    path.write_text(serialized, encoding="utf-8")
 
 
 def main() -> None: